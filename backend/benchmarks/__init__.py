@@ -0,0 +1,65 @@
+"""
+Performance benchmarks for the expense API.
+
+Run a module from the ``backend`` directory, e.g.::
+
+    python -m benchmarks.search --rows 1000000
+    python -m benchmarks.api --output results.json
+
+Most benchmarks seed synthetic data inside a transaction that is rolled
+back when they finish; ``benchmarks.api`` commits it to a database of its
+own (see ``scratch_database``). They still take locks and use a lot of
+I/O: point them at a scratch server, never at production.
+"""
+import os
+from contextlib import contextmanager
+
+
+def setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'expense_api.settings')
+    import django
+    django.setup()
+
+
+class Rollback(Exception):
+    """Raised to roll back a benchmark's transaction once it's done."""
+
+
+@contextmanager
+def scratch_database(keepdb=False):
+    """
+    Point the default connection at a new, migrated database for the
+    duration, named like the test database (``test_<NAME>``), and drop it
+    afterwards unless ``keepdb``.
+
+    Data written there is committed, so commit hooks, the category catalog
+    and the report batch threads run as they do when serving requests.
+    """
+    from django.db import connection
+
+    from expenses.parallel import get_query_executor
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, serialize=False, keepdb=keepdb
+    )
+    try:
+        yield connection.settings_dict['NAME']
+    finally:
+        # Its threads hold connections to the database
+        get_query_executor().shutdown()
+        connection.creation.destroy_test_db(
+            old_name, verbosity=0, keepdb=keepdb
+        )
+
+
+def isolate_caches(prefix='benchmark'):
+    """
+    Prefix every cache key, so benchmark users, whose IDs restart in the
+    scratch database, don't share cached reports or users with real ones
+    in a shared cache. Call before any cache is used.
+    """
+    from django.conf import settings
+
+    for config in settings.CACHES.values():
+        config['KEY_PREFIX'] = f'{prefix}:{config.get("KEY_PREFIX", "")}'
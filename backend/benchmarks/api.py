@@ -0,0 +1,348 @@
+"""
+API load scenarios over a synthetic dataset.
+
+Seeds ``--users`` x ``--categories`` x ``--years`` of expenses (see
+``benchmarks.data``) into a scratch database, then drives the API
+in-process, one request at a time, through the full middleware stack:
+
+- ``list_paging``: walk the expense list, page by page and by cursor
+- ``search``: filtered description search
+- ``summary``: summary reports over random multi-category filters, with
+  the report cache cleared so every request is computed
+- ``report_batch``: a summary, timeseries and forecast per batch request,
+  computed concurrently on the query executor's threads, uncached
+- ``create_burst``: bursts of single creates, then the same bursts
+  through the bulk endpoint
+
+Prints throughput and p50/p95/p99 latency per scenario; ``--output``
+saves them as JSON and ``--compare`` diffs against an earlier file.
+
+The data is committed to a database created for the run (``test_<NAME>``
+on the configured server) and dropped afterwards, so commit hooks, the
+category catalog and the batch threads run as in production. Requests
+carry real access tokens, authenticated the ``JWT_AUTH_USER`` way. Cache
+keys are prefixed to keep them apart from live ones.
+
+The numbers cover Django and the database in one process, without
+network, TLS, the ASGI server or concurrent clients: compare them
+between commits rather than reading them as capacity.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime, timedelta, timezone
+
+from . import isolate_caches, scratch_database, setup_django
+
+
+SCENARIOS = ('list_paging', 'search', 'summary', 'report_batch', 'create_burst')
+SEARCH_TERMS = (
+    'coffee', 'lunch', 'pharmacy', 'train ticket', 'rent', 'groceries',
+    'hotel', 'gift', 'zzz-no-match',
+)
+
+
+class Recorder:
+    """Latencies, plus the DB time and query count from Server-Timing."""
+
+    def __init__(self):
+        self.latencies = []
+        self.db_times = []
+        self.queries = []
+        self.started = None
+        self.elapsed = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed += time.perf_counter() - self.started
+
+    def request(self, send, expected_status=200):
+        start = time.perf_counter()
+        response = send()
+        self.latencies.append((time.perf_counter() - start) * 1000)
+        if response.status_code != expected_status:
+            raise RuntimeError(
+                f'{response.status_code} from {response.request["PATH_INFO"]}: '
+                f'{response.content[:200]!r}'
+            )
+        timing = parse_server_timing(response.get('Server-Timing', ''))
+        if 'db' in timing:
+            self.db_times.append(timing['db'][0])
+            self.queries.append(timing['db'][1])
+        return response
+
+    def summary(self):
+        return {
+            'requests': len(self.latencies),
+            'throughput_rps': round(len(self.latencies) / self.elapsed, 1),
+            **percentiles(self.latencies, 'ms'),
+            **percentiles(self.db_times, 'db_ms'),
+            'queries_mean': (
+                round(statistics.mean(self.queries), 2) if self.queries else None
+            ),
+        }
+
+
+def parse_server_timing(header):
+    """Return ``{name: (duration ms, query count or None)}``."""
+    timings = {}
+    for metric in filter(None, (part.strip() for part in header.split(','))):
+        name, *params = metric.split(';')
+        values = dict(param.split('=', 1) for param in params if '=' in param)
+        queries = values.get('desc', '').strip('"').split(' ')[0]
+        timings[name] = (
+            float(values.get('dur', 0)),
+            int(queries) if queries.isdigit() else None,
+        )
+    return timings
+
+
+def percentiles(samples, suffix):
+    if len(samples) < 2:
+        return {}
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return {
+        f'p50_{suffix}': round(cuts[49], 2),
+        f'p95_{suffix}': round(cuts[94], 2),
+        f'p99_{suffix}': round(cuts[98], 2),
+    }
+
+
+def list_paging(client, context, rng, requests):
+    recorder = Recorder()
+    with recorder:
+        while len(recorder.latencies) < requests:
+            # Page numbers (with COUNT and validators), first pages most often
+            page = min(int(rng.expovariate(0.5)) + 1, context['pages'])
+            recorder.request(lambda: client.get('/api/expenses/', {'page': page}))
+            # A few pages of cursor pagination
+            url, params = '/api/expenses/', {'pagination': 'cursor'}
+            for _ in range(3):
+                response = recorder.request(lambda: client.get(url, params))
+                url, params = response.data['next'], None
+                if not url:
+                    break
+    return recorder.summary()
+
+
+def search(client, context, rng, requests):
+    recorder = Recorder()
+    with recorder:
+        for _ in range(requests):
+            params = {'search': rng.choice(SEARCH_TERMS)}
+            if rng.random() < 0.5:
+                params['date_from'] = str(
+                    context['today'] - timedelta(days=rng.choice((30, 90, 365)))
+                )
+            if rng.random() < 0.3:
+                params['category'] = rng.choice(context['category_ids'])
+            recorder.request(lambda: client.get('/api/expenses/', params))
+    return recorder.summary()
+
+
+def summary(client, context, rng, requests):
+    from expenses.cache import get_report_cache
+
+    recorder = Recorder()
+    with recorder:
+        for _ in range(requests):
+            categories = rng.sample(
+                context['category_ids'],
+                rng.randint(1, min(5, len(context['category_ids'])))
+            )
+            days = rng.choice((7, 30, 90, 365, 365 * 3))
+            params = {
+                'category': ','.join(str(pk) for pk in categories),
+                'date_from': str(context['today'] - timedelta(days=days - 1)),
+                'date_to': str(context['today']),
+            }
+            get_report_cache().clear()
+            recorder.request(lambda: client.get('/api/reports/summary/', params))
+    return recorder.summary()
+
+
+def report_batch(client, context, rng, requests):
+    from expenses.cache import get_report_cache
+
+    recorder = Recorder()
+    with recorder:
+        for _ in range(requests):
+            days = rng.choice((30, 90, 365))
+            date_from = str(context['today'] - timedelta(days=days - 1))
+            category = str(rng.choice(context['category_ids']))
+            reports = [
+                {'type': 'summary', 'date_from': date_from},
+                {'type': 'summary', 'category': category, 'date_from': date_from},
+                {'type': 'timeseries', 'granularity': 'week', 'date_from': date_from},
+                {'type': 'forecast', 'horizon': 14},
+            ]
+            get_report_cache().clear()
+            recorder.request(lambda: client.post(
+                '/api/reports/batch/', {'reports': reports}, format='json'
+            ))
+    return recorder.summary()
+
+
+def create_burst(client, context, rng, requests, burst=25):
+    def item():
+        return {
+            'amount': f'{rng.lognormvariate(3, 0.8):.2f}',
+            'description': f'Burst {rng.choice(SEARCH_TERMS)}',
+            'category_id': rng.choice(context['category_ids']),
+            'date': str(context['today'] - timedelta(days=rng.randint(0, 30))),
+        }
+
+    single, bulk = Recorder(), Recorder()
+    bursts = max(requests // burst, 1)
+    with single:
+        for _ in range(bursts):
+            for _ in range(burst):
+                single.request(
+                    lambda: client.post('/api/expenses/', item(), format='json'),
+                    expected_status=201
+                )
+    with bulk:
+        for _ in range(bursts):
+            items = [item() for _ in range(burst)]
+            bulk.request(
+                lambda: client.post('/api/expenses/bulk/', items, format='json'),
+                expected_status=201
+            )
+    results = single.summary()
+    results['bulk'] = {**bulk.summary(), 'items_per_request': burst}
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def authenticate(client, user):
+    """Send a fresh access token with every request, as a login issues."""
+    from expenses.authentication import ClaimsTokenObtainPairSerializer
+
+    token = ClaimsTokenObtainPairSerializer.get_token(user).access_token
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+
+def run(args):
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.utils import timezone as django_timezone
+    from rest_framework.test import APIClient
+
+    from . import data
+    from expenses.models import Expense
+
+    rng = random.Random(args.seed)
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'database': connection.vendor,
+        'auth_user': settings.JWT_AUTH_USER,
+        'parameters': {
+            name: getattr(args, name)
+            for name in ('users', 'categories', 'years', 'requests', 'seed')
+        },
+        'scenarios': {},
+    }
+    with scratch_database(keepdb=args.keepdb) as name:
+        print(f'Using scratch database {name}')
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SHOW server_version')
+                report['database'] += ' ' + cursor.fetchone()[0]
+
+        started = time.perf_counter()
+        user_ids, category_ids, rows = data.seed(
+            args.users, args.categories, args.years, args.seed
+        )
+        report['rows'] = rows
+        print(f'Seeded {rows} expenses in {time.perf_counter() - started:.1f}s')
+
+        user = User.objects.get(pk=user_ids[0])
+        client = APIClient(SERVER_NAME=settings.ALLOWED_HOSTS[0])
+        count = Expense.objects.filter(user=user).count()
+        context = {
+            'category_ids': list(category_ids.values()),
+            'pages': max(-(-count // settings.REST_FRAMEWORK['PAGE_SIZE']), 1),
+            'today': django_timezone.localdate(),
+        }
+        for name in args.scenarios:
+            scenario = globals()[name]
+            # A token per scenario, so none expires mid-run
+            authenticate(client, user)
+            # Warm up, then measure
+            scenario(client, context, random.Random(args.seed), 5)
+            report['scenarios'][name] = scenario(
+                client, context, rng, args.requests
+            )
+            print(f'{name}: {report["scenarios"][name]}')
+    return report
+
+
+def compare(report, baseline):
+    """Print p50/p95/throughput changes against an earlier report."""
+    print(f'\nAgainst {baseline.get("commit")} ({baseline.get("timestamp")}):')
+    for name, results in report['scenarios'].items():
+        before = baseline.get('scenarios', {}).get(name)
+        if not before:
+            continue
+        changes = []
+        for key in ('p50_ms', 'p95_ms', 'throughput_rps'):
+            if before.get(key) and key in results:
+                change = (results[key] - before[key]) / before[key] * 100
+                changes.append(
+                    f'{key} {before[key]} -> {results[key]} ({change:+.1f}%)'
+                )
+        print(f'  {name}: ' + ', '.join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--categories', type=int, default=14)
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--scenario', dest='scenarios', action='append', choices=SCENARIOS
+    )
+    parser.add_argument(
+        '--keepdb', action='store_true',
+        help='keep the scratch database (and reuse one left by a previous run)'
+    )
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='JSON results of an earlier run')
+    args = parser.parse_args()
+    args.scenarios = args.scenarios or list(SCENARIOS)
+
+    setup_django()
+    isolate_caches()
+    report = run(args)
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+        print(f'Results written to {args.output}')
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(report, json.load(baseline))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Per-request latency with and without database connection reuse.
+
+Sends ``--requests`` category list requests in-process for each mode:
+
+- ``no_reuse``: ``CONN_MAX_AGE = 0``, a new connection per request
+- ``persistent``: ``CONN_MAX_AGE`` with health checks, one per thread
+- ``pool``: a psycopg 3 pool (``OPTIONS['pool']``)
+
+Point it at the deployment's database host (the usual ``DATABASES``
+environment variables) to see the handshake cost that reuse saves; it
+only reads, so no data is written.
+"""
+import argparse
+import statistics
+import time
+
+from . import setup_django
+
+
+MODES = {
+    'no_reuse': {'CONN_MAX_AGE': 0},
+    'persistent': {'CONN_MAX_AGE': 600},
+    'pool': {
+        'CONN_MAX_AGE': 0,
+        'OPTIONS': {'pool': {'min_size': 1, 'max_size': 4}},
+    },
+}
+
+
+def use_database(overrides):
+    """Replace this thread's default connection with a reconfigured one."""
+    from django.db import connections
+    from django.db.utils import load_backend
+
+    connections['default'].close()
+    settings_dict = dict(connections.settings['default'])
+    options = dict(settings_dict['OPTIONS'])
+    options.pop('pool', None)
+    options.update(overrides.get('OPTIONS', {}))
+    settings_dict.update(overrides, OPTIONS=options, CONN_HEALTH_CHECKS=True)
+    backend = load_backend(settings_dict['ENGINE'])
+    connection = backend.DatabaseWrapper(settings_dict, 'default')
+    connections['default'] = connection
+    return connection
+
+
+def time_requests(requests):
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from rest_framework.test import APIClient
+
+    client = APIClient(SERVER_NAME=settings.ALLOWED_HOSTS[0])
+    # Unsaved user: authentication must not query the database
+    client.force_authenticate(user=User(pk=0, username='benchmark'))
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get('/api/categories/')
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.content
+    return timings
+
+
+def run(modes, requests):
+    from django.db import connections
+
+    results = {}
+    for mode in modes:
+        connection = use_database(MODES[mode])
+        # Warm up: imports, first connection, pool start-up
+        time_requests(3)
+        timings = time_requests(requests)
+        cuts = statistics.quantiles(timings, n=100, method='inclusive')
+        results[mode] = {
+            'p50_ms': cuts[49],
+            'p95_ms': cuts[94],
+            'mean_ms': statistics.mean(timings),
+        }
+        connection.close()
+        if mode == 'pool':
+            connection.close_pool()
+    connections['default'].close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument(
+        '--mode', dest='modes', action='append', choices=list(MODES)
+    )
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args.modes or list(MODES), args.requests)
+
+    print(f'{"mode":<12}{"p50 ms":>10}{"p95 ms":>10}{"mean ms":>10}')
+    for mode, timings in results.items():
+        print(
+            f'{mode:<12}{timings["p50_ms"]:>10.2f}'
+            f'{timings["p95_ms"]:>10.2f}{timings["mean_ms"]:>10.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
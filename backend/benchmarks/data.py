@@ -0,0 +1,161 @@
+"""
+Synthetic expense data for the benchmarks.
+
+Every user gets ``years`` of history. Each category has its own spending
+pattern: a daily purchase rate (weekends weighted separately), a
+log-normal amount distribution, or a fixed day of the month for bills.
+Users differ in how active they are. The same ``seed`` always generates
+the same rows.
+"""
+import math
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+
+# name, purchases per weekday, per weekend day, median amount, sigma
+CATEGORIES = (
+    ('Groceries', 0.45, 0.8, 38.0, 0.6),
+    ('Dining', 0.25, 0.6, 24.0, 0.5),
+    ('Coffee', 0.7, 0.3, 4.2, 0.25),
+    ('Transport', 0.8, 0.2, 3.5, 0.4),
+    ('Fuel', 0.12, 0.1, 55.0, 0.3),
+    ('Shopping', 0.1, 0.35, 45.0, 0.9),
+    ('Entertainment', 0.05, 0.3, 30.0, 0.7),
+    ('Health', 0.04, 0.02, 25.0, 0.8),
+    ('Travel', 0.01, 0.03, 240.0, 0.9),
+    ('Gifts', 0.02, 0.04, 35.0, 0.7),
+)
+# name, day of month, amount: paid once a month
+BILLS = (
+    ('Rent', 1, 1150.0),
+    ('Utilities', 12, 95.0),
+    ('Phone', 20, 30.0),
+    ('Subscriptions', 5, 17.99),
+)
+DESCRIPTIONS = {
+    'Groceries': ('supermarket', 'farmers market', 'bakery', 'butcher'),
+    'Dining': ('lunch', 'dinner', 'takeaway pizza', 'sushi', 'brunch'),
+    'Coffee': ('coffee', 'espresso', 'latte'),
+    'Transport': ('bus ticket', 'metro', 'taxi', 'train ticket'),
+    'Fuel': ('fuel', 'petrol station'),
+    'Shopping': ('clothes', 'shoes', 'electronics', 'books', 'home decor'),
+    'Entertainment': ('cinema', 'concert', 'museum', 'games'),
+    'Health': ('pharmacy', 'dentist', 'gym'),
+    'Travel': ('hotel', 'flight', 'car rental'),
+    'Gifts': ('flowers', 'birthday gift', 'donation'),
+}
+
+
+def category_names(count):
+    """The first ``count`` category names: bills, then the daily ones."""
+    names = [bill[0] for bill in BILLS] + [category[0] for category in CATEGORIES]
+    names += [f'Category {index}' for index in range(len(names), count)]
+    return names[:count]
+
+
+def _poisson(rng, rate):
+    # Knuth's method; the rates here are small
+    limit, count, product = math.exp(-rate), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def generate_expenses(user_ids, categories, start, end, seed=0):
+    """
+    Yield ``(user_id, category_id, date, amount, description)`` tuples.
+
+    ``categories`` maps category names (from ``category_names``) to ids;
+    names without a built-in pattern get a generic daily one.
+    """
+    rng = random.Random(seed)
+    patterns = {category[0]: category[1:] for category in CATEGORIES}
+    bills = {bill[0]: bill[1:] for bill in BILLS}
+    days = (end - start).days + 1
+    serial = 0
+    for user_id in user_ids:
+        activity = rng.lognormvariate(0, 0.35)
+        for name, category_id in categories.items():
+            if name in bills:
+                day_of_month, amount = bills[name]
+                amount = Decimal(f'{amount * rng.uniform(0.8, 1.2):.2f}')
+                for offset in range(days):
+                    day = start + timedelta(days=offset)
+                    if day.day == day_of_month:
+                        yield (
+                            user_id, category_id, day, amount, f'{name} {day:%B}'
+                        )
+                continue
+
+            weekday_rate, weekend_rate, median, sigma = patterns.get(
+                name, (0.05, 0.05, 20.0, 0.7)
+            )
+            words = DESCRIPTIONS.get(name, (name.lower(),))
+            mu = math.log(median)
+            for offset in range(days):
+                day = start + timedelta(days=offset)
+                rate = weekend_rate if day.weekday() >= 5 else weekday_rate
+                for _ in range(_poisson(rng, rate * activity)):
+                    serial += 1
+                    amount = max(rng.lognormvariate(mu, sigma), 0.01)
+                    yield (
+                        user_id,
+                        category_id,
+                        day,
+                        Decimal(f'{amount:.2f}'),
+                        f'{rng.choice(words)} #{serial}',
+                    )
+
+
+def seed(users, categories, years, seed=0, batch_size=5000):
+    """
+    Create benchmark users, categories and expenses ending today.
+
+    Rows are bulk inserted, then rollups are rebuilt and the tables
+    analyzed. Returns ``(user_ids, category ids by name, expense count)``.
+    """
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.utils import timezone
+
+    from expenses.models import Expense, ExpenseCategory
+    from expenses.rollups import rebuild_rollups
+
+    user_ids = [
+        User.objects.create_user(username=f'benchmark-{index}').pk
+        for index in range(users)
+    ]
+    category_ids = {
+        name: ExpenseCategory.objects.create(name=f'Benchmark {name}').pk
+        for name in category_names(categories)
+    }
+    end = timezone.localdate()
+    start = end - timedelta(days=round(365.25 * years) - 1)
+
+    batch, count = [], 0
+    for user_id, category_id, day, amount, description in generate_expenses(
+        user_ids, category_ids, start, end, seed
+    ):
+        batch.append(Expense(
+            user_id=user_id,
+            category_id=category_id,
+            date=day,
+            amount=amount,
+            description=description
+        ))
+        if len(batch) >= batch_size:
+            Expense.objects.bulk_create(batch)
+            count += len(batch)
+            batch = []
+    Expense.objects.bulk_create(batch)
+    count += len(batch)
+
+    # bulk_create doesn't send the signals that maintain rollups
+    rebuild_rollups(user_ids=user_ids)
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE expenses_expense')
+            cursor.execute('ANALYZE expenses_expensedailyrollup')
+    return user_ids, category_ids, count
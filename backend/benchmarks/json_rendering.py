@@ -0,0 +1,129 @@
+"""
+JSON rendering and parsing: DRF's stdlib classes against the orjson ones.
+
+Renders an expense list page (``--page-size`` rows through
+``ExpenseListSerializer``, wrapped like a paginated response) and a
+summary report with ``--categories`` category totals, then parses a bulk
+create body. Everything is built in memory, so no database is needed.
+"""
+import argparse
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from . import setup_django
+
+
+def build_payloads(page_size, categories):
+    from rest_framework.utils.serializer_helpers import ReturnDict
+
+    from expenses.models import Expense, ExpenseCategory
+    from expenses.serializers import ExpenseListSerializer
+
+    names = [f'Category {index}' for index in range(categories)]
+    category_objects = [
+        ExpenseCategory(pk=index + 1, name=name)
+        for index, name in enumerate(names)
+    ]
+    created = datetime(2026, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    expenses = [
+        Expense(
+            pk=index + 1,
+            amount=Decimal(index * 7 % 20000) / 100,
+            description=f'Expense number {index} at the café',
+            category=category_objects[index % categories],
+            date=date(2026, 1, 1) - timedelta(days=index % 365),
+            created_at=created - timedelta(minutes=index)
+        )
+        for index in range(page_size)
+    ]
+    page = ReturnDict([
+        ('count', page_size * 20),
+        ('next', 'http://testserver/api/expenses/?page=2'),
+        ('previous', None),
+        ('results', ExpenseListSerializer(expenses, many=True).data),
+    ], serializer=None)
+
+    summary = {
+        'total_amount': 123456.78,
+        'total_count': page_size * 20,
+        'category_totals': [
+            {
+                'category__name': name,
+                'category__id': index + 1,
+                'total': Decimal(index * 12345 % 1000000) / 100,
+                'count': index * 3,
+            }
+            for index, name in enumerate(names)
+        ],
+        'average_daily': 42.5,
+        'filters': {
+            'category': '1,2,3',
+            'date_from': '2026-01-01',
+            'date_to': '2026-01-31',
+            'description': None,
+        },
+    }
+    return page, summary
+
+
+def time_call(function, repeat, number):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) * 1_000_000 / number)
+    return statistics.median(timings)
+
+
+def run(page_size, categories, repeat, number):
+    from io import BytesIO
+
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from expenses.parsers import FastJSONParser
+    from expenses.renderers import FastJSONRenderer, orjson
+
+    if orjson is None:
+        print('orjson is not installed; both columns use the stdlib')
+
+    page, summary = build_payloads(page_size, categories)
+    results = {}
+    for name, payload in (('list page', page), ('summary', summary)):
+        stock = JSONRenderer().render(payload)
+        fast = FastJSONRenderer().render(payload)
+        assert stock == fast, f'{name} output differs'
+        results[f'render {name}'] = (
+            time_call(lambda: JSONRenderer().render(payload), repeat, number),
+            time_call(lambda: FastJSONRenderer().render(payload), repeat, number),
+        )
+
+    body = JSONRenderer().render(page['results'])
+    results['parse list page'] = (
+        time_call(lambda: JSONParser().parse(BytesIO(body)), repeat, number),
+        time_call(lambda: FastJSONParser().parse(BytesIO(body)), repeat, number),
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--categories', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args.page_size, args.categories, args.repeat, args.number)
+
+    print(f'{"payload":<20}{"stdlib us":>12}{"orjson us":>12}{"speedup":>10}')
+    for name, (stock, fast) in results.items():
+        print(f'{name:<20}{stock:>12.1f}{fast:>12.1f}{stock / fast:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
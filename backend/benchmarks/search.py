@@ -0,0 +1,133 @@
+"""
+Expense description search with and without the trigram index.
+
+Seeds ``--rows`` synthetic expenses spread over ``--users`` users, then
+times the search endpoint's queries (first page plus COUNT) for one user,
+first with the ``pg_trgm`` index from migration 0004 and then with it
+dropped. Everything happens in one transaction that is rolled back.
+"""
+import argparse
+import statistics
+import time
+
+from . import Rollback, setup_django
+
+
+WORDS = (
+    'coffee', 'lunch', 'dinner', 'groceries', 'taxi', 'train', 'parking',
+    'fuel', 'rent', 'internet', 'phone', 'gym', 'cinema', 'books',
+    'pharmacy', 'flowers', 'hotel', 'flight', 'insurance', 'repair',
+)
+SEARCHES = ('coffee', 'ticket 4242', 'pharm', 'zzz-no-match', 'Benchmark 3')
+
+
+def seed(cursor, rows, users):
+    from django.contrib.auth.models import User
+    from expenses.models import ExpenseCategory
+
+    user_ids = [
+        User.objects.create_user(username=f'benchmark-{index}').pk
+        for index in range(users)
+    ]
+    category_ids = [
+        ExpenseCategory.objects.create(name=f'Benchmark {index}').pk
+        for index in range(8)
+    ]
+    words = '(ARRAY[' + ', '.join(f"'{word}'" for word in WORDS) + '])'
+    cursor.execute(
+        f"""
+        INSERT INTO expenses_expense
+            (user_id, amount, description, category_id, date,
+             created_at, updated_at)
+        SELECT
+            (%s::bigint[])[1 + g %% %s],
+            round((random() * 200)::numeric, 2),
+            {words}[1 + floor(random() * {len(WORDS)})::int] || ' '
+                || {words}[1 + floor(random() * {len(WORDS)})::int]
+                || ' ticket ' || g,
+            (%s::bigint[])[1 + floor(random() * %s)::int],
+            current_date - floor(random() * 730)::int,
+            now(), now()
+        FROM generate_series(1, %s) AS g
+        """,
+        [user_ids, users, category_ids, len(category_ids), rows]
+    )
+    cursor.execute('ANALYZE expenses_expense')
+    return user_ids[0]
+
+
+def time_search(user_id, term, repeat):
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from expenses.filters import ExpenseSearchFilter
+    from expenses.models import Expense
+
+    request = Request(APIRequestFactory().get('/', {'search': term}))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        queryset = ExpenseSearchFilter().filter_queryset(
+            request, Expense.objects.filter(user_id=user_id), None
+        )
+        queryset.count()
+        list(queryset[:50])
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(rows, users, repeat):
+    from django.db import connection, transaction
+
+    index_name = 'expenses_expense_description_trgm'
+    results = {}
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            started = time.perf_counter()
+            user_id = seed(cursor, rows, users)
+            print(f'Seeded {rows} rows in {time.perf_counter() - started:.1f}s')
+
+            cursor.execute(
+                'SELECT 1 FROM pg_indexes WHERE indexname = %s', [index_name]
+            )
+            if cursor.fetchone():
+                for term in SEARCHES:
+                    results.setdefault(term, {})['trigram'] = time_search(
+                        user_id, term, repeat
+                    )
+                cursor.execute(f'DROP INDEX {index_name}')
+            else:
+                print(f'{index_name} does not exist; timing the baseline only')
+
+            for term in SEARCHES:
+                results.setdefault(term, {})['no_index'] = time_search(
+                    user_id, term, repeat
+                )
+            raise Rollback
+    except Rollback:
+        pass
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args.rows, args.users, args.repeat)
+
+    print(f'{"search":<16}{"trigram ms":>12}{"no index ms":>14}')
+    for term, timings in results.items():
+        trigram = timings.get('trigram')
+        print(
+            f'{term:<16}'
+            f'{trigram if trigram is None else round(trigram, 1)!s:>12}'
+            f'{round(timings["no_index"], 1):>14}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+"""
+ASGI config for expense_api project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'expense_api.settings')
+# Sync code runs in threads that come and go with the requests, so
+# persistent connections would pile up, one per thread; use DB_POOL_SIZE
+# to reuse connections here.
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+
+application = get_asgi_application()
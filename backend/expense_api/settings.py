@@ -4,6 +4,7 @@ Django settings for expense_api project.
 import os
 from pathlib import Path
 from datetime import timedelta
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -26,6 +27,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover the rest of the stack
+    'expenses.metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -34,6 +37,7 @@ MIDDLEWARE = [
 ROOT_URLCONF = 'expense_api.urls'
 
 WSGI_APPLICATION = 'expense_api.wsgi.application'
+ASGI_APPLICATION = 'expense_api.asgi.application'
 
 db_host = os.getenv('NEON_POSTGRES_HOST', 'db')
 db_options = {}
@@ -45,6 +49,28 @@ if db_host.endswith('.supabase.co'):
         'sslrootcert': os.getenv('POSTGRES_SSLROOTCERT', ''),
     }
 
+# Connection reuse. With DB_POOL_SIZE set, each worker process keeps a
+# psycopg 3 pool of up to that many connections; otherwise every thread
+# keeps its own connection open for DB_CONN_MAX_AGE seconds (0 reconnects
+# on every request). Either way requests skip the TCP/TLS/auth handshake,
+# which dominates latency against a remote host. CONN_HEALTH_CHECKS
+# makes Django (or the pool) replace connections the server has dropped.
+# Under ASGI each request's sync code runs in a thread of its own, which
+# would keep one more connection open per request: asgi.py defaults
+# DB_CONN_MAX_AGE to 0 there, and only the pool reuses connections.
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '0'))
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', '60'))
+
+if DB_POOL_SIZE > 0:
+    db_options['pool'] = {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '1')),
+        'max_size': DB_POOL_SIZE,
+        # Seconds to wait for a free connection before failing the request
+        'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+        # Close connections idle for longer, before the server does
+        'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+    }
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -54,9 +80,83 @@ DATABASES = {
         'HOST': db_host,
         'PORT': os.getenv('DB_PORT', '5432'),
         'OPTIONS': db_options,
+        # The pool does the reusing; Django refuses persistent connections too
+        'CONN_MAX_AGE': 0 if DB_POOL_SIZE > 0 else DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+# Shared cache (optional). Without REDIS_URL each worker keeps its own
+# in-memory caches and only sees invalidations for writes it handled
+# itself, so set it whenever more than one worker process serves the API.
+REDIS_URL = os.getenv('REDIS_URL', '')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
     }
+
+# Report result cache: 'locmem' (per-process LRU) or 'django' (CACHES above)
+REPORT_CACHE = {
+    'BACKEND': os.getenv(
+        'REPORT_CACHE_BACKEND', 'django' if REDIS_URL else 'locmem'
+    ),
+    'MAX_ENTRIES': int(os.getenv('REPORT_CACHE_MAX_ENTRIES', '1024')),
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': int(os.getenv('REPORT_CACHE_TIMEOUT', str(60 * 60 * 24))),
+}
+
+# uvicorn (and gunicorn) worker processes. Report versions and ETags, the
+# report cache and the category catalog must be shared between them, so more
+# than one worker requires REDIS_URL and the 'django' report cache backend.
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', '1'))
+if WEB_CONCURRENCY > 1 and (
+    not REDIS_URL or REPORT_CACHE['BACKEND'] == 'locmem'
+):
+    raise ImproperlyConfigured(
+        f'WEB_CONCURRENCY={WEB_CONCURRENCY} needs a cache shared by the '
+        'worker processes: set REDIS_URL and leave REPORT_CACHE_BACKEND '
+        'unset (or "django"), or run a single worker.'
+    )
+
+# Process-wide copy of the category table, reloaded whenever a category is
+# written and at least every MAX_AGE seconds. Only used with REDIS_URL, as a
+# per-process cache can't carry other processes' writes.
+CATEGORY_CATALOG = {
+    'CACHE_ALIAS': 'default',
+    'MAX_AGE': int(os.getenv('CATEGORY_CATALOG_MAX_AGE', '300')),
+}
+
+# Threads (each with its own database connection) per worker process that
+# compute the reports of a /api/reports/batch/ request concurrently.
+REPORT_BATCH = {
+    'WORKERS': int(os.getenv('REPORT_BATCH_WORKERS', '4')),
 }
 
+# Per-view latency, SQL query and response size metrics, served at
+# /api/metrics/ (staff only) and summarized in a Server-Timing header.
+# Queries slower than SLOW_QUERY_MS are logged to `expenses.metrics`.
+REQUEST_METRICS = {
+    'ENABLED': os.getenv('REQUEST_METRICS', 'True').lower() == 'true',
+    'SERVER_TIMING': os.getenv('SERVER_TIMING', 'True').lower() == 'true',
+    'SLOW_QUERY_MS': float(os.getenv('SLOW_QUERY_MS', '200')),
+}
+
+# Deleted-expense tombstones older than this are purged; sync tokens older
+# than this get 410 Gone and the client must do a full sync.
+EXPENSE_TOMBSTONE_RETENTION_DAYS = int(
+    os.getenv('EXPENSE_TOMBSTONE_RETENTION_DAYS', '90')
+)
+
+# Layout used by `manage.py partition_expenses` (optional, PostgreSQL only):
+# 'year' or 'month' partitions on expense date, kept this many intervals
+# ahead by `manage.py create_expense_partitions`.
+EXPENSE_PARTITION_INTERVAL = os.getenv('EXPENSE_PARTITION_INTERVAL', 'year')
+EXPENSE_PARTITIONS_AHEAD = int(os.getenv('EXPENSE_PARTITIONS_AHEAD', '1'))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -82,15 +182,41 @@ USE_TZ = True
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# How JWT authentication gets the token's user: 'database' loads it on every
+# request, 'cache' reuses it for JWT_USER_CACHE['TIMEOUT'] seconds (dropped
+# when the user is saved), 'stateless' builds it from the token's claims
+# without any query (deactivated users keep access until their token expires).
+JWT_AUTH_USER = os.getenv('JWT_AUTH_USER', 'database')
+JWT_AUTHENTICATION_CLASSES = {
+    'database': 'rest_framework_simplejwt.authentication.JWTAuthentication',
+    'cache': 'expenses.authentication.CachedJWTAuthentication',
+    'stateless': 'expenses.authentication.StatelessJWTAuthentication',
+}
+
+JWT_USER_CACHE = {
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': int(os.getenv('JWT_USER_CACHE_TIMEOUT', '60')),
+}
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        JWT_AUTHENTICATION_CLASSES[JWT_AUTH_USER],
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'expenses.pagination.AsyncPageNumberPagination',
     'PAGE_SIZE': 50,
+    # orjson-backed when installed; same output as the stock JSON classes
+    'DEFAULT_RENDERER_CLASSES': (
+        'expenses.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'expenses.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
 }
 
 SIMPLE_JWT = {
@@ -102,6 +228,10 @@ SIMPLE_JWT = {
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    # Adds the claims stateless authentication reads
+    'TOKEN_OBTAIN_SERIALIZER': (
+        'expenses.authentication.ClaimsTokenObtainPairSerializer'
+    ),
 }
 
 CORS_ALLOWED_ORIGINS = [
@@ -0,0 +1,129 @@
+from functools import update_wrapper
+
+from asgiref.sync import sync_to_async
+from rest_framework import exceptions
+from rest_framework.request import ForcedAuthentication
+from rest_framework.response import Response
+
+
+async def aauthenticate(request):
+    """
+    Authenticate a DRF request like ``Request.user`` would, without blocking.
+
+    Authenticators may query the database (JWT loads the token's user), so
+    they run through ``sync_to_async``; credentials forced by the test
+    client are used directly.
+    """
+    for authenticator in request.authenticators:
+        try:
+            if isinstance(authenticator, ForcedAuthentication):
+                user_auth_tuple = authenticator.authenticate(request)
+            else:
+                user_auth_tuple = await sync_to_async(
+                    authenticator.authenticate
+                )(request)
+        except exceptions.APIException:
+            request._not_authenticated()
+            raise
+
+        if user_auth_tuple is not None:
+            request._authenticator = authenticator
+            request.user, request.auth = user_auth_tuple
+            return
+
+    request._not_authenticated()
+
+
+class AsyncViewSetMixin:
+    """
+    Serve some viewset actions as coroutines, on Django's async ORM.
+
+    Each action named in ``async_actions`` is implemented by an ``a``-prefixed
+    coroutine method (``list`` by ``alist``). Authentication, permissions,
+    content negotiation, exception handling and rendering are the viewset's
+    own, so responses match the sync actions. Other actions of the same
+    route keep running the sync view, in a thread when served over ASGI.
+    """
+    async_actions = ()
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        if not set(actions.values()) & set(cls.async_actions):
+            return view
+        sync_view = sync_to_async(view)
+
+        async def async_view(request, *args, **kwargs):
+            method = request.method.lower()
+            if method == 'head' and 'head' not in actions:
+                method = 'get'
+            if actions.get(method) not in cls.async_actions:
+                return await sync_view(request, *args, **kwargs)
+
+            # As in ViewSetMixin.as_view
+            self = cls(**initkwargs)
+            self.action_map = dict(actions)
+            if 'get' in actions and 'head' not in actions:
+                self.action_map['head'] = actions['get']
+            for http_method, action in self.action_map.items():
+                setattr(self, http_method, getattr(self, action))
+            self.request = request
+            self.args = args
+            self.kwargs = kwargs
+            return await self.adispatch(request, *args, **kwargs)
+
+        # Keeps cls, actions, initkwargs and csrf_exempt for the router
+        return update_wrapper(async_view, view)
+
+    async def adispatch(self, request, *args, **kwargs):
+        """Async ``dispatch`` for the actions in ``async_actions``."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await aauthenticate(request)
+            self.initial(request, *args, **kwargs)
+            handler = getattr(self, 'a' + self.action)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def afilter_queryset(self):
+        """
+        Async ``filter_queryset(get_queryset())``.
+
+        Filter backends may run lookups of their own (the expense search
+        resolves category names first), so they run in a thread.
+        """
+        return await sync_to_async(
+            lambda: self.filter_queryset(self.get_queryset())
+        )()
+
+    async def apaginate_queryset(self, queryset):
+        """Async ``paginate_queryset``, for paginators that support it."""
+        if self.paginator is None:
+            return None
+        if not hasattr(self.paginator, 'apaginate_queryset'):
+            return await sync_to_async(self.paginate_queryset)(queryset)
+        return await self.paginator.apaginate_queryset(
+            queryset, self.request, view=self
+        )
+
+    async def alist(self, request, *args, **kwargs):
+        """Async ``ListModelMixin.list``."""
+        queryset = await self.afilter_queryset()
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(
+            [instance async for instance in queryset], many=True
+        )
+        return Response(serializer.data)
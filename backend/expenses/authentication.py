@@ -0,0 +1,156 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+DEFAULT_JWT_USER_CACHE = {
+    'CACHE_ALIAS': 'default',
+    # Seconds a user loaded by CachedJWTAuthentication is reused for
+    'TIMEOUT': 60,
+}
+
+# User fields copied into tokens, for StatelessJWTAuthentication:
+# permissions read the flags, expense responses show the username
+TOKEN_USER_CLAIMS = ('username', 'is_staff', 'is_superuser')
+# Value given to each claim missing from older tokens
+TOKEN_USER_DEFAULTS = {'is_staff': False, 'is_superuser': False}
+
+
+def get_user_cache_settings():
+    return {
+        **DEFAULT_JWT_USER_CACHE,
+        **getattr(settings, 'JWT_USER_CACHE', {}),
+    }
+
+
+def user_cache_key(user_id):
+    return f'expenses:auth-user:{user_id}'
+
+
+def forget_cached_user(user_id):
+    """Drop a user cached by CachedJWTAuthentication."""
+    cache = caches[get_user_cache_settings()['CACHE_ALIAS']]
+    key = user_cache_key(user_id)
+    # Again after commit, so a copy cached before the write became visible
+    # isn't kept
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login serializer adding the ``TOKEN_USER_CLAIMS`` to the tokens."""
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        for claim in TOKEN_USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        return token
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication reusing the token's user for ``JWT_USER_CACHE``
+    seconds instead of loading it on every request.
+
+    Saving or deleting a user drops it from the cache, so deactivation,
+    password changes (with ``CHECK_REVOKE_TOKEN``) and staff changes apply
+    at once: in every process with a shared cache (``REDIS_URL``), and
+    within the timeout with the per-process one. The active and revoked
+    token checks still run on every request.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification')
+            ) from e
+
+        config = get_user_cache_settings()
+        cache = caches[config['CACHE_ALIAS']]
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            try:
+                user = self.user_model.objects.get(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except self.user_model.DoesNotExist as e:
+                raise AuthenticationFailed(
+                    _('User not found'), code='user_not_found'
+                ) from e
+            cache.set(key, user, config['TIMEOUT'])
+
+        # As in JWTAuthentication.get_user
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."),
+                code='password_changed'
+            )
+        return user
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication trusting the token's claims, without any query.
+
+    Unlike simplejwt's ``TokenUser``, the user is a model instance, so
+    querysets can be filtered by it and it can be assigned to foreign
+    keys. Only the primary key and the ``TOKEN_USER_CLAIMS`` (issued by
+    ``ClaimsTokenObtainPairSerializer``) are loaded; other fields are
+    deferred and read from the database if accessed. Tokens without the
+    claims get a user with no staff rights, whose username is loaded
+    when first used.
+
+    A user deactivated or deleted keeps access until their access token
+    expires (``ACCESS_TOKEN_LIFETIME``), and a renamed one keeps their old
+    username until then; refreshing it fails.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification')
+            ) from e
+
+        user_model = get_user_model()
+        id_field = user_model._meta.get_field(api_settings.USER_ID_FIELD)
+        try:
+            # Tokens carry the ID as a string
+            user_id = id_field.to_python(user_id)
+        except ValidationError as e:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification')
+            ) from e
+
+        claims = {
+            claim: validated_token[claim]
+            for claim in TOKEN_USER_CLAIMS if claim in validated_token
+        }
+        claims = {**TOKEN_USER_DEFAULTS, **claims}
+        # simplejwt only issues tokens to active users
+        fields = {id_field.attname: user_id, 'is_active': True, **claims}
+        # from_db takes the values in field order
+        names = [
+            field.attname for field in user_model._meta.concrete_fields
+            if field.attname in fields
+        ]
+        return user_model.from_db(
+            DEFAULT_DB_ALIAS, names, [fields[name] for name in names]
+        )
@@ -0,0 +1,163 @@
+import operator
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from functools import reduce
+
+from django.db import transaction
+from django.db.models import Case, F, Q, Sum, Value, When
+from django.utils import timezone
+
+from .models import Budget, Expense, ExpenseDailyRollup
+
+
+def period_bounds(period, day):
+    """Return the [start, end) dates of the budget period containing ``day``."""
+    if period == 'week':
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+    if period == 'year':
+        return date(day.year, 1, 1), date(day.year + 1, 1, 1)
+    start = date(day.year, day.month, 1)
+    return start, date(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+def spent_between(source, user_id, category_id, start, end):
+    """Sum spending from ``source`` (rollups or raw expenses) in [start, end)."""
+    if source is ExpenseDailyRollup:
+        total = Sum('total')
+    else:
+        total = Sum('amount')
+    return source.objects.filter(
+        user_id=user_id,
+        category_id=category_id,
+        date__gte=start,
+        date__lt=end
+    ).aggregate(spent=total)['spent'] or Decimal('0')
+
+
+def start_period(budget, today=None):
+    """Point a budget at the period containing today and recount spending."""
+    today = today or timezone.localdate()
+    budget.period_start, budget.period_end = period_bounds(budget.period, today)
+    budget.spent = spent_between(
+        ExpenseDailyRollup,
+        budget.user_id,
+        budget.category_id,
+        budget.period_start,
+        budget.period_end
+    )
+    return budget
+
+
+def refresh_periods(budgets, today=None):
+    """
+    Move budgets whose period has ended to the current one.
+
+    Rows are locked and rechecked first, so concurrent requests roll a
+    budget over only once. Returns the budgets, up to date.
+    """
+    today = today or timezone.localdate()
+    stale = [
+        budget for budget in budgets
+        if not budget.period_start <= today < budget.period_end
+    ]
+    for budget in stale:
+        with transaction.atomic():
+            locked = Budget.objects.select_for_update().get(pk=budget.pk)
+            if not locked.period_start <= today < locked.period_end:
+                start_period(locked, today)
+                locked.save(update_fields=[
+                    'period_start', 'period_end', 'spent', 'updated_at'
+                ])
+            budget.period_start = locked.period_start
+            budget.period_end = locked.period_end
+            budget.spent = locked.spent
+    return budgets
+
+
+def apply_deltas(deltas):
+    """
+    Add rollup deltas ({(user, category, date): [amount, count]}) to the
+    spent counters of the budgets whose current period they fall in.
+
+    One query finds the affected budgets and one UPDATE adds each one's
+    change with a CASE over their ids. Expenses outside a budget's period
+    are skipped; they are counted when the budget rolls over to their
+    period.
+    """
+    by_pair = defaultdict(list)
+    for (user_id, category_id, day), (amount, _) in deltas.items():
+        if amount:
+            by_pair[(user_id, category_id)].append((day, amount))
+    if not by_pair:
+        return
+
+    query = Q()
+    for user_id, category_id in by_pair:
+        query |= Q(user_id=user_id, category_id=category_id)
+    budgets = Budget.objects.filter(query).order_by().values_list(
+        'pk', 'user_id', 'category_id', 'period_start', 'period_end'
+    )
+
+    changes = {}
+    for pk, user_id, category_id, start, end in budgets:
+        change = sum(
+            (
+                amount for day, amount in by_pair[(user_id, category_id)]
+                if start <= day < end
+            ),
+            Decimal('0')
+        )
+        if change:
+            changes[pk] = (start, change)
+    if not changes:
+        return
+
+    spent = Budget._meta.get_field('spent')
+    # Only budgets whose period wasn't rolled over in the meantime
+    matches = [
+        Q(pk=pk, period_start=start) for pk, (start, _) in changes.items()
+    ]
+    Budget.objects.filter(reduce(operator.or_, matches)).update(
+        spent=F('spent') + Case(
+            *(
+                When(pk=pk, then=Value(change, output_field=spent))
+                for pk, (_, change) in changes.items()
+            ),
+            output_field=spent
+        )
+    )
+
+
+def reconcile_budgets(user_ids=None, today=None):
+    """
+    Recount every budget's spending from the expense rows.
+
+    Also moves budgets to the current period. Returns the number of
+    budgets whose counter or period had drifted.
+    """
+    today = today or timezone.localdate()
+    budgets = Budget.objects.all()
+    if user_ids is not None:
+        budgets = budgets.filter(user_id__in=user_ids)
+
+    fixed = 0
+    for pk in budgets.values_list('pk', flat=True):
+        with transaction.atomic():
+            budget = Budget.objects.select_for_update().get(pk=pk)
+            start, end = period_bounds(budget.period, today)
+            spent = spent_between(
+                Expense, budget.user_id, budget.category_id, start, end
+            )
+            if (budget.period_start, budget.period_end, budget.spent) == (
+                start, end, spent
+            ):
+                continue
+            budget.period_start, budget.period_end = start, end
+            budget.spent = spent
+            budget.save(update_fields=[
+                'period_start', 'period_end', 'spent', 'updated_at'
+            ])
+            fixed += 1
+    return fixed
@@ -0,0 +1,89 @@
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .models import Expense
+from .signals import bulk_expense_writes, record_bulk_changes
+
+
+BULK_MAX_ITEMS = 1000
+BULK_BATCH_SIZE = 500
+
+
+def bulk_create_expenses(user, items):
+    """Insert validated expense items for a user in one transaction."""
+    expenses = []
+    for item in items:
+        item = dict(item)
+        item.pop('id', None)
+        expenses.append(Expense(user=user, **item))
+
+    with transaction.atomic():
+        Expense.objects.bulk_create(expenses, batch_size=BULK_BATCH_SIZE)
+        record_bulk_changes(created=expenses)
+    return expenses
+
+
+def _item_errors(items, message, is_valid):
+    """Raise per-item errors keyed by position, like ListSerializer does."""
+    errors = {
+        index: {'id': [message]}
+        for index, item in enumerate(items)
+        if not is_valid(item)
+    }
+    if errors:
+        raise ValidationError(errors)
+
+
+def bulk_update_expenses(user, items):
+    """Apply validated partial updates, each naming an expense ``id``."""
+    _item_errors(
+        items,
+        'This field is required.',
+        lambda item: item.get('id') is not None
+    )
+
+    with transaction.atomic():
+        expenses = Expense.objects.filter(user=user).select_related(
+            'category'
+        ).select_for_update(of=('self',)).in_bulk(
+            [item['id'] for item in items]
+        )
+        _item_errors(items, 'Not found.', lambda item: item['id'] in expenses)
+
+        now = timezone.now()
+        fields = {'updated_at'}
+        for item in items:
+            expense = expenses[item['id']]
+            expense.user = user
+            for attr, value in item.items():
+                if attr != 'id':
+                    setattr(expense, attr, value)
+                    fields.add(attr)
+            expense.updated_at = now
+
+        updated = list(expenses.values())
+        Expense.objects.bulk_update(
+            updated, sorted(fields), batch_size=BULK_BATCH_SIZE
+        )
+        record_bulk_changes(updated=updated)
+    return [expenses[item['id']] for item in items]
+
+
+def bulk_delete_expenses(user, ids):
+    """Delete a user's expenses by ID; unknown IDs fail the whole batch."""
+    with transaction.atomic():
+        expenses = list(
+            Expense.objects.select_for_update().filter(user=user, pk__in=ids)
+        )
+        found = {expense.pk for expense in expenses}
+        _item_errors(
+            [{'id': pk} for pk in ids],
+            'Not found.',
+            lambda item: item['id'] in found
+        )
+
+        with bulk_expense_writes():
+            Expense.objects.filter(pk__in=found).delete()
+        record_bulk_changes(deleted=expenses)
+    return len(expenses)
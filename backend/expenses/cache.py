@@ -0,0 +1,268 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+
+
+DEFAULT_REPORT_CACHE = {
+    'BACKEND': 'locmem',
+    'MAX_ENTRIES': 1024,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60 * 60 * 24,
+}
+
+
+def _initial_version():
+    # Start from a clock value rather than zero so a lost version key can
+    # never line up with entries cached under an earlier version.
+    return time.time_ns()
+
+
+class LocMemLRUBackend:
+    """
+    In-process LRU store, capped at ``max_entries`` report results that
+    expire after ``timeout`` seconds (None keeps them until evicted).
+    """
+    # No I/O, so async callers can use it without a thread
+    in_process = True
+
+    def __init__(self, max_entries=1024, timeout=None, **kwargs):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+            expires_at, value = self._entries[key]
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        expires_at = None
+        if self.timeout is not None:
+            expires_at = time.monotonic() + self.timeout
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_version(self, key):
+        with self._lock:
+            return self._versions.setdefault(key, _initial_version())
+
+    def bump_version(self, key):
+        with self._lock:
+            self._versions[key] = self._versions.get(key, _initial_version()) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DjangoCacheBackend:
+    """
+    Store backed by a Django cache alias, shared across worker processes.
+
+    The alias may hold other data (sessions, cached users, the category
+    catalog version), so it is never cleared as a whole: see
+    ``ReportCache.clear``.
+    """
+    in_process = False
+
+    def __init__(self, cache_alias='default', timeout=None, **kwargs):
+        self.cache = caches[cache_alias]
+        self.timeout = timeout
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, value):
+        self.cache.set(key, value, self.timeout)
+
+    def get_version(self, key):
+        version = self.cache.get(key)
+        if version is None:
+            self.cache.add(key, _initial_version(), None)
+            version = self.cache.get(key)
+        return version
+
+    def bump_version(self, key):
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.add(key, _initial_version(), None)
+
+
+BACKENDS = {
+    'locmem': LocMemLRUBackend,
+    'django': DjangoCacheBackend,
+}
+
+
+class ReportCache:
+    """
+    Report results cached per (user, normalized filters, data version).
+
+    Writes never touch cached entries: they bump the user's (or the global)
+    version, so stale results simply stop being addressed and age out.
+    """
+    key_prefix = 'expenses:report'
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _user_version_key(self, user_id):
+        return f'{self.key_prefix}:version:user:{user_id}'
+
+    def _global_version_key(self):
+        return f'{self.key_prefix}:version:global'
+
+    def versions(self, user_id):
+        """Return the (global, user) data versions results are keyed on."""
+        return (
+            self.backend.get_version(self._global_version_key()),
+            self.backend.get_version(self._user_version_key(user_id)),
+        )
+
+    def make_key(self, user_id, report, filters):
+        global_version, user_version = self.versions(user_id)
+        digest = hashlib.sha1(repr(filters).encode()).hexdigest()
+        return (
+            f'{self.key_prefix}:{report}:{user_id}:'
+            f'{global_version}:{user_version}:{digest}'
+        )
+
+    def get_or_compute(self, user_id, report, filters, compute):
+        """Return the cached result for these filters, computing it on a miss."""
+        key = self.make_key(user_id, report, filters)
+        value = self.backend.get(key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value
+        with self._lock:
+            self.misses += 1
+        value = compute()
+        self.backend.set(key, value)
+        return value
+
+    async def _acall(self, function, *args):
+        if self.backend.in_process:
+            return function(*args)
+        return await sync_to_async(function)(*args)
+
+    async def aversions(self, user_id):
+        """Async ``versions``."""
+        return await self._acall(self.versions, user_id)
+
+    async def aget_or_compute(self, user_id, report, filters, compute):
+        """Async ``get_or_compute``; ``compute`` is a coroutine function."""
+        key = await self._acall(self.make_key, user_id, report, filters)
+        value = await self._acall(self.backend.get, key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value
+        with self._lock:
+            self.misses += 1
+        value = await compute()
+        await self._acall(self.backend.set, key, value)
+        return value
+
+    def _bump(self, version_key):
+        # Bump now so later reads in this transaction miss, and again after
+        # commit so a result computed from pre-commit data is never reused.
+        self.backend.bump_version(version_key)
+        transaction.on_commit(lambda: self.backend.bump_version(version_key))
+
+    def invalidate_user(self, user_id):
+        """Invalidate every cached report of one user."""
+        self._bump(self._user_version_key(user_id))
+
+    def invalidate_all(self):
+        """Invalidate every cached report, e.g. after a category change."""
+        self._bump(self._global_version_key())
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        stats = {
+            'backend': type(self.backend).__name__,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else None,
+        }
+        if isinstance(self.backend, LocMemLRUBackend):
+            stats['entries'] = len(self.backend)
+            stats['max_entries'] = self.backend.max_entries
+        return stats
+
+    def clear(self):
+        """
+        Drop every cached report and reset the counters.
+
+        In-process stores are emptied. Shared ones move to a new global
+        version, which every key includes, so only report entries stop
+        being addressed, and they age out.
+        """
+        if self.backend.in_process:
+            self.backend.clear()
+        else:
+            self.backend.bump_version(self._global_version_key())
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+_report_cache = None
+_report_cache_lock = threading.Lock()
+
+
+def get_report_cache():
+    """Return the process-wide report cache configured by REPORT_CACHE."""
+    global _report_cache
+    if _report_cache is None:
+        with _report_cache_lock:
+            if _report_cache is None:
+                config = {
+                    **DEFAULT_REPORT_CACHE,
+                    **getattr(settings, 'REPORT_CACHE', {}),
+                }
+                backend_class = BACKENDS[config['BACKEND']]
+                _report_cache = ReportCache(backend_class(
+                    max_entries=config['MAX_ENTRIES'],
+                    cache_alias=config['CACHE_ALIAS'],
+                    timeout=config['TIMEOUT'],
+                ))
+    return _report_cache
+
+
+@receiver(setting_changed)
+def reset_report_cache(setting, **kwargs):
+    """Rebuild the report cache when its settings are overridden in tests."""
+    global _report_cache
+    if setting in ('REPORT_CACHE', 'CACHES'):
+        _report_cache = None
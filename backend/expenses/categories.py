@@ -0,0 +1,172 @@
+import copy
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.signals import setting_changed
+from django.db import connection, transaction
+from django.dispatch import receiver
+
+from .cache import DjangoCacheBackend
+from .models import ExpenseCategory
+
+
+DEFAULT_CATEGORY_CATALOG = {
+    # Where the version shared by every worker process is kept
+    'CACHE_ALIAS': 'default',
+    # Whether that cache is shared by every process writing categories
+    # (workers, management commands); None tells from its backend. The
+    # catalog is off when it isn't: writes made elsewhere would go unseen.
+    'SHARED': None,
+    # Reload at least this often (seconds), for writes that skip the
+    # signals (queryset update(), raw SQL); None never reloads
+    'MAX_AGE': 300,
+}
+
+# Cache backends keeping their data in the process
+PROCESS_CACHE_BACKENDS = (LocMemCache, DummyCache)
+
+
+class CatalogSnapshot:
+    """Every category, loaded at one catalog version."""
+
+    def __init__(self, version, categories, serialized):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.by_id = {category.pk: category for category in categories}
+        # ExpenseCategorySerializer output, ordered by name
+        self.serialized = serialized
+        self.count = len(categories)
+        self.last_modified = max(
+            (category.updated_at for category in categories), default=None
+        )
+
+
+class CategoryCatalog:
+    """
+    Process-wide copy of the (small, rarely written) category table.
+
+    Holds an id -> category map for validating category IDs and the
+    category list as serialized for the API. Category saves and deletes
+    bump a version kept in a Django cache; every process reloads its copy
+    when that version no longer matches the one it loaded. That cache has
+    to be shared (``REDIS_URL``) for a write to be seen by all processes,
+    so with a per-process cache ``snapshot()`` always returns None.
+
+    Transactions don't use the catalog either: they may have written
+    categories nobody else can see yet, so ``snapshot()`` returns None
+    inside an atomic block and callers query the table as before.
+    """
+    version_key = 'expenses:categories:version'
+
+    def __init__(self, cache_alias='default', max_age=None, shared=None):
+        self.backend = DjangoCacheBackend(cache_alias)
+        if shared is None:
+            shared = not isinstance(self.backend.cache, PROCESS_CACHE_BACKENDS)
+        self.shared = shared
+        self.max_age = max_age
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """Return the current snapshot, reloading it if stale."""
+        if not self.shared or connection.in_atomic_block:
+            return None
+        # Read the version before the rows, so a concurrent write can only
+        # leave this snapshot tagged older than its data, never newer.
+        version = self.backend.get_version(self.version_key)
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != version or (
+            self.max_age is not None
+            and time.monotonic() - snapshot.loaded_at > self.max_age
+        ):
+            snapshot = self.load(version)
+            with self._lock:
+                self._snapshot = snapshot
+        return snapshot
+
+    def load(self, version):
+        from .serializers import ExpenseCategorySerializer
+
+        categories = list(ExpenseCategory.objects.order_by('name'))
+        serialized = [
+            dict(row)
+            for row in ExpenseCategorySerializer(categories, many=True).data
+        ]
+        return CatalogSnapshot(version, categories, serialized)
+
+    def all(self):
+        """Return copies of every category, ordered by name."""
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return list(ExpenseCategory.objects.order_by('name'))
+        return [copy.copy(category) for category in snapshot.by_id.values()]
+
+    def get(self, pk):
+        """
+        Return a copy of the category with this pk, or None if none exists.
+
+        Categories missing from the snapshot (created without the signals,
+        e.g. by ``bulk_create``) are looked up in the database.
+        """
+        snapshot = self.snapshot()
+        if snapshot is not None and pk in snapshot.by_id:
+            return copy.copy(snapshot.by_id[pk])
+        return ExpenseCategory.objects.filter(pk=pk).first()
+
+    def in_bulk(self, pks):
+        """Like ``ExpenseCategory.objects.in_bulk(pks)``."""
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return ExpenseCategory.objects.in_bulk(pks)
+        categories = {
+            pk: copy.copy(snapshot.by_id[pk])
+            for pk in pks if pk in snapshot.by_id
+        }
+        missing = [pk for pk in pks if pk not in categories]
+        if missing:
+            categories.update(ExpenseCategory.objects.in_bulk(missing))
+        return categories
+
+    def invalidate(self):
+        """Make every process reload its categories."""
+        with self._lock:
+            self._snapshot = None
+        # As for cached reports: again after commit, so a snapshot loaded
+        # before the write became visible isn't kept.
+        self.backend.bump_version(self.version_key)
+        transaction.on_commit(
+            lambda: self.backend.bump_version(self.version_key)
+        )
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_category_catalog():
+    """Return the process-wide catalog configured by CATEGORY_CATALOG."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                config = {
+                    **DEFAULT_CATEGORY_CATALOG,
+                    **getattr(settings, 'CATEGORY_CATALOG', {}),
+                }
+                _catalog = CategoryCatalog(
+                    cache_alias=config['CACHE_ALIAS'],
+                    max_age=config['MAX_AGE'],
+                    shared=config['SHARED'],
+                )
+    return _catalog
+
+
+@receiver(setting_changed)
+def reset_category_catalog(setting, **kwargs):
+    """Rebuild the catalog when its settings are overridden in tests."""
+    global _catalog
+    if setting in ('CATEGORY_CATALOG', 'CACHES'):
+        _catalog = None
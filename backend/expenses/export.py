@@ -0,0 +1,192 @@
+import csv
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+
+
+EXPORT_FIELDS = ('id', 'date', 'amount', 'category', 'description', 'created_at')
+EXPORT_COLUMNS = (
+    'id', 'date', 'amount', 'category__name', 'description', 'created_at'
+)
+EXPORT_CHUNK_SIZE = 2000
+# Flush roughly this many characters per streamed chunk
+EXPORT_BUFFER_SIZE = 64 * 1024
+# Leading characters that make spreadsheets read a CSV cell as a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class _LineBuffer:
+    """File-like object collecting what csv.writer writes."""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, value):
+        self.parts.append(value)
+
+    def drain(self):
+        data = ''.join(self.parts)
+        self.parts = []
+        return data
+
+
+def _format_datetime(value):
+    # Same representation as DRF's DateTimeField
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def _export_values(queryset):
+    return queryset.values_list(*EXPORT_COLUMNS)
+
+
+def _export_row(values):
+    pk, date, amount, category, description, created_at = values
+    return (
+        pk,
+        date.isoformat(),
+        str(amount),
+        category,
+        description,
+        _format_datetime(created_at),
+    )
+
+
+def export_rows(queryset):
+    """Yield export rows straight from a server-side cursor."""
+    rows = _export_values(queryset).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    for values in rows:
+        yield _export_row(values)
+
+
+async def aexport_rows(queryset):
+    """
+    Async ``export_rows``, fetching each chunk in a thread.
+
+    ``values_list().aiterator()`` runs its query from the event loop, so
+    the sync server-side cursor is driven through ``sync_to_async``.
+    """
+    rows = _export_values(queryset).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    next_chunk = sync_to_async(
+        lambda: list(islice(rows, EXPORT_CHUNK_SIZE))
+    )
+    try:
+        while chunk := await next_chunk():
+            for values in chunk:
+                yield _export_row(values)
+    finally:
+        # Closes the cursor when the client goes away mid-export
+        await sync_to_async(rows.close)()
+
+
+class _ChunkBuffer:
+    """Join lines into chunks of about ``EXPORT_BUFFER_SIZE`` characters."""
+
+    def __init__(self):
+        self.lines = []
+        self.size = 0
+
+    def add(self, line):
+        """Add a line; return a chunk once enough is collected, else None."""
+        self.lines.append(line)
+        self.size += len(line)
+        if self.size >= EXPORT_BUFFER_SIZE:
+            return self.drain()
+        return None
+
+    def drain(self):
+        chunk = ''.join(self.lines)
+        self.lines, self.size = [], 0
+        return chunk
+
+
+def _buffered(lines):
+    chunks = _ChunkBuffer()
+    for line in lines:
+        chunk = chunks.add(line)
+        if chunk is not None:
+            yield chunk
+    if chunks.lines:
+        yield chunks.drain()
+
+
+async def _abuffered(lines):
+    chunks = _ChunkBuffer()
+    async for line in lines:
+        chunk = chunks.add(line)
+        if chunk is not None:
+            yield chunk
+    if chunks.lines:
+        yield chunks.drain()
+
+
+def _csv_text(value):
+    # Prefixed with a quote, which spreadsheets show as text and hide
+    if value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_row(row):
+    """Neutralize formulas in the user-written text cells of a CSV row."""
+    pk, date, amount, category, description, created_at = row
+    return (
+        pk, date, amount, _csv_text(category), _csv_text(description),
+        created_at,
+    )
+
+
+def _csv_writer():
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    return buffer, writer
+
+
+def _ndjson_line(row):
+    return json.dumps(dict(zip(EXPORT_FIELDS, row))) + '\n'
+
+
+def stream_csv(queryset):
+    """Yield the filtered expenses as CSV, header first."""
+    buffer, writer = _csv_writer()
+    yield buffer.drain()
+
+    def lines():
+        for row in export_rows(queryset):
+            writer.writerow(_csv_row(row))
+            yield buffer.drain()
+
+    yield from _buffered(lines())
+
+
+def stream_ndjson(queryset):
+    """Yield the filtered expenses as newline-delimited JSON."""
+    yield from _buffered(_ndjson_line(row) for row in export_rows(queryset))
+
+
+async def astream_csv(queryset):
+    """
+    Async ``stream_csv``, for ASGI: Django would otherwise read a sync
+    iterator to the end before sending anything.
+    """
+    buffer, writer = _csv_writer()
+    yield buffer.drain()
+
+    async def lines():
+        async for row in aexport_rows(queryset):
+            writer.writerow(_csv_row(row))
+            yield buffer.drain()
+
+    async for chunk in _abuffered(lines()):
+        yield chunk
+
+
+async def astream_ndjson(queryset):
+    """Async ``stream_ndjson``, for ASGI."""
+    lines = (_ndjson_line(row) async for row in aexport_rows(queryset))
+    async for chunk in _abuffered(lines):
+        yield chunk
@@ -0,0 +1,30 @@
+from django.db.models import Q
+from rest_framework import filters
+
+from .models import ExpenseCategory
+
+
+class ExpenseSearchFilter(filters.SearchFilter):
+    """
+    Search expenses by description or category name.
+
+    The stock filter ORs ``description`` with ``category__name`` across a
+    join, which forces a scan of every joined row. Matching category IDs
+    are looked up first instead (the category table is small), so the
+    query becomes an OR of two indexable conditions: the trigram index on
+    ``UPPER(description)`` and the category index. As with
+    ``SearchFilter``, every search term has to match.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        for term in self.get_search_terms(request):
+            category_ids = list(
+                ExpenseCategory.objects.filter(
+                    name__icontains=term
+                ).values_list('pk', flat=True)
+            )
+            queryset = queryset.filter(
+                Q(description__icontains=term)
+                | Q(category_id__in=category_ids)
+            )
+        return queryset
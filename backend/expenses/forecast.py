@@ -0,0 +1,294 @@
+from datetime import timedelta
+
+import numpy as np
+from django.db.models import Sum
+from rest_framework.exceptions import ValidationError
+
+from .models import ExpenseDailyRollup
+from .reports import parse_category_ids
+
+
+FORECAST_MODELS = ('auto', 'linear', 'smoothing')
+FORECAST_GRANULARITIES = {'day': 1, 'week': 7}
+DEFAULT_HISTORY_DAYS = 180
+MAX_HISTORY_DAYS = 730
+DEFAULT_HORIZON = 30
+MAX_HORIZON_DAYS = 366
+
+# Holt's damped trend: the level smoothing weight is picked per category
+# from this grid; the trend weight and damping are fixed.
+SMOOTHING_ALPHAS = np.array([0.05, 0.1, 0.2, 0.3, 0.5, 0.8])
+SMOOTHING_BETA = 0.1
+SMOOTHING_PHI = 0.9
+# Two-sided 95% normal quantile
+CONFIDENCE = 0.95
+Z_SCORE = 1.959964
+
+
+def _int_param(params, name, default, maximum, errors):
+    value = params.get(name, None)
+    if value in (None, ''):
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        value = 0
+    if not 1 <= value <= maximum:
+        errors[name] = f'Must be an integer between 1 and {maximum}.'
+    return value
+
+
+def parse_forecast_params(params):
+    """Validate the forecast query parameters; raises ValidationError."""
+    errors = {}
+    granularity = params.get('granularity', 'day')
+    if granularity not in FORECAST_GRANULARITIES:
+        errors['granularity'] = (
+            'Must be one of: ' + ', '.join(FORECAST_GRANULARITIES) + '.'
+        )
+        granularity = 'day'
+    model = params.get('model', 'auto')
+    if model not in FORECAST_MODELS:
+        errors['model'] = 'Must be one of: ' + ', '.join(FORECAST_MODELS) + '.'
+    horizon = _int_param(
+        params,
+        'horizon',
+        DEFAULT_HORIZON,
+        MAX_HORIZON_DAYS // FORECAST_GRANULARITIES[granularity],
+        errors
+    )
+    history = _int_param(
+        params, 'history', DEFAULT_HISTORY_DAYS, MAX_HISTORY_DAYS, errors
+    )
+    if errors:
+        raise ValidationError(errors)
+    return {
+        'granularity': granularity,
+        'model': model,
+        'horizon': horizon,
+        'history': history,
+        'category_ids': tuple(sorted(set(
+            parse_category_ids(params.get('category', None))
+        ))),
+    }
+
+
+def daily_matrix(user, start, end, category_ids=()):
+    """
+    Load daily totals per category as a (categories x days) array.
+
+    One aggregate over the daily rollups; days without expenses are zero.
+    Returns (category ids, category names, matrix).
+    """
+    queryset = ExpenseDailyRollup.objects.filter(
+        user=user, date__gte=start, date__lte=end
+    )
+    if category_ids:
+        queryset = queryset.filter(category_id__in=category_ids)
+    rows = list(queryset.values(
+        'category_id', 'category__name', 'date'
+    ).annotate(amount_sum=Sum('total')).order_by())
+
+    names = {}
+    for row in rows:
+        names[row['category_id']] = row['category__name']
+    ids = sorted(names)
+    index = {category_id: position for position, category_id in enumerate(ids)}
+
+    days = (end - start).days + 1
+    matrix = np.zeros((len(ids), days))
+    if rows:
+        matrix[
+            [index[row['category_id']] for row in rows],
+            [(row['date'] - start).days for row in rows],
+        ] = [float(row['amount_sum']) for row in rows]
+    return ids, [names[category_id] for category_id in ids], matrix
+
+
+def weekday_profile(residuals, weekdays):
+    """Mean residual per weekday, per category: a (categories x 7) array."""
+    one_hot = np.eye(7)[weekdays]
+    counts = np.maximum(one_hot.sum(axis=0), 1)
+    profile = residuals @ one_hot / counts
+    # Centre it so the profile only redistributes spending across the week
+    return profile - profile.mean(axis=1, keepdims=True)
+
+
+def fit_linear(series, t):
+    """Least-squares line per category; returns (intercept, slope)."""
+    t_mean = t.mean()
+    centred = t - t_mean
+    denominator = max(centred @ centred, 1e-9)
+    slope = (series - series.mean(axis=1, keepdims=True)) @ centred / denominator
+    intercept = series.mean(axis=1) - slope * t_mean
+    return intercept, slope
+
+
+def fit_smoothing(series):
+    """
+    Damped Holt smoothing of every category for every alpha in the grid.
+
+    The loop runs over days only; each step updates an (alphas x
+    categories) array. Returns the per-category best alpha, final level,
+    final trend and one-step-ahead errors.
+    """
+    alphas = SMOOTHING_ALPHAS[:, None]
+    level = np.repeat(series[None, :, 0], len(SMOOTHING_ALPHAS), axis=0)
+    trend = np.zeros_like(level)
+    errors = np.zeros((len(SMOOTHING_ALPHAS),) + series.shape)
+    for day in range(1, series.shape[1]):
+        predicted = level + SMOOTHING_PHI * trend
+        errors[:, :, day] = series[None, :, day] - predicted
+        new_level = predicted + alphas * errors[:, :, day]
+        trend = (
+            SMOOTHING_BETA * (new_level - level)
+            + (1 - SMOOTHING_BETA) * SMOOTHING_PHI * trend
+        )
+        level = new_level
+
+    best = np.argmin((errors ** 2).sum(axis=2), axis=0)
+    columns = np.arange(series.shape[0])
+    return (
+        SMOOTHING_ALPHAS[best],
+        level[best, columns],
+        trend[best, columns],
+        errors[best, columns],
+    )
+
+
+def fit_forecast(user, start, end, category_ids=()):
+    """
+    Fit both forecast models to the user's daily totals in [start, end].
+
+    Returns a plain dict of arrays, small enough to cache, from which
+    ``project`` derives forecasts for any horizon.
+    """
+    ids, names, series = daily_matrix(user, start, end, category_ids)
+    days = series.shape[1]
+    t = np.arange(days, dtype=float)
+    weekdays = (start.weekday() + np.arange(days)) % 7
+
+    intercept, slope = fit_linear(series, t)
+    trend_line = intercept[:, None] + slope[:, None] * t
+    profile = weekday_profile(series - trend_line, weekdays)
+    seasonal = profile[:, weekdays]
+
+    linear_errors = series - trend_line - seasonal
+    alpha, level, trend, smoothing_errors = fit_smoothing(series - seasonal)
+
+    # Error spread per category; the smoothing one skips the first day,
+    # which has nothing to be predicted from.
+    dof = max(days - 2, 1)
+    linear_sigma = np.sqrt((linear_errors ** 2).sum(axis=1) / dof)
+    smoothing_sigma = np.sqrt(
+        (smoothing_errors[:, 1:] ** 2).sum(axis=1) / max(days - 1, 1)
+    )
+    return {
+        'start': start,
+        'end': end,
+        'category_ids': ids,
+        'category_names': names,
+        'profile': profile,
+        'intercept': intercept,
+        'slope': slope,
+        'linear_sigma': linear_sigma,
+        't_mean': t.mean(),
+        't_spread': max(((t - t.mean()) ** 2).sum(), 1e-9),
+        'alpha': alpha,
+        'level': level,
+        'trend': trend,
+        'smoothing_sigma': smoothing_sigma,
+    }
+
+
+def project(fit, horizon_days, model='auto'):
+    """
+    Project a fitted forecast ``horizon_days`` days past the history.
+
+    Returns per-category (models, mean, variance) arrays of shape
+    (categories x days). With ``model='auto'`` each category uses the
+    model with the smaller in-sample error.
+    """
+    days = (fit['end'] - fit['start']).days + 1
+    steps = np.arange(1, horizon_days + 1)
+    t = days - 1 + steps
+    weekdays = (fit['start'].weekday() + t) % 7
+    seasonal = fit['profile'][:, weekdays]
+
+    linear_mean = fit['intercept'][:, None] + fit['slope'][:, None] * t
+    linear_var = fit['linear_sigma'][:, None] ** 2 * (
+        1 + 1 / days + (t - fit['t_mean']) ** 2 / fit['t_spread']
+    )
+
+    damping = np.cumsum(SMOOTHING_PHI ** steps)
+    smoothing_mean = fit['level'][:, None] + damping * fit['trend'][:, None]
+    # Simple exponential smoothing variance; ignores the damped trend
+    smoothing_var = fit['smoothing_sigma'][:, None] ** 2 * (
+        1 + (steps - 1) * fit['alpha'][:, None] ** 2
+    )
+
+    if model == 'auto':
+        use_linear = fit['linear_sigma'] <= fit['smoothing_sigma']
+    else:
+        use_linear = np.full(len(fit['category_ids']), model == 'linear')
+    mean = np.where(use_linear[:, None], linear_mean, smoothing_mean)
+    variance = np.where(use_linear[:, None], linear_var, smoothing_var)
+    models = np.where(use_linear, 'linear', 'smoothing')
+    return models, mean + seasonal, variance
+
+
+def bucket(values, size):
+    """Sum consecutive ``size``-day blocks along the last axis."""
+    buckets = values.shape[-1] // size
+    return values.reshape(values.shape[:-1] + (buckets, size)).sum(axis=-1)
+
+
+def _band(mean, variance):
+    spread = Z_SCORE * np.sqrt(variance)
+    return {
+        'forecast': np.round(mean, 2).tolist(),
+        'lower': np.round(np.maximum(mean - spread, 0), 2).tolist(),
+        'upper': np.round(mean + spread, 2).tolist(),
+    }
+
+
+def build_forecast(fit, horizon, granularity='day', model='auto'):
+    """
+    Forecast ``horizon`` days or weeks after the fitted history.
+
+    Weekly buckets add up the daily means and, treating days as
+    independent, variances. Spending can't be negative, so each
+    category's bucketed means are then clipped at zero, as are the lower
+    bounds. The all-category total adds up the clipped means, so it
+    matches the sum of the category forecasts, and the variances.
+    """
+    size = FORECAST_GRANULARITIES[granularity]
+    models, mean, variance = project(fit, horizon * size, model)
+    mean, variance = np.maximum(bucket(mean, size), 0), bucket(variance, size)
+
+    first_day = fit['end'] + timedelta(days=1)
+    return {
+        'granularity': granularity,
+        'horizon': horizon,
+        'confidence': CONFIDENCE,
+        'history': {
+            'date_from': fit['start'].isoformat(),
+            'date_to': fit['end'].isoformat(),
+        },
+        'periods': [
+            (first_day + timedelta(days=index * size)).isoformat()
+            for index in range(horizon)
+        ],
+        'categories': [
+            {
+                'category__id': category_id,
+                'category__name': name,
+                'model': str(models[position]),
+                **_band(mean[position], variance[position]),
+            }
+            for position, (category_id, name) in enumerate(
+                zip(fit['category_ids'], fit['category_names'])
+            )
+        ],
+        'total': _band(mean.sum(axis=0), variance.sum(axis=0)),
+    }
@@ -0,0 +1,221 @@
+import csv
+import io
+
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from .budgets import reconcile_budgets
+from .cache import get_report_cache
+from .categories import get_category_catalog
+from .models import Expense, ExpenseCategory
+from .rollups import rebuild_rollups
+from .serializers import ExpenseCategorySerializer, ExpenseSerializer
+
+
+IMPORT_COLUMNS = ('date', 'amount', 'description', 'category')
+IMPORT_BATCH_SIZE = 1000
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+class ExpenseImporter:
+    """
+    Stream a CSV of expenses into the database for one user.
+
+    Lines are parsed one at a time and validated with the same field rules
+    as ``ExpenseSerializer``. Valid rows are inserted in batches, through
+    ``COPY`` on PostgreSQL and ``bulk_create`` elsewhere; invalid lines are
+    collected with their line number.
+    Category names are resolved from a dict preloaded once (matched
+    case-insensitively), and unknown ones are created in bulk per batch.
+    """
+
+    def __init__(
+        self,
+        user,
+        batch_size=IMPORT_BATCH_SIZE,
+        create_categories=True,
+        progress=None,
+        max_errors=1000
+    ):
+        self.user = user
+        self.batch_size = batch_size
+        self.create_categories = create_categories
+        self.progress = progress
+        self.max_errors = max_errors
+        self.created = 0
+        self.error_count = 0
+        self.errors = []
+        self.lines = 0
+
+        serializer = ExpenseSerializer()
+        self.amount_field = serializer.fields['amount']
+        self.date_field = serializer.fields['date']
+        self.description_field = serializer.fields['description']
+        self.validate_amount = serializer.validate_amount
+        # The category serializer's name rules, minus the unique check:
+        # existing names are matched rather than rejected
+        name_field = ExpenseCategorySerializer().fields['name']
+        self.category_field = serializers.CharField(
+            max_length=name_field.max_length
+        )
+        self.categories = {
+            category.name.casefold(): category
+            for category in get_category_catalog().all()
+        }
+
+    def run(self, lines):
+        """Import CSV text lines (header first); returns the created count."""
+        reader = csv.DictReader(lines)
+        if reader.fieldnames is None:
+            raise ImportFormatError('The file is empty.')
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        missing = [
+            name for name in IMPORT_COLUMNS if name not in reader.fieldnames
+        ]
+        if missing:
+            raise ImportFormatError(
+                'Missing required columns: ' + ', '.join(missing) + '.'
+            )
+
+        batch = []
+        try:
+            for row in reader:
+                self.lines += 1
+                parsed = self.parse_row(reader.line_num, row)
+                if parsed is not None:
+                    batch.append(parsed)
+                if len(batch) >= self.batch_size:
+                    self.flush(batch)
+                    batch = []
+            self.flush(batch)
+        finally:
+            if self.created:
+                # Cheaper than per-row rollup deltas for large imports
+                rebuild_rollups(user_ids=[self.user.pk])
+                reconcile_budgets(user_ids=[self.user.pk])
+        return self.created
+
+    def add_error(self, line, errors):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'line': line, 'errors': errors})
+
+    def parse_row(self, line, row):
+        """Validate one CSV row; returns (fields, category name) or None."""
+        values, errors = {}, {}
+        checks = (
+            ('date', self.date_field.run_validation),
+            ('amount', lambda value: self.validate_amount(
+                self.amount_field.run_validation(value)
+            )),
+            ('description', self.description_field.run_validation),
+        )
+        for name, validate in checks:
+            try:
+                values[name] = validate((row.get(name) or '').strip())
+            except serializers.ValidationError as exc:
+                errors[name] = exc.detail
+
+        category = None
+        try:
+            category = self.category_field.run_validation(
+                (row.get('category') or '').strip()
+            )
+        except serializers.ValidationError as exc:
+            errors['category'] = exc.detail
+        if (
+            category is not None
+            and not self.create_categories
+            and category.casefold() not in self.categories
+        ):
+            errors['category'] = [f'Unknown category "{category}".']
+
+        if errors:
+            self.add_error(line, errors)
+            return None
+        return values, category
+
+    def resolve_categories(self, names):
+        """Create the categories not seen yet, in one bulk insert."""
+        missing = {}
+        for name in names:
+            missing.setdefault(name.casefold(), name)
+        for key in list(missing):
+            if key in self.categories:
+                del missing[key]
+        if not missing:
+            return
+        ExpenseCategory.objects.bulk_create(
+            [ExpenseCategory(name=name) for name in missing.values()],
+            ignore_conflicts=True
+        )
+        for category in ExpenseCategory.objects.filter(
+            name__in=missing.values()
+        ):
+            self.categories[category.name.casefold()] = category
+        # bulk_create skips the signals that drop reports naming categories
+        # and the category catalog
+        get_report_cache().invalidate_all()
+        get_category_catalog().invalidate()
+
+    def flush(self, batch):
+        if not batch:
+            return
+        self.resolve_categories(category for _, category in batch)
+        rows = [
+            dict(values, category_id=self.categories[category.casefold()].pk)
+            for values, category in batch
+        ]
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                self.copy_rows(rows)
+            else:
+                Expense.objects.bulk_create(
+                    [Expense(user_id=self.user.pk, **row) for row in rows],
+                    batch_size=self.batch_size
+                )
+        self.created += len(rows)
+        if self.progress is not None:
+            self.progress(self.lines, self.created, self.error_count)
+
+    def copy_rows(self, rows):
+        """Stream rows into the expense table with PostgreSQL COPY."""
+        fields = (
+            'user', 'amount', 'description', 'category', 'date',
+            'created_at', 'updated_at',
+        )
+        columns = ', '.join(
+            connection.ops.quote_name(Expense._meta.get_field(name).column)
+            for name in fields
+        )
+        sql = (
+            f'COPY {connection.ops.quote_name(Expense._meta.db_table)} '
+            f'({columns}) FROM STDIN WITH (FORMAT csv)'
+        )
+        now = timezone.now().isoformat()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow((
+                self.user.pk,
+                row['amount'],
+                row['description'],
+                row['category_id'],
+                row['date'].isoformat(),
+                now,
+                now,
+            ))
+        buffer.seek(0)
+
+        with connection.cursor() as cursor:
+            if hasattr(cursor.cursor, 'copy_expert'):
+                # psycopg2
+                cursor.copy_expert(sql, buffer)
+            else:
+                # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from expenses.partitioning import (
+    INTERVALS,
+    PartitioningError,
+    create_partitions,
+    shift_interval,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Create expense partitions ahead of time; run it periodically '
+        'once the table is partitioned.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            choices=INTERVALS,
+            help='Override EXPENSE_PARTITION_INTERVAL.',
+        )
+        parser.add_argument(
+            '--ahead',
+            type=int,
+            help='Override EXPENSE_PARTITIONS_AHEAD.',
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval'] or settings.EXPENSE_PARTITION_INTERVAL
+        ahead = options['ahead']
+        if ahead is None:
+            ahead = settings.EXPENSE_PARTITIONS_AHEAD
+        through = shift_interval(timezone.localdate(), interval, ahead)
+        try:
+            names = create_partitions(through, interval=interval)
+        except PartitioningError as exc:
+            raise CommandError(str(exc))
+        if names:
+            self.stdout.write(self.style.SUCCESS(
+                'Created partitions: ' + ', '.join(names) + '.'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Partitions already exist through {through}.'
+            ))
@@ -0,0 +1,78 @@
+import sys
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from expenses.importers import (
+    IMPORT_BATCH_SIZE,
+    ExpenseImporter,
+    ImportFormatError,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Import expenses for a user from a CSV file with date, amount, '
+        'description and category columns.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV file to import ("-" for stdin).')
+        parser.add_argument(
+            '--user',
+            required=True,
+            help='Username (or numeric ID) owning the imported expenses.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help='Rows per bulk insert.',
+        )
+        parser.add_argument(
+            '--no-create-categories',
+            action='store_false',
+            dest='create_categories',
+            help='Reject lines whose category does not exist yet.',
+        )
+
+    def get_user(self, value):
+        lookup = {'pk': int(value)} if value.isdigit() else {'username': value}
+        try:
+            return User.objects.get(**lookup)
+        except User.DoesNotExist:
+            raise CommandError(f'User "{value}" does not exist.')
+
+    def handle(self, *args, **options):
+        user = self.get_user(options['user'])
+        started = time.monotonic()
+
+        def progress(lines, created, errors):
+            self.stdout.write(
+                f'{lines} lines read, {created} imported, {errors} errors '
+                f'({time.monotonic() - started:.1f}s)'
+            )
+
+        importer = ExpenseImporter(
+            user,
+            batch_size=options['batch_size'],
+            create_categories=options['create_categories'],
+            progress=progress
+        )
+        try:
+            if options['path'] == '-':
+                importer.run(sys.stdin)
+            else:
+                with open(options['path'], encoding='utf-8-sig', newline='') as f:
+                    importer.run(f)
+        except (ImportFormatError, OSError) as exc:
+            raise CommandError(str(exc))
+
+        for error in importer.errors:
+            self.stderr.write(f"Line {error['line']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {importer.created} expenses with '
+            f'{importer.error_count} errors in '
+            f'{time.monotonic() - started:.1f}s.'
+        ))
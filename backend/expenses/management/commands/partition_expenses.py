@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from expenses.partitioning import (
+    INTERVALS,
+    PartitioningError,
+    partition_expense_table,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Convert the expense table into a table range-partitioned by date '
+        '(PostgreSQL). Locks the table while the rows are copied.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            choices=INTERVALS,
+            help='Override EXPENSE_PARTITION_INTERVAL.',
+        )
+        parser.add_argument(
+            '--ahead',
+            type=int,
+            help='Override EXPENSE_PARTITIONS_AHEAD.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            names = partition_expense_table(
+                interval=options['interval'],
+                ahead=options['ahead']
+            )
+        except PartitioningError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(self.style.SUCCESS(
+            f'Partitioned the expense table into {len(names)} partitions '
+            f'plus a default partition.'
+        ))
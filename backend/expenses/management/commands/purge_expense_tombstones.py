@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from expenses.sync import purge_tombstones
+
+
+class Command(BaseCommand):
+    help = 'Delete deleted-expense tombstones past the retention period.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Override EXPENSE_TOMBSTONE_RETENTION_DAYS.',
+        )
+
+    def handle(self, *args, **options):
+        older_than = None
+        if options['days'] is not None:
+            older_than = timedelta(days=options['days'])
+        deleted = purge_tombstones(older_than)
+        self.stdout.write(self.style.SUCCESS(f'Purged {deleted} tombstones.'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from expenses.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the daily expense rollup table from the expense rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='Only rebuild rollups for this user ID (repeatable).',
+        )
+
+    def handle(self, *args, **options):
+        created = rebuild_rollups(user_ids=options['user_ids'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt {created} daily rollup rows.')
+        )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from expenses.budgets import reconcile_budgets
+
+
+class Command(BaseCommand):
+    help = 'Recount budget spending from the expense rows to fix drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='Only reconcile budgets of this user ID (repeatable).',
+        )
+
+    def handle(self, *args, **options):
+        fixed = reconcile_budgets(user_ids=options['user_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Reconciled {fixed} budgets.'))
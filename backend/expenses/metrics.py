@@ -0,0 +1,304 @@
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUEST_METRICS = {
+    'ENABLED': True,
+    'SERVER_TIMING': True,
+    # Log queries slower than this; None turns the slow-query log off
+    'SLOW_QUERY_MS': 200,
+}
+
+# Upper bounds of the histogram buckets (Prometheus ``le``), per metric
+HISTOGRAMS = {
+    'request_duration_seconds': (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+    ),
+    'db_duration_seconds': (
+        0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5,
+    ),
+    'queries': (0, 1, 2, 3, 5, 10, 20, 50, 100, 200),
+    'response_size_bytes': (
+        100, 1000, 10_000, 100_000, 1_000_000, 10_000_000,
+    ),
+}
+HISTOGRAM_HELP = {
+    'request_duration_seconds': 'Time spent in Django per request.',
+    'db_duration_seconds': 'Time spent executing SQL per request.',
+    'queries': 'SQL queries executed per request.',
+    'response_size_bytes': 'Response body size (non-streaming responses).',
+}
+METRIC_PREFIX = 'expense_api_'
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'(?<![\w"])-?\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%s|\?')
+_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_SPACE = re.compile(r'\s+')
+
+# The QueryRecorder of the request being served, if any
+current_recorder = ContextVar('current_recorder', default=None)
+
+
+def get_metrics_settings():
+    return {
+        **DEFAULT_REQUEST_METRICS,
+        **getattr(settings, 'REQUEST_METRICS', {}),
+    }
+
+
+def normalize_sql(sql):
+    """
+    Reduce a statement to its shape: literals and parameters become ``?``,
+    ``IN`` lists collapse to ``(...)`` and whitespace to single spaces, so
+    the same query logs the same way whatever its arguments.
+    """
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _LIST.sub('(...)', sql)
+    return _SPACE.sub(' ', sql).strip()
+
+
+def view_name(view_func, method):
+    """Label a resolved view as ``ViewSet.action`` or its function name."""
+    cls = getattr(view_func, 'cls', None)
+    if cls is None:
+        return getattr(view_func, '__qualname__', 'unknown')
+    method = method.lower()
+    actions = getattr(view_func, 'actions', None)
+    if actions:
+        if method == 'head':
+            method = 'get'
+        return f'{cls.__name__}.{actions.get(method, method)}'
+    return f'{cls.__name__}.{method}'
+
+
+def record_queries(recorder):
+    """
+    Install ``recorder`` on this thread's connections until the returned
+    ExitStack is closed; a no-op without a recorder.
+    """
+    stack = ExitStack()
+    if recorder is not None:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+    return stack
+
+
+class QueryRecorder:
+    """
+    ``execute_wrapper`` hook counting and timing every query it runs.
+
+    It may be installed in several threads at once (see ``QueryExecutor``),
+    whose query times add up even where they overlap.
+    """
+
+    def __init__(self, slow_query_ms=None):
+        self.slow_query_ms = slow_query_ms
+        self.count = 0
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.count += 1
+                self.duration += elapsed
+            if (
+                self.slow_query_ms is not None
+                and elapsed * 1000 >= self.slow_query_ms
+            ):
+                logger.warning(
+                    'Slow query (%.1f ms, %s): %s',
+                    elapsed * 1000,
+                    context['connection'].alias,
+                    normalize_sql(sql)
+                )
+
+
+class Histogram:
+    """Cumulative-bucket histogram, as Prometheus exposes them."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        # One slot per bound plus the +Inf bucket, not yet cumulative
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self):
+        """Return the count, sum and cumulative counts keyed by ``le``."""
+        buckets, running = {}, 0
+        for bound, count in zip(self.bounds + (None,), self.counts):
+            running += count
+            buckets['+Inf' if bound is None else repr(float(bound))] = running
+        return {'count': self.count, 'sum': self.sum, 'buckets': buckets}
+
+
+class MetricsRegistry:
+    """Per-view request histograms for this worker process."""
+
+    def __init__(self):
+        self._views = {}
+        self._lock = threading.Lock()
+
+    def observe(self, view, **values):
+        with self._lock:
+            histograms = self._views.get(view)
+            if histograms is None:
+                histograms = self._views[view] = {
+                    name: Histogram(bounds)
+                    for name, bounds in HISTOGRAMS.items()
+                }
+            for name, value in values.items():
+                if value is not None:
+                    histograms[name].observe(value)
+
+    def snapshot(self):
+        """Return ``{view: {metric: histogram snapshot}}``."""
+        with self._lock:
+            return {
+                view: {
+                    name: histogram.snapshot()
+                    for name, histogram in histograms.items()
+                }
+                for view, histograms in sorted(self._views.items())
+            }
+
+    def clear(self):
+        with self._lock:
+            self._views.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(snapshot):
+    """Render a registry snapshot in the Prometheus text exposition format."""
+    lines = []
+    for name, help_text in HISTOGRAM_HELP.items():
+        metric = METRIC_PREFIX + name
+        lines.append(f'# HELP {metric} {help_text}')
+        lines.append(f'# TYPE {metric} histogram')
+        for view, histograms in snapshot.items():
+            histogram = histograms[name]
+            label = f'view="{_escape_label(view)}"'
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{metric}_bucket{{{label},le="{bound}"}} {count}')
+            lines.append(f'{metric}_sum{{{label}}} {histogram["sum"]!r}')
+            lines.append(f'{metric}_count{{{label}}} {histogram["count"]}')
+    return '\n'.join(lines) + '\n'
+
+
+class RequestMetricsMiddleware:
+    """
+    Record latency, SQL query count and time, and response size per view.
+
+    Queries on every database alias are timed through
+    ``connection.execute_wrapper`` for the duration of the request,
+    including those it hands to the ``QueryExecutor``'s threads, which
+    find the recorder in ``current_recorder``.
+    Results go to the process-wide ``registry`` under the view's
+    ``ViewSet.action`` name and, if enabled, into a ``Server-Timing``
+    header. Streaming responses are measured up to the point they are
+    returned, i.e. without their body.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        config = get_metrics_settings()
+        if not config['ENABLED']:
+            return self.get_response(request)
+
+        recorder = QueryRecorder(config['SLOW_QUERY_MS'])
+        token = current_recorder.set(recorder)
+        start = time.perf_counter()
+        try:
+            with record_queries(recorder):
+                response = self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        return self.record(
+            request, response, config, recorder, time.perf_counter() - start
+        )
+
+    async def __acall__(self, request):
+        config = get_metrics_settings()
+        if not config['ENABLED']:
+            return await self.get_response(request)
+
+        recorder = QueryRecorder(config['SLOW_QUERY_MS'])
+        token = current_recorder.set(recorder)
+        start = time.perf_counter()
+        # Connections are per thread: the async ORM runs queries in this
+        # request's sync thread, so the wrappers go on its connections.
+        stack = await sync_to_async(record_queries)(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+            current_recorder.reset(token)
+        return self.record(
+            request, response, config, recorder, time.perf_counter() - start
+        )
+
+    def record(self, request, response, config, recorder, duration):
+        size = None
+        if not response.streaming:
+            size = len(response.content)
+        # resolver_match rather than process_view, which the async handler
+        # would have to run in a thread
+        match = getattr(request, 'resolver_match', None)
+        registry.observe(
+            view_name(match.func, request.method) if match else 'unresolved',
+            request_duration_seconds=duration,
+            db_duration_seconds=recorder.duration,
+            queries=recorder.count,
+            response_size_bytes=size
+        )
+        if config['SERVER_TIMING']:
+            response['Server-Timing'] = (
+                f'app;dur={duration * 1000:.1f}, '
+                f'db;dur={recorder.duration * 1000:.1f};'
+                f'desc="{recorder.count} queries"'
+            )
+        return response
@@ -0,0 +1,49 @@
+import warnings
+
+from django.db import migrations
+
+
+INDEX_NAME = 'expenses_expense_description_trgm'
+
+
+def create_trigram_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+        )
+        if cursor.fetchone() is None:
+            # The index only speeds up search, so don't block the deploy
+            warnings.warn(
+                'pg_trgm is not available on this server; expense '
+                'description search will run without its trigram index.'
+            )
+            return
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        # Matches the UPPER(description) LIKE UPPER(...) that icontains
+        # compiles to, so both search and the report filter can use it.
+        cursor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} '
+            'ON expenses_expense USING gin (UPPER(description) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('expenses', '0003_expense_tombstone'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0004_expense_description_trgm'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='expensedailyrollup',
+            name='unique_expense_daily_rollup',
+        ),
+        migrations.RemoveIndex(
+            model_name='expense',
+            name='expenses_ex_date_2850f8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='expense',
+            name='expenses_ex_categor_20264a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='expense',
+            name='expenses_ex_user_id_4af51e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='expensedailyrollup',
+            name='expenses_ex_user_id_f970df_idx',
+        ),
+        migrations.AlterField(
+            model_name='expense',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='expenses', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='expensedailyrollup',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='expense_rollups', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='expensetombstone',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='expense_tombstones', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user', '-date', '-created_at', '-id'], name='expense_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user', 'category', 'date'], include=('amount', 'updated_at'), name='expense_user_category_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expensedailyrollup',
+            index=models.Index(fields=['user', 'date'], include=('category', 'total', 'count'), name='expense_rollup_user_date_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='expensedailyrollup',
+            constraint=models.UniqueConstraint(fields=('user', 'category', 'date'), include=('total', 'count'), name='unique_expense_daily_rollup'),
+        ),
+    ]
@@ -19,10 +19,12 @@ class ExpenseCategory(models.Model):
 
 class Expense(models.Model):
     """Core expense model."""
+    # Indexed as the leading column of the composite indexes below
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
-        related_name='expenses'
+        related_name='expenses',
+        db_index=False
     )
     amount = models.DecimalField(
         max_digits=10,
@@ -41,10 +43,162 @@ class Expense(models.Model):
     class Meta:
         ordering = ['-date', '-created_at']
         indexes = [
-            models.Index(fields=['-date']),
-            models.Index(fields=['category']),
-            models.Index(fields=['user', '-date']),
+            # List ordering, so pages (and keyset cursors) are range scans
+            models.Index(
+                fields=['user', '-date', '-created_at', '-id'],
+                name='expense_user_date_idx'
+            ),
+            # Category/date filters and aggregates over amount, answered
+            # by index-only scans (list ETags read updated_at as well)
+            models.Index(
+                fields=['user', 'category', 'date'],
+                include=['amount', 'updated_at'],
+                name='expense_user_category_date_idx'
+            ),
+            models.Index(fields=['user', 'updated_at']),
         ]
 
     def __str__(self) -> str:
         return f"{self.description} - {self.amount} ({self.date})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored values so rollups can be adjusted on update
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+
+class ExpenseDailyRollup(models.Model):
+    """
+    Precomputed daily expense totals per user and category.
+
+    Maintained incrementally by the Expense signal handlers; queryset
+    ``update()``/``bulk_create()`` bypass them, so run
+    ``manage.py rebuild_expense_rollups`` after raw data changes.
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='expense_rollups',
+        db_index=False
+    )
+    category = models.ForeignKey(
+        ExpenseCategory,
+        on_delete=models.CASCADE,
+        related_name='daily_rollups'
+    )
+    date = models.DateField()
+    total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0
+    )
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        # Both cover the report columns, so reports are index-only scans:
+        # the unique index when filtering by category, (user, date) else.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'category', 'date'],
+                include=['total', 'count'],
+                name='unique_expense_daily_rollup'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['user', 'date'],
+                include=['category', 'total', 'count'],
+                name='expense_rollup_user_date_idx'
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user_id} {self.category_id} {self.date}: {self.total}"
+
+
+class ExpenseTombstone(models.Model):
+    """Record of a deleted expense, so clients can sync deletions."""
+    # No FK constraint: tombstones are written while a user's expenses are
+    # cascade-deleted, after the user's own tombstones were collected.
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='expense_tombstones',
+        db_constraint=False,
+        db_index=False
+    )
+    expense_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'deleted_at']),
+            models.Index(fields=['deleted_at']),
+        ]
+
+    def __str__(self) -> str:
+        return f"Expense {self.expense_id} deleted at {self.deleted_at}"
+
+
+class Budget(models.Model):
+    """
+    Spending limit for one category over a recurring period.
+
+    ``spent`` is the total of the user's expenses in the category dated
+    within [period_start, period_end). It is kept up to date by the
+    Expense signal handlers and moved to the new period on the first read
+    after the period ends; ``manage.py reconcile_budgets`` fixes drift.
+    """
+    PERIOD_CHOICES = [
+        ('week', 'Week'),
+        ('month', 'Month'),
+        ('year', 'Year'),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='budgets',
+        db_index=False
+    )
+    category = models.ForeignKey(
+        ExpenseCategory,
+        on_delete=models.CASCADE,
+        related_name='budgets'
+    )
+    period = models.CharField(
+        max_length=10,
+        choices=PERIOD_CHOICES,
+        default='month'
+    )
+    amount = models.DecimalField(
+        max_digits=12,
+        decimal_places=2
+    )
+    spent = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0
+    )
+    period_start = models.DateField()
+    period_end = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['category__name', 'period']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'category', 'period'],
+                name='unique_budget_per_period'
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.category_id} {self.period}: {self.spent}/{self.amount}"
+
+    @property
+    def remaining(self):
+        return self.amount - self.spent
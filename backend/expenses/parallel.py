@@ -0,0 +1,115 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import close_old_connections, connection, connections
+from django.dispatch import receiver
+
+from .metrics import current_recorder, record_queries
+
+
+DEFAULT_REPORT_BATCH = {
+    # Threads, each with its own database connection, per process
+    'WORKERS': 4,
+}
+
+
+def get_batch_settings():
+    return {
+        **DEFAULT_REPORT_BATCH,
+        **getattr(settings, 'REPORT_BATCH', {}),
+    }
+
+
+class QueryExecutor:
+    """
+    Bounded thread pool for running independent read queries concurrently.
+
+    Worker threads are long-lived and treat each task like a request: old
+    or broken connections are closed before and after it, so connections
+    are reused as ``CONN_MAX_AGE`` (or the connection pool) allows. Its
+    queries count towards the request metrics of the caller.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix='query-executor'
+                    )
+        return self._executor
+
+    def _run(self, function, recorder):
+        close_old_connections()
+        try:
+            with record_queries(recorder):
+                return function()
+        finally:
+            close_old_connections()
+
+    def map(self, functions):
+        """
+        Call every function concurrently; return their results in order.
+
+        Inside a transaction they run one after the other on this thread's
+        connection instead, as other connections couldn't see its
+        uncommitted rows. The first exception raised is re-raised.
+        """
+        if len(functions) < 2 or connection.in_atomic_block:
+            return [function() for function in functions]
+        recorder = current_recorder.get()
+        futures = [
+            self.executor.submit(self._run, function, recorder)
+            for function in functions
+        ]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """Close the worker threads' connections and stop the threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        # One task per thread: each waits until all threads hold one
+        barrier = threading.Barrier(self.max_workers)
+
+        def close_connections():
+            barrier.wait()
+            connections.close_all()
+
+        wait([
+            executor.submit(close_connections)
+            for _ in range(self.max_workers)
+        ])
+        executor.shutdown()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_query_executor():
+    """Return the process-wide executor configured by REPORT_BATCH."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = QueryExecutor(get_batch_settings()['WORKERS'])
+    return _executor
+
+
+@receiver(setting_changed)
+def reset_query_executor(setting, **kwargs):
+    """Rebuild the executor when its settings are overridden in tests."""
+    global _executor
+    if setting == 'REPORT_BATCH' and _executor is not None:
+        _executor.shutdown()
+        _executor = None
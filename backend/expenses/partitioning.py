@@ -0,0 +1,255 @@
+import re
+from datetime import date
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Expense
+
+
+INTERVALS = ('year', 'month')
+BOUND_PATTERN = re.compile(r"FROM \('([\d-]+)'\) TO \('([\d-]+)'\)")
+
+
+class PartitioningError(Exception):
+    pass
+
+
+def _quote(name):
+    return connection.ops.quote_name(name)
+
+
+def _table():
+    return Expense._meta.db_table
+
+
+def interval_start(day, interval):
+    """Return the first day of the interval containing ``day``."""
+    if interval == 'year':
+        return date(day.year, 1, 1)
+    return date(day.year, day.month, 1)
+
+
+def next_start(start, interval):
+    if interval == 'year':
+        return date(start.year + 1, 1, 1)
+    return date(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+def shift_interval(day, interval, count):
+    """Return the start of the interval ``count`` intervals after ``day``'s."""
+    start = interval_start(day, interval)
+    for _ in range(count):
+        start = next_start(start, interval)
+    return start
+
+
+def partition_name(start, interval):
+    if interval == 'year':
+        return f'{_table()}_p{start.year}'
+    return f'{_table()}_p{start.year}_{start.month:02d}'
+
+
+def default_partition_name():
+    return f'{_table()}_default'
+
+
+def is_partitioned():
+    """Whether the expense table is a partitioned table on this database."""
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table '
+            'WHERE partrelid = to_regclass(%s)',
+            [_table()]
+        )
+        return cursor.fetchone() is not None
+
+
+def partitions():
+    """Return (name, from, to) for each range partition, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) '
+            'FROM pg_inherits JOIN pg_class child '
+            'ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = to_regclass(%s)',
+            [_table()]
+        )
+        rows = cursor.fetchall()
+    bounds = []
+    for name, bound in rows:
+        match = BOUND_PATTERN.search(bound)
+        if match:
+            bounds.append((
+                name,
+                date.fromisoformat(match.group(1)),
+                date.fromisoformat(match.group(2)),
+            ))
+    return sorted(bounds, key=lambda bound: bound[1])
+
+
+def add_partition(start, end, name):
+    """
+    Attach a [start, end) partition, moving matching rows out of the
+    default partition first (attaching fails while it still holds any).
+    """
+    table, default = _quote(_table()), _quote(default_partition_name())
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE {_quote(name)} '
+            f'(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+        cursor.execute(
+            f'WITH moved AS ('
+            f'DELETE FROM {default} WHERE date >= %s AND date < %s '
+            f'RETURNING *) '
+            f'INSERT INTO {_quote(name)} SELECT * FROM moved',
+            [start, end]
+        )
+        cursor.execute(
+            f'ALTER TABLE {table} ATTACH PARTITION {_quote(name)} '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+
+def create_partitions(through, interval=None):
+    """
+    Create the missing partitions after the newest one, up to and
+    including the interval containing ``through``. Returns their names.
+    """
+    interval = interval or settings.EXPENSE_PARTITION_INTERVAL
+    if interval not in INTERVALS:
+        raise PartitioningError(f'Unknown partition interval "{interval}".')
+    if not is_partitioned():
+        raise PartitioningError(
+            'The expense table is not partitioned; run partition_expenses.'
+        )
+
+    existing = partitions()
+    if existing:
+        start = existing[-1][2]
+    else:
+        start = interval_start(timezone.localdate(), interval)
+
+    created = []
+    while start <= through:
+        # The newest partition may be a different interval than requested
+        end = next_start(interval_start(start, interval), interval)
+        name = partition_name(start, interval)
+        add_partition(start, end, name)
+        created.append(name)
+        start = end
+    return created
+
+
+def partition_expense_table(interval=None, ahead=None):
+    """
+    Convert the expense table into one range-partitioned on ``date``.
+
+    Runs in one transaction holding an exclusive lock on the table: the
+    rows are copied into a new partitioned table (one partition per
+    interval from the oldest expense up to ``ahead`` intervals from now,
+    plus a default partition for anything outside), then the indexes and
+    foreign keys are recreated under their original names. The primary
+    key becomes (id, date), since PostgreSQL requires unique keys of a
+    partitioned table to include the partition column.
+    """
+    interval = interval or settings.EXPENSE_PARTITION_INTERVAL
+    ahead = settings.EXPENSE_PARTITIONS_AHEAD if ahead is None else ahead
+    if interval not in INTERVALS:
+        raise PartitioningError(f'Unknown partition interval "{interval}".')
+    if connection.vendor != 'postgresql':
+        raise PartitioningError('Partitioning needs PostgreSQL.')
+    if is_partitioned():
+        raise PartitioningError('The expense table is already partitioned.')
+
+    name = _table()
+    legacy = f'{name}_unpartitioned'
+    table, old = _quote(name), _quote(legacy)
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Fire deferred FK checks now; the old table can't be dropped with
+        # trigger events still pending on it.
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        cursor.execute(f'LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE')
+        # Definitions still naming the current table, replayed on the new one
+        cursor.execute(
+            'SELECT pg_get_indexdef(indexrelid) FROM pg_index '
+            'WHERE indrelid = to_regclass(%s) AND NOT indisprimary',
+            [name]
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            'SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint '
+            "WHERE conrelid = to_regclass(%s) AND contype IN ('f', 'p')",
+            [name]
+        )
+        constraints = cursor.fetchall()
+        cursor.execute(
+            'SELECT attidentity, pg_get_serial_sequence(%s, %s) '
+            'FROM pg_attribute '
+            'WHERE attrelid = to_regclass(%s) AND attname = %s',
+            [name, 'id', name, 'id']
+        )
+        identity, sequence = cursor.fetchone()
+        cursor.execute(f'SELECT MIN(date) FROM {table}')
+        oldest = cursor.fetchone()[0] or timezone.localdate()
+
+        cursor.execute(f'ALTER TABLE {table} RENAME TO {old}')
+        if identity:
+            # Free the name for the identity sequence of the new table
+            cursor.execute(
+                f'ALTER SEQUENCE {sequence} RENAME TO {_quote(legacy + "_id_seq")}'
+            )
+            cursor.execute(
+                f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS '
+                f'INCLUDING CONSTRAINTS INCLUDING IDENTITY) '
+                f'PARTITION BY RANGE (date)'
+            )
+        else:
+            cursor.execute(
+                f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS '
+                f'INCLUDING CONSTRAINTS) PARTITION BY RANGE (date)'
+            )
+            # Keep the serial sequence alive when the old table is dropped
+            cursor.execute(f'ALTER SEQUENCE {sequence} OWNED BY {table}.id')
+        cursor.execute(
+            f'CREATE TABLE {_quote(default_partition_name())} '
+            f'PARTITION OF {table} DEFAULT'
+        )
+
+        start = interval_start(oldest, interval)
+        through = shift_interval(timezone.localdate(), interval, ahead)
+        while start <= through:
+            end = next_start(start, interval)
+            cursor.execute(
+                f'CREATE TABLE {_quote(partition_name(start, interval))} '
+                f'PARTITION OF {table} FOR VALUES '
+                f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+            start = end
+
+        overriding = 'OVERRIDING SYSTEM VALUE ' if identity else ''
+        cursor.execute(f'INSERT INTO {table} {overriding}SELECT * FROM {old}')
+        cursor.execute(f'DROP TABLE {old}')
+
+        for constraint, definition in constraints:
+            if definition.startswith('PRIMARY KEY'):
+                definition = 'PRIMARY KEY (id, date)'
+            cursor.execute(
+                f'ALTER TABLE {table} ADD CONSTRAINT {_quote(constraint)} '
+                f'{definition}'
+            )
+        for definition in indexes:
+            cursor.execute(definition)
+
+        if identity:
+            cursor.execute(
+                f'SELECT setval(pg_get_serial_sequence(%s, %s), '
+                f'COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {table}',
+                [name, 'id']
+            )
+        cursor.execute(f'ANALYZE {table}')
+    return [partition for partition, _, _ in partitions()]
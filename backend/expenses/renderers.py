@@ -0,0 +1,117 @@
+import csv
+import decimal
+import io
+import json
+import math
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .metrics import prometheus_text
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decimals are written as pre-rendered fragments, which older orjson lacks
+if orjson is not None and not hasattr(orjson, 'Fragment'):
+    orjson = None
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Renderer selected by ``?format=csv``.
+
+    Exports stream their own body; this only renders small payloads such as
+    error responses, as a header row of keys and one row of values.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not isinstance(data, dict):
+            data = {'detail': data}
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(data.keys())
+        writer.writerow(data.values())
+        return buffer.getvalue().encode(self.charset)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Renderer selected by ``?format=ndjson`` (one JSON document per line)."""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return (json.dumps(data, default=str) + '\n').encode(self.charset)
+
+
+class PrometheusRenderer(BaseRenderer):
+    """Renders a metrics registry snapshot as Prometheus text."""
+    media_type = 'text/plain'
+    format = 'prometheus'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get('response')
+        if response is not None and response.exception:
+            return '\n'.join(f'{key}: {value}' for key, value in data.items())
+        return prometheus_text(data)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in ``JSONRenderer`` that serializes with orjson when installed.
+
+    Output is byte-identical to the stdlib renderer for the default
+    compact, unicode, strict settings: dates and times go through DRF's
+    encoder and Decimals are written with the float ``repr`` that
+    ``json.dumps`` uses. Two spellings differ and never occur in this
+    API's payloads: Python floats below 1e-4 or from 1e16 up are written
+    without an exponent or without its ``+``, and NaN or infinite floats
+    render as ``null`` instead of raising.
+
+    Indented output, other JSON settings or a missing/old orjson fall
+    back to the stdlib renderer.
+    """
+    encoder = JSONEncoder()
+
+    def default(self, obj):
+        if isinstance(obj, decimal.Decimal):
+            value = float(obj)
+            if not math.isfinite(value):
+                raise ValueError('Out of range float values are not JSON compliant')
+            return orjson.Fragment(float.__repr__(value))
+        return self.encoder.default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=self.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        )
+        # Same escaping as JSONRenderer, so the output is valid JavaScript
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+                b'\xe2\x80\xa9', b'\\u2029'
+            )
+        return ret
@@ -0,0 +1,185 @@
+import operator
+from collections import defaultdict
+from decimal import Decimal
+from functools import reduce
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, Q, Sum
+
+from .cache import get_report_cache
+from .models import Expense, ExpenseDailyRollup
+
+
+ROLLUP_FIELDS = ('user_id', 'category_id', 'date', 'amount')
+# Keys per INSERT ... ON CONFLICT statement (5 parameters each)
+UPSERT_BATCH_SIZE = 1000
+
+
+def expense_key(user_id, category_id, date):
+    """Build a normalized rollup key from raw expense field values."""
+    return (user_id, category_id, Expense._meta.get_field('date').to_python(date))
+
+
+def current_state(expense):
+    """Return the (key, amount) of an expense as it is about to be stored."""
+    key = expense_key(expense.user_id, expense.category_id, expense.date)
+    return key, Decimal(str(expense.amount))
+
+
+def loaded_state(expense):
+    """Return the (key, amount) of an expense as it was loaded from the DB."""
+    loaded = getattr(expense, '_loaded_values', None)
+    if not loaded or any(field not in loaded for field in ROLLUP_FIELDS):
+        return None
+    key = expense_key(loaded['user_id'], loaded['category_id'], loaded['date'])
+    return key, Decimal(str(loaded['amount']))
+
+
+def add_delta(deltas, state, sign):
+    """Accumulate one expense state into a {key: [amount, count]} dict."""
+    key, amount = state
+    deltas[key][0] += sign * amount
+    deltas[key][1] += sign
+
+
+def apply_deltas(deltas):
+    """
+    Apply accumulated (amount, count) deltas to the rollup table.
+
+    Existing rows are adjusted in the database (total + delta) so
+    concurrent writers don't lose updates; rows that drop to zero
+    expenses are removed. On PostgreSQL all keys go in one upsert.
+    """
+    deltas = {
+        key: (amount, count)
+        for key, (amount, count) in deltas.items()
+        if amount or count
+    }
+    if not deltas:
+        return
+    if connection.vendor == 'postgresql':
+        upsert_deltas(deltas)
+    else:
+        # No unique index to upsert against: SQLite skips covering ones
+        for key, delta in deltas.items():
+            apply_delta(key, delta)
+
+    emptied = [
+        Q(user_id=user_id, category_id=category_id, date=date)
+        for (user_id, category_id, date), (_, count) in deltas.items()
+        if count <= 0
+    ]
+    if emptied:
+        ExpenseDailyRollup.objects.filter(
+            reduce(operator.or_, emptied), count__lte=0
+        ).delete()
+
+
+def upsert_deltas(deltas):
+    """
+    Add deltas to their rollup rows with INSERT ... ON CONFLICT, creating
+    missing rows; one statement per ``UPSERT_BATCH_SIZE`` keys.
+    """
+    quote = connection.ops.quote_name
+    table = quote(ExpenseDailyRollup._meta.db_table)
+    columns = [
+        quote(ExpenseDailyRollup._meta.get_field(name).column)
+        for name in ('user', 'category', 'date', 'total', 'count')
+    ]
+    user, category, date, total, count = columns
+    items = list(deltas.items())
+    with connection.cursor() as cursor:
+        for start in range(0, len(items), UPSERT_BATCH_SIZE):
+            batch = items[start:start + UPSERT_BATCH_SIZE]
+            values = ', '.join(['(%s, %s, %s, %s, %s)'] * len(batch))
+            cursor.execute(
+                f'INSERT INTO {table} ({", ".join(columns)}) '
+                f'VALUES {values} '
+                f'ON CONFLICT ({user}, {category}, {date}) DO UPDATE SET '
+                f'{total} = {table}.{total} + EXCLUDED.{total}, '
+                f'{count} = {table}.{count} + EXCLUDED.{count}',
+                [
+                    value
+                    for (user_id, category_id, day), (amount, delta) in batch
+                    for value in (user_id, category_id, day, amount, delta)
+                ]
+            )
+
+
+def apply_delta(key, delta):
+    """Add one key's delta with an F() update, creating the row if missing."""
+    (user_id, category_id, date), (amount, count) = key, delta
+    rows = ExpenseDailyRollup.objects.filter(
+        user_id=user_id,
+        category_id=category_id,
+        date=date
+    )
+    if rows.update(total=F('total') + amount, count=F('count') + count):
+        return
+    if count <= 0:
+        # Nothing to subtract from (e.g. the user is being deleted)
+        return
+    try:
+        with transaction.atomic():
+            ExpenseDailyRollup.objects.create(
+                user_id=user_id,
+                category_id=category_id,
+                date=date,
+                total=amount,
+                count=count
+            )
+    except IntegrityError:
+        # Another writer created the row first
+        rows.update(total=F('total') + amount, count=F('count') + count)
+
+
+def record_change(old_state=None, new_state=None):
+    """
+    Move one expense's contribution from its old to its new rollup row.
+
+    Returns the applied deltas, for other counters kept the same way.
+    """
+    deltas = defaultdict(lambda: [Decimal('0'), 0])
+    if old_state is not None:
+        add_delta(deltas, old_state, -1)
+    if new_state is not None:
+        add_delta(deltas, new_state, 1)
+    apply_deltas(deltas)
+    return deltas
+
+
+def rebuild_rollups(user_ids=None, batch_size=1000):
+    """Recompute rollups from the expense table, optionally for some users."""
+    expenses = Expense.objects.all()
+    rollups = ExpenseDailyRollup.objects.all()
+    if user_ids is not None:
+        expenses = expenses.filter(user_id__in=user_ids)
+        rollups = rollups.filter(user_id__in=user_ids)
+
+    # COUNT(*) rather than COUNT(id) keeps this an index-only scan
+    rows = expenses.values('user_id', 'category_id', 'date').annotate(
+        total=Sum('amount'),
+        count=Count('*')
+    ).order_by()
+
+    created = 0
+    with transaction.atomic():
+        rollups.delete()
+        batch = []
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.append(ExpenseDailyRollup(**row))
+            if len(batch) >= batch_size:
+                ExpenseDailyRollup.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+        if batch:
+            ExpenseDailyRollup.objects.bulk_create(batch)
+            created += len(batch)
+
+    report_cache = get_report_cache()
+    if user_ids is None:
+        report_cache.invalidate_all()
+    else:
+        for user_id in user_ids:
+            report_cache.invalidate_user(user_id)
+    return created
@@ -1,6 +1,13 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from .models import Expense, ExpenseCategory
+from django.db.models import F
+from django.utils import timezone
+from .budgets import start_period
+from .bulk import BULK_MAX_ITEMS
+from .categories import get_category_catalog
+from .forecast import parse_forecast_params
+from .models import Budget, Expense, ExpenseCategory
+from .reports import BATCH_MAX_REPORTS, BATCH_REPORT_TYPES, parse_granularity
 
 
 class ExpenseCategorySerializer(serializers.ModelSerializer):
@@ -12,10 +19,33 @@ class ExpenseCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class CategoryIdField(serializers.PrimaryKeyRelatedField):
+    """
+    Category ID field resolved without a query where possible: from a
+    preloaded ``categories`` context map, else from the category catalog.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        categories = self.context.get('categories')
+        if categories is not None:
+            category = categories.get(pk)
+        else:
+            category = get_category_catalog().get(pk)
+        if category is None:
+            self.fail('does_not_exist', pk_value=data)
+        return category
+
+
 class ExpenseSerializer(serializers.ModelSerializer):
     """Serializer for Expense model."""
     category = ExpenseCategorySerializer(read_only=True)
-    category_id = serializers.PrimaryKeyRelatedField(
+    category_id = CategoryIdField(
         queryset=ExpenseCategory.objects.all(),
         source='category',
         write_only=True
@@ -60,3 +90,209 @@ class ExpenseListSerializer(serializers.ModelSerializer):
             'date',
             'created_at',
         ]
+
+
+def expense_list_values(queryset):
+    """Select just the ExpenseListSerializer columns as ``values()`` rows."""
+    return queryset.annotate(category_name=F('category__name')).values(
+        *ExpenseListSerializer.Meta.fields
+    )
+
+
+def represent_expense_rows(rows):
+    """
+    Format ``expense_list_values`` rows exactly like
+    ``ExpenseListSerializer(many=True).data``.
+
+    The serializer's fields are bound once instead of being walked for
+    every row; ids and text columns are already in their output form.
+    """
+    fields = ExpenseListSerializer().fields
+    amount = fields['amount'].to_representation
+    date = fields['date'].to_representation
+    created_at = fields['created_at'].to_representation
+    return [
+        {
+            'id': row['id'],
+            'amount': amount(row['amount']),
+            'description': row['description'],
+            'category_name': row['category_name'],
+            'date': date(row['date']),
+            'created_at': created_at(row['created_at']),
+        }
+        for row in rows
+    ]
+
+
+class ExpenseBulkListSerializer(serializers.ListSerializer):
+    """List serializer resolving every item's category at once."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            category_ids = set()
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                try:
+                    category_ids.add(int(item.get('category_id')))
+                except (TypeError, ValueError):
+                    continue
+            self.context['categories'] = get_category_catalog().in_bulk(
+                category_ids
+            )
+        return super().to_internal_value(data)
+
+
+class ExpenseBulkSerializer(ExpenseSerializer):
+    """Serializer for items of bulk expense writes."""
+    id = serializers.IntegerField(required=False)
+
+    class Meta(ExpenseSerializer.Meta):
+        list_serializer_class = ExpenseBulkListSerializer
+        read_only_fields = ['user', 'created_at', 'updated_at']
+
+
+class ExpenseBulkDeleteSerializer(serializers.Serializer):
+    """Serializer for bulk expense deletion."""
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=BULK_MAX_ITEMS
+    )
+
+
+class BudgetSerializer(serializers.ModelSerializer):
+    """Serializer for Budget model."""
+    category_id = CategoryIdField(
+        queryset=ExpenseCategory.objects.all(),
+        source='category'
+    )
+    category_name = serializers.CharField(source='category.name', read_only=True)
+    remaining = serializers.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        read_only=True
+    )
+
+    class Meta:
+        model = Budget
+        fields = [
+            'id',
+            'category_id',
+            'category_name',
+            'period',
+            'amount',
+            'spent',
+            'remaining',
+            'period_start',
+            'period_end',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = [
+            'id',
+            'spent',
+            'period_start',
+            'period_end',
+            'created_at',
+            'updated_at',
+        ]
+
+    def validate_amount(self, value):
+        """Validate that amount is positive."""
+        if value <= 0:
+            raise serializers.ValidationError(
+                "Amount must be greater than zero."
+            )
+        return value
+
+    def validate(self, attrs):
+        category = attrs.get('category', getattr(self.instance, 'category', None))
+        period = attrs.get('period', getattr(self.instance, 'period', 'month'))
+        duplicates = Budget.objects.filter(
+            user=self.context['request'].user,
+            category=category,
+            period=period
+        )
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError(
+                "A budget for this category and period already exists."
+            )
+        return attrs
+
+    def create(self, validated_data):
+        budget = Budget(**validated_data)
+        start_period(budget)
+        budget.save()
+        return budget
+
+    def update(self, instance, validated_data):
+        recount = any(
+            field in validated_data
+            and validated_data[field] != getattr(instance, field)
+            for field in ('category', 'period')
+        )
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if recount:
+            start_period(instance)
+        instance.save()
+        return instance
+
+
+class BudgetStatusSerializer(BudgetSerializer):
+    """Budget with how much of it is used and how long the period lasts."""
+    percent_used = serializers.SerializerMethodField()
+    days_left = serializers.SerializerMethodField()
+
+    class Meta(BudgetSerializer.Meta):
+        fields = BudgetSerializer.Meta.fields + ['percent_used', 'days_left']
+
+    def get_percent_used(self, budget):
+        return round(float(budget.spent / budget.amount * 100), 1)
+
+    def get_days_left(self, budget):
+        return (budget.period_end - timezone.localdate()).days
+
+
+class ReportSpecSerializer(serializers.Serializer):
+    """
+    One report of a batch: its type and that report endpoint's parameters.
+
+    Validates to ``{'type': ..., 'params': {name: string}}``, the params
+    as the endpoint would receive them in its query string.
+    """
+    type = serializers.ChoiceField(choices=BATCH_REPORT_TYPES)
+    category = serializers.CharField(required=False, allow_blank=True)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    description = serializers.CharField(required=False, allow_blank=True)
+    # timeseries and forecast
+    granularity = serializers.CharField(required=False)
+    # forecast
+    model = serializers.CharField(required=False)
+    horizon = serializers.CharField(required=False)
+    history = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        report_type = attrs.pop('type')
+        params = {
+            name: value.isoformat() if hasattr(value, 'isoformat') else value
+            for name, value in attrs.items()
+        }
+        if report_type == 'timeseries':
+            parse_granularity(params)
+        elif report_type == 'forecast':
+            parse_forecast_params(params)
+        return {'type': report_type, 'params': params}
+
+
+class ReportBatchSerializer(serializers.Serializer):
+    """Serializer for a batch of reports."""
+    reports = ReportSpecSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=BATCH_MAX_REPORTS
+    )
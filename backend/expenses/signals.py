@@ -0,0 +1,168 @@
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import budgets, rollups
+from .authentication import forget_cached_user
+from .cache import get_report_cache
+from .categories import get_category_catalog
+from .models import Expense, ExpenseCategory, ExpenseTombstone
+
+
+_bulk_writes = threading.local()
+
+
+@contextmanager
+def bulk_expense_writes():
+    """
+    Suspend the per-row Expense handlers in this thread.
+
+    Callers must report what they wrote through ``record_bulk_changes``
+    so rollups, budgets, cached reports and tombstones are updated once
+    per batch.
+    """
+    previous = getattr(_bulk_writes, 'active', False)
+    _bulk_writes.active = True
+    try:
+        yield
+    finally:
+        _bulk_writes.active = previous
+
+
+def handlers_suspended():
+    return getattr(_bulk_writes, 'active', False)
+
+
+def record_bulk_changes(created=(), updated=(), deleted=()):
+    """
+    Apply the per-row signal side effects for a batch of expenses.
+
+    ``updated`` and ``deleted`` instances must have been loaded from the DB
+    so their previous values are known.
+    """
+    deltas = defaultdict(lambda: [Decimal('0'), 0])
+    user_ids = set()
+    for expense in created:
+        rollups.add_delta(deltas, rollups.current_state(expense), 1)
+    for expense in updated:
+        rollups.add_delta(deltas, rollups.loaded_state(expense), -1)
+        rollups.add_delta(deltas, rollups.current_state(expense), 1)
+        user_ids.add(expense._loaded_values['user_id'])
+    for expense in deleted:
+        state = rollups.loaded_state(expense) or rollups.current_state(expense)
+        rollups.add_delta(deltas, state, -1)
+    rollups.apply_deltas(deltas)
+    budgets.apply_deltas(deltas)
+
+    for expense in (*created, *updated):
+        expense._loaded_values = {
+            'user_id': expense.user_id,
+            'category_id': expense.category_id,
+            'date': expense.date,
+            'amount': expense.amount,
+        }
+
+    if deleted:
+        ExpenseTombstone.objects.bulk_create(
+            ExpenseTombstone(user_id=expense.user_id, expense_id=expense.pk)
+            for expense in deleted
+        )
+
+    report_cache = get_report_cache()
+    user_ids.update(
+        expense.user_id for expense in (*created, *updated, *deleted)
+    )
+    for user_id in user_ids:
+        report_cache.invalidate_user(user_id)
+
+
+@receiver(post_save, sender=Expense)
+@receiver(post_delete, sender=Expense)
+def invalidate_user_reports(sender, instance, **kwargs):
+    """Drop cached reports of the user owning a changed expense."""
+    if handlers_suspended():
+        return
+    report_cache = get_report_cache()
+    report_cache.invalidate_user(instance.user_id)
+    loaded = getattr(instance, '_loaded_values', None) or {}
+    if loaded.get('user_id', instance.user_id) != instance.user_id:
+        report_cache.invalidate_user(loaded['user_id'])
+
+
+@receiver(post_save, sender=ExpenseCategory)
+@receiver(post_delete, sender=ExpenseCategory)
+def invalidate_all_reports(sender, instance, **kwargs):
+    """Drop every cached report, since they all embed category names."""
+    get_report_cache().invalidate_all()
+
+
+@receiver(post_save, sender=ExpenseCategory)
+@receiver(post_delete, sender=ExpenseCategory)
+def invalidate_category_catalog(sender, instance, **kwargs):
+    """Make every process reload its category catalog."""
+    get_category_catalog().invalidate()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, update_fields=None, **kwargs):
+    """Drop the user cached for JWT authentication."""
+    # Logins only update last_login, which authentication doesn't use
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    forget_cached_user(instance.pk)
+
+
+@receiver(pre_save, sender=Expense)
+def remember_stored_expense(sender, instance, **kwargs):
+    """Load the stored values of an expense that wasn't read from the DB."""
+    if handlers_suspended() or instance.pk is None:
+        return
+    if hasattr(instance, '_loaded_values'):
+        return
+    stored = sender.objects.filter(pk=instance.pk).values(
+        *rollups.ROLLUP_FIELDS
+    ).first()
+    if stored is not None:
+        instance._loaded_values = stored
+
+
+@receiver(post_save, sender=Expense)
+def update_rollups_on_save(sender, instance, created, **kwargs):
+    """Keep rollups and budgets in sync when an expense is created or edited."""
+    if handlers_suspended():
+        return
+    old_state = None if created else rollups.loaded_state(instance)
+    new_state = rollups.current_state(instance)
+    budgets.apply_deltas(rollups.record_change(old_state, new_state))
+    instance._loaded_values = {
+        'user_id': instance.user_id,
+        'category_id': instance.category_id,
+        'date': new_state[0][2],
+        'amount': new_state[1],
+    }
+
+
+@receiver(post_delete, sender=Expense)
+def update_rollups_on_delete(sender, instance, **kwargs):
+    """Remove a deleted expense from its daily rollup and budgets."""
+    if handlers_suspended():
+        return
+    state = rollups.loaded_state(instance) or rollups.current_state(instance)
+    budgets.apply_deltas(rollups.record_change(old_state=state))
+
+
+@receiver(post_delete, sender=Expense)
+def record_tombstone(sender, instance, **kwargs):
+    """Remember the deleted expense so syncing clients can drop it."""
+    if handlers_suspended():
+        return
+    ExpenseTombstone.objects.create(
+        user_id=instance.user_id,
+        expense_id=instance.pk
+    )
@@ -0,0 +1,196 @@
+import base64
+import binascii
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import ExpenseTombstone
+
+
+# Rows committed by a transaction that started before a sync can carry an
+# updated_at slightly older than the sync itself. Tokens point this far
+# back so such rows are re-sent (clients apply changes idempotently)
+# instead of being missed.
+SYNC_OVERLAP = timedelta(minutes=1)
+
+
+# Changed expenses (and, separately, deletions) per page of a sync
+SYNC_PAGE_SIZE = 500
+SYNC_MAX_PAGE_SIZE = 1000
+
+
+class InvalidSyncToken(ValueError):
+    pass
+
+
+class SyncCursor:
+    """
+    Where a sync stands: changes from ``since`` (None for a full sync),
+    past the last changed expense and tombstone already sent, as
+    ``(timestamp, id)`` pairs. ``until`` is the token to hand out once
+    the last page is sent, fixed when the sync started.
+    """
+
+    def __init__(self, since=None, until=None, changed_after=None,
+                 deleted_after=None):
+        self.since = since
+        self.until = until
+        self.changed_after = changed_after
+        self.deleted_after = deleted_after
+
+    @property
+    def first_page(self):
+        return self.changed_after is None and self.deleted_after is None
+
+
+class SyncPage:
+    """One page of a sync: changed expenses, deleted IDs and the next token."""
+
+    def __init__(self, changed, deleted, token, has_more, first):
+        self.changed = changed
+        self.deleted = deleted
+        self.token = token
+        self.has_more = has_more
+        # Whether this page starts the sync
+        self.first = first
+
+
+def tombstone_retention():
+    return timedelta(days=settings.EXPENSE_TOMBSTONE_RETENTION_DAYS)
+
+
+def _encode(raw):
+    return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+
+
+def encode_token(moment):
+    """Return an opaque sync token for a point in time."""
+    return _encode(moment.isoformat())
+
+
+def _encode_position(position):
+    return position and [position[0].isoformat(), position[1]]
+
+
+def encode_cursor(cursor):
+    """Return an opaque token continuing a sync at ``cursor``."""
+    return _encode(json.dumps({
+        'since': cursor.since and cursor.since.isoformat(),
+        'until': cursor.until.isoformat(),
+        'changed_after': _encode_position(cursor.changed_after),
+        'deleted_after': _encode_position(cursor.deleted_after),
+    }))
+
+
+def _parse_moment(value):
+    moment = parse_datetime(value) if isinstance(value, str) else None
+    if moment is None or timezone.is_naive(moment):
+        raise InvalidSyncToken('Invalid sync token.')
+    return moment
+
+
+def _parse_position(value):
+    if value is None:
+        return None
+    moment, pk = value
+    if not isinstance(pk, int):
+        raise InvalidSyncToken('Invalid sync token.')
+    return _parse_moment(moment), pk
+
+
+def decode_token(token):
+    """Return the ``SyncCursor`` encoded in a sync or continuation token."""
+    try:
+        raw = base64.urlsafe_b64decode(token.encode('ascii')).decode('ascii')
+        if not raw.startswith('{'):
+            return SyncCursor(since=_parse_moment(raw))
+        data = json.loads(raw)
+        return SyncCursor(
+            since=data['since'] and _parse_moment(data['since']),
+            until=_parse_moment(data['until']),
+            changed_after=_parse_position(data['changed_after']),
+            deleted_after=_parse_position(data['deleted_after']),
+        )
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise InvalidSyncToken('Invalid sync token.')
+
+
+def token_expired(since):
+    """Whether deletions before ``since`` may already have been purged."""
+    return since < timezone.now() - tombstone_retention()
+
+
+def _after(queryset, field, position):
+    """Keyset filter: rows ordered after ``position`` by (field, id)."""
+    if position is None:
+        return queryset
+    moment, pk = position
+    return queryset.filter(
+        Q(**{f'{field}__gt': moment}) | Q(**{field: moment, 'id__gt': pk})
+    )
+
+
+def changes_since(queryset, user, cursor=None, limit=SYNC_PAGE_SIZE):
+    """
+    Return the next ``SyncPage`` of changes after ``cursor``.
+
+    Without a cursor (or one without ``since``) every expense is
+    returned, for an initial sync. Each page holds up to ``limit``
+    changed expenses and ``limit`` deleted IDs; while ``has_more`` is
+    set, its token continues the same sync.
+    """
+    cursor = cursor or SyncCursor()
+    until = cursor.until or timezone.now() - SYNC_OVERLAP
+
+    changed = queryset
+    if cursor.since is not None:
+        changed = changed.filter(updated_at__gte=cursor.since)
+    changed = list(
+        _after(changed, 'updated_at', cursor.changed_after)
+        .order_by('updated_at', 'id')[:limit + 1]
+    )
+
+    tombstones = []
+    if cursor.since is not None:
+        tombstones = list(
+            _after(
+                ExpenseTombstone.objects.filter(
+                    user=user,
+                    deleted_at__gte=cursor.since
+                ),
+                'deleted_at',
+                cursor.deleted_after
+            ).order_by('deleted_at', 'id').values_list(
+                'deleted_at', 'id', 'expense_id'
+            )[:limit + 1]
+        )
+
+    has_more = len(changed) > limit or len(tombstones) > limit
+    changed, tombstones = changed[:limit], tombstones[:limit]
+    deleted = list(dict.fromkeys(expense_id for *_, expense_id in tombstones))
+    if not has_more:
+        token = encode_token(until)
+    else:
+        token = encode_cursor(SyncCursor(
+            since=cursor.since,
+            until=until,
+            changed_after=(
+                (changed[-1].updated_at, changed[-1].pk) if changed
+                else cursor.changed_after
+            ),
+            deleted_after=(
+                tombstones[-1][:2] if tombstones else cursor.deleted_after
+            ),
+        ))
+    return SyncPage(changed, deleted, token, has_more, cursor.first_page)
+
+
+def purge_tombstones(older_than=None):
+    """Delete tombstones past the retention period."""
+    cutoff = timezone.now() - (older_than or tombstone_retention())
+    deleted, _ = ExpenseTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,125 @@
+from datetime import date
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth.models import User
+from django.test import AsyncClient, TestCase
+from django.urls import resolve, reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from expenses.metrics import registry
+from expenses.models import Expense, ExpenseCategory
+
+
+class AsyncViewTests(TestCase):
+    """Test cases for the read endpoints served over ASGI."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.category = ExpenseCategory.objects.create(name='Food')
+        for day in range(1, 4):
+            Expense.objects.create(
+                user=self.user,
+                amount='12.50',
+                description=f'Lunch {day}',
+                category=self.category,
+                date=date(2026, 1, day)
+            )
+        self.client = AsyncClient()
+        self.token = str(AccessToken.for_user(self.user))
+        registry.clear()
+
+    async def get(self, url, params=None, headers=None):
+        headers = {'authorization': f'Bearer {self.token}', **(headers or {})}
+        return await self.client.get(url, params, headers=headers)
+
+    def test_read_actions_are_coroutines(self):
+        for name in ('expense-list', 'category-list', 'report-summary'):
+            self.assertTrue(iscoroutinefunction(resolve(reverse(name)).func))
+        self.assertFalse(iscoroutinefunction(
+            resolve(reverse('expense-detail', kwargs={'pk': 1})).func
+        ))
+
+    async def test_expense_list(self):
+        response = await self.get(reverse('expense-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 3)
+        self.assertEqual(
+            [row['description'] for row in response.json()['results']],
+            ['Lunch 3', 'Lunch 2', 'Lunch 1']
+        )
+        self.assertEqual(response.json()['results'][0]['category_name'], 'Food')
+        self.assertIn('ETag', response)
+
+        not_modified = await self.get(
+            reverse('expense-list'), headers={'if-none-match': response['ETag']}
+        )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_expense_list_cursor(self):
+        response = await self.get(
+            reverse('expense-list'), {'pagination': 'cursor', 'page_size': 2}
+        )
+        self.assertEqual(len(response.json()['results']), 2)
+        response = await self.get(response.json()['next'])
+        self.assertEqual(
+            [row['description'] for row in response.json()['results']],
+            ['Lunch 1']
+        )
+        self.assertIsNone(response.json()['next'])
+
+    async def test_invalid_page(self):
+        response = await self.get(reverse('expense-list'), {'page': 9})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_category_list(self):
+        response = await self.get(reverse('category-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [category['name'] for category in response.json()['results']],
+            ['Food']
+        )
+
+    async def test_summary(self):
+        params = {'date_from': '2026-01-01', 'date_to': '2026-01-10'}
+        response = await self.get(reverse('report-summary'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['total_amount'], 37.5)
+        self.assertEqual(response.json()['total_count'], 3)
+        self.assertEqual(response.json()['average_daily'], 3.75)
+
+        cached = await self.get(
+            reverse('report-summary'), params, headers={'if-none-match': response['ETag']}
+        )
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_unauthenticated(self):
+        response = await AsyncClient().get(reverse('expense-list'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn('WWW-Authenticate', response)
+
+    async def test_sync_actions_on_the_same_route(self):
+        response = await self.client.post(reverse('expense-list'), {
+            'amount': '5.00',
+            'description': 'Coffee',
+            'category_id': self.category.id,
+            'date': '2026-01-04',
+        }, content_type='application/json', headers={
+            'authorization': f'Bearer {self.token}',
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        count = await sync_to_async(
+            Expense.objects.filter(user=self.user).count
+        )()
+        self.assertEqual(count, 4)
+
+    async def test_metrics_count_async_queries(self):
+        response = await self.get(reverse('expense-list'))
+        self.assertRegex(response['Server-Timing'], r'desc="[1-9]\d* queries"')
+        snapshot = registry.snapshot()
+        self.assertEqual(
+            snapshot['ExpenseViewSet.list']['queries']['count'], 1
+        )
@@ -1,7 +1,22 @@
+from datetime import date
+from unittest import mock
+
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import AccessToken
+
+from expenses.authentication import (
+    CachedJWTAuthentication,
+    StatelessJWTAuthentication,
+    user_cache_key,
+)
+from expenses.models import Expense, ExpenseCategory
 
 
 class AuthenticationTests(APITestCase):
@@ -81,3 +96,189 @@ class AuthenticationTests(APITestCase):
         response = self.client.post(self.refresh_url, {}, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TokenUserMixin:
+    """Log in through the API and read the expense list with the token."""
+
+    authentication_class = None
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.category = ExpenseCategory.objects.create(name='Food')
+        Expense.objects.create(
+            user=self.user,
+            amount='12.50',
+            description='Lunch',
+            category=self.category,
+            date=date(2026, 1, 1)
+        )
+        other = User.objects.create_user(username='other', password='pass')
+        Expense.objects.create(
+            user=other,
+            amount='99.00',
+            description='Not mine',
+            category=self.category,
+            date=date(2026, 1, 1)
+        )
+        cache.delete(user_cache_key(self.user.pk))
+        patcher = mock.patch.object(
+            APIView, 'authentication_classes', [self.authentication_class]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def login(self, user=None):
+        if user is not None:
+            token = str(AccessToken.for_user(user))
+        else:
+            token = self.client.post(reverse('token_obtain_pair'), {
+                'username': 'testuser',
+                'password': 'testpass123'
+            }, format='json').data['access']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def user_queries(self, url=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url or reverse('expense-list'))
+        queries = [
+            query['sql'] for query in context.captured_queries
+            if 'FROM "auth_user"' in query['sql']
+        ]
+        return response, queries
+
+
+class CachedJWTAuthenticationTests(TokenUserMixin, APITestCase):
+    """Test cases for JWT authentication with cached users."""
+
+    authentication_class = CachedJWTAuthentication
+
+    def test_user_loaded_once(self):
+        self.login()
+        response, queries = self.user_queries()
+        self.assertEqual(len(queries), 1)
+        response, queries = self.user_queries()
+        self.assertEqual(queries, [])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row['description'] for row in response.json()['results']],
+            ['Lunch']
+        )
+
+    def test_user_changes_apply_at_once(self):
+        self.login()
+        self.user_queries()
+        response, _ = self.user_queries(reverse('report-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response, _ = self.user_queries(reverse('report-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.user.is_active = False
+        self.user.save()
+        response, _ = self.user_queries()
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_user(self):
+        self.login()
+        self.user_queries()
+        self.user.delete()
+        response, _ = self.user_queries()
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class StatelessJWTAuthenticationTests(TokenUserMixin, APITestCase):
+    """Test cases for JWT authentication from the token's claims."""
+
+    authentication_class = StatelessJWTAuthentication
+
+    def test_no_user_queries(self):
+        self.login()
+        response, queries = self.user_queries()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(queries, [])
+        self.assertEqual(
+            [row['description'] for row in response.json()['results']],
+            ['Lunch']
+        )
+
+    def test_no_user_queries_serializing_expenses(self):
+        self.login()
+        expense = Expense.objects.get(user=self.user)
+        requests = {
+            'retrieve': lambda: self.client.get(
+                reverse('expense-detail', kwargs={'pk': expense.pk})
+            ),
+            'create': lambda: self.client.post(reverse('expense-list'), {
+                'amount': '5.00',
+                'description': 'Coffee',
+                'category_id': self.category.id,
+                'date': '2026-01-02',
+            }, format='json'),
+            'bulk': lambda: self.client.patch(reverse('expense-bulk'), [
+                {'id': expense.pk, 'description': 'Dinner'},
+            ], format='json'),
+            'changes': lambda: self.client.get(reverse('expense-changes')),
+        }
+        for name, request in requests.items():
+            with self.subTest(name):
+                with CaptureQueriesContext(connection) as context:
+                    response = request()
+                self.assertLess(response.status_code, 300)
+                self.assertEqual([
+                    query['sql'] for query in context.captured_queries
+                    if 'FROM "auth_user"' in query['sql']
+                ], [])
+                body = response.json()
+                row = body['changed'][0] if name == 'changes' else (
+                    body[0] if name == 'bulk' else body
+                )
+                self.assertEqual(row['user'], 'testuser')
+
+    def test_writes_use_the_token_user(self):
+        self.login()
+        response = self.client.post(reverse('expense-list'), {
+            'amount': '5.00',
+            'description': 'Coffee',
+            'category_id': self.category.id,
+            'date': '2026-01-02',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            Expense.objects.get(pk=response.data['id']).user, self.user
+        )
+
+    def test_staff_claim(self):
+        self.login()
+        response, _ = self.user_queries(reverse('report-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        # Tokens issued before keep the claims they were issued with
+        response, _ = self.user_queries(reverse('report-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.login()
+        response, queries = self.user_queries(reverse('report-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(queries, [])
+
+    def test_token_without_claims(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.login(self.user)
+        response, _ = self.user_queries()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response, _ = self.user_queries(reverse('report-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_deferred_fields_are_loaded(self):
+        token = AccessToken.for_user(self.user)
+        user = StatelessJWTAuthentication().get_user(token)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.username, 'testuser')
@@ -0,0 +1,220 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from expenses.budgets import period_bounds
+from expenses.models import Budget, Expense, ExpenseCategory
+
+
+class PeriodBoundsTests(APITestCase):
+    """Test cases for budget period boundaries."""
+
+    def test_period_bounds(self):
+        day = date(2025, 12, 17)  # a Wednesday
+        self.assertEqual(
+            period_bounds('week', day), (date(2025, 12, 15), date(2025, 12, 22))
+        )
+        self.assertEqual(
+            period_bounds('month', day), (date(2025, 12, 1), date(2026, 1, 1))
+        )
+        self.assertEqual(
+            period_bounds('year', day), (date(2025, 1, 1), date(2026, 1, 1))
+        )
+
+
+class BudgetTests(APITestCase):
+    """Test cases for budget endpoints and counters."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='user2',
+            password='testpass123'
+        )
+        self.food = ExpenseCategory.objects.create(name='Food')
+        self.transport = ExpenseCategory.objects.create(name='Transport')
+        self.today = timezone.localdate()
+        self.expense = self.create_expense('40.00')
+        self.client.force_authenticate(user=self.user)
+        self.list_url = reverse('budget-list')
+        self.status_url = reverse('budget-status')
+
+    def create_expense(self, amount, category=None, day=None, user=None):
+        return Expense.objects.create(
+            user=user or self.user,
+            amount=amount,
+            description='Groceries',
+            category=category or self.food,
+            date=day or self.today
+        )
+
+    def create_budget(self, amount='100.00', category=None, period='month'):
+        response = self.client.post(self.list_url, {
+            'category_id': (category or self.food).id,
+            'amount': amount,
+            'period': period,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Budget.objects.get(pk=response.data['id'])
+
+    def assertSpent(self, budget, amount):
+        budget.refresh_from_db()
+        self.assertEqual(budget.spent, Decimal(amount))
+
+    def test_create_budget_counts_existing_expenses(self):
+        budget = self.create_budget()
+
+        self.assertSpent(budget, '40.00')
+        start, end = period_bounds('month', self.today)
+        self.assertEqual((budget.period_start, budget.period_end), (start, end))
+
+    def test_counters_follow_expense_changes(self):
+        budget = self.create_budget()
+        expense = self.create_expense('10.00')
+        self.assertSpent(budget, '50.00')
+
+        expense.amount = Decimal('15.00')
+        expense.save()
+        self.assertSpent(budget, '55.00')
+
+        expense.category = self.transport
+        expense.save()
+        self.assertSpent(budget, '40.00')
+
+        self.expense.date = self.today - timedelta(days=400)
+        self.expense.save()
+        self.assertSpent(budget, '0.00')
+
+        self.expense.date = self.today
+        self.expense.save()
+        self.expense.delete()
+        self.assertSpent(budget, '0.00')
+
+    def test_other_users_expenses_are_not_counted(self):
+        budget = self.create_budget()
+        self.create_expense('99.00', user=self.other_user)
+        self.assertSpent(budget, '40.00')
+
+    def test_bulk_writes_update_counters(self):
+        budget = self.create_budget()
+        response = self.client.post(reverse('expense-bulk'), [
+            {
+                'amount': '5.00',
+                'description': 'Snack',
+                'category_id': self.food.id,
+                'date': str(self.today),
+            },
+        ] * 3, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertSpent(budget, '55.00')
+
+        response = self.client.delete(
+            reverse('expense-bulk'), {'ids': [self.expense.id]}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertSpent(budget, '15.00')
+
+    def test_status(self):
+        self.create_budget(amount='200.00')
+        self.create_budget(amount='50.00', category=self.transport)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.status_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        by_category = {row['category_name']: row for row in response.data}
+        self.assertEqual(by_category['Food']['spent'], '40.00')
+        self.assertEqual(by_category['Food']['remaining'], '160.00')
+        self.assertEqual(by_category['Food']['percent_used'], 20.0)
+        self.assertEqual(by_category['Transport']['spent'], '0.00')
+        start, end = period_bounds('month', self.today)
+        self.assertEqual(
+            by_category['Food']['days_left'], (end - self.today).days
+        )
+
+    def test_status_rolls_over_ended_periods(self):
+        budget = self.create_budget()
+        last_month = period_bounds(
+            'month', self.today.replace(day=1) - timedelta(days=1)
+        )
+        Budget.objects.filter(pk=budget.pk).update(
+            period_start=last_month[0],
+            period_end=last_month[1],
+            spent=Decimal('999.00')
+        )
+
+        response = self.client.get(self.status_url)
+
+        self.assertEqual(response.data[0]['spent'], '40.00')
+        self.assertEqual(
+            response.data[0]['period_start'],
+            str(period_bounds('month', self.today)[0])
+        )
+        self.assertSpent(budget, '40.00')
+
+    def test_budgets_are_per_user(self):
+        self.create_budget()
+        Budget.objects.create(
+            user=self.other_user,
+            category=self.food,
+            amount='10.00',
+            period_start=self.today,
+            period_end=self.today + timedelta(days=1)
+        )
+
+        response = self.client.get(self.list_url)
+        self.assertEqual(len(response.data), 1)
+
+    def test_duplicate_budget_rejected(self):
+        self.create_budget()
+        response = self.client.post(self.list_url, {
+            'category_id': self.food.id,
+            'amount': '10.00',
+            'period': 'month',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # A different period for the same category is fine
+        self.create_budget(period='week')
+
+    def test_invalid_amount(self):
+        response = self.client.post(self.list_url, {
+            'category_id': self.food.id,
+            'amount': '0',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('amount', response.data)
+
+    def test_changing_period_recounts(self):
+        budget = self.create_budget()
+        response = self.client.patch(
+            reverse('budget-detail', kwargs={'pk': budget.pk}),
+            {'period': 'year'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['period_start'], str(date(self.today.year, 1, 1))
+        )
+        self.assertEqual(response.data['spent'], '40.00')
+
+    def test_reconcile_budgets(self):
+        budget = self.create_budget()
+        Budget.objects.filter(pk=budget.pk).update(spent=Decimal('1.00'))
+
+        out = StringIO()
+        call_command('reconcile_budgets', stdout=out)
+
+        self.assertIn('Reconciled 1 budgets.', out.getvalue())
+        self.assertSpent(budget, '40.00')
@@ -0,0 +1,230 @@
+from decimal import Decimal
+from unittest import skipUnless
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import date, timedelta
+from rest_framework.test import APITestCase
+from rest_framework import status
+from expenses.budgets import spent_between
+from expenses.models import (
+    Budget,
+    Expense,
+    ExpenseCategory,
+    ExpenseDailyRollup,
+    ExpenseTombstone,
+)
+
+
+class ExpenseBulkTests(APITestCase):
+    """Test cases for bulk expense endpoints."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='user2',
+            password='testpass123'
+        )
+        self.category1 = ExpenseCategory.objects.create(name='Food')
+        self.category2 = ExpenseCategory.objects.create(name='Transport')
+        self.expense1 = self._create_expense(self.user1, '10.00')
+        self.expense2 = self._create_expense(self.user1, '20.00')
+        self.other_expense = self._create_expense(self.user2, '30.00')
+        self.client.force_authenticate(user=self.user1)
+        self.bulk_url = reverse('expense-bulk')
+
+    def _create_expense(self, user, amount):
+        return Expense.objects.create(
+            user=user,
+            amount=amount,
+            description='Expense',
+            category=self.category1,
+            date=date.today()
+        )
+
+    def _rollup_total(self, category):
+        rollup = ExpenseDailyRollup.objects.filter(
+            user=self.user1, category=category
+        ).first()
+        return rollup and (rollup.total, rollup.count)
+
+    def test_bulk_create(self):
+        """Test creating many expenses in one request."""
+        data = [
+            {
+                'amount': f'{index + 1}.00',
+                'description': f'Item {index}',
+                'category_id': self.category2.id if index % 2 else self.category1.id,
+                'date': str(date.today()),
+            }
+            for index in range(20)
+        ]
+
+        # One category lookup, one INSERT, rollup writes and one budget
+        # lookup no matter how many items are sent. PostgreSQL upserts
+        # every (category, day) rollup at once; elsewhere each costs an
+        # UPDATE, plus a savepoint and INSERT when its row is new.
+        queries = 6 if connection.vendor == 'postgresql' else 10
+        with self.assertNumQueries(queries):
+            response = self.client.post(self.bulk_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 20)
+        self.assertEqual(response.data[1]['category']['name'], 'Transport')
+        self.assertEqual(Expense.objects.filter(user=self.user1).count(), 22)
+        self.assertEqual(
+            self._rollup_total(self.category2), (Decimal('110.00'), 10)
+        )
+
+    @skipUnless(
+        connection.vendor == 'postgresql',
+        'Rollups are upserted in one statement on PostgreSQL only'
+    )
+    def test_bulk_create_query_count_is_constant_over_days(self):
+        """Test rollup and budget writes don't grow with the keys touched."""
+        for category in (self.category1, self.category2):
+            response = self.client.post(reverse('budget-list'), {
+                'category_id': category.id,
+                'amount': '1000.00',
+                'period': 'year',
+            }, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        def post(days):
+            data = [
+                {
+                    'amount': '1.00',
+                    'description': f'Item {index}',
+                    'category_id': (
+                        self.category2 if index % 2 else self.category1
+                    ).id,
+                    'date': str(date.today() - timedelta(days=index % days)),
+                }
+                for index in range(2 * days)
+            ]
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(self.bulk_url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return len(context.captured_queries)
+
+        # Category lookup, INSERT, rollup upsert, budget lookup and UPDATE
+        # (plus the savepoint around them)
+        self.assertEqual(post(2), 7)
+        self.assertEqual(post(12), 7)
+        rollups = ExpenseDailyRollup.objects.filter(user=self.user1)
+        self.assertEqual(
+            rollups.aggregate(count=Sum('count'))['count'],
+            Expense.objects.filter(user=self.user1).count()
+        )
+        for budget in Budget.objects.filter(user=self.user1):
+            self.assertEqual(budget.spent, spent_between(
+                Expense,
+                self.user1.pk,
+                budget.category_id,
+                budget.period_start,
+                budget.period_end
+            ))
+
+    def test_bulk_create_reports_errors_per_item(self):
+        """Test invalid items are reported by position and nothing is saved."""
+        data = [
+            {
+                'amount': '5.00',
+                'description': 'Valid',
+                'category_id': self.category1.id,
+                'date': str(date.today()),
+            },
+            {
+                'amount': '-5.00',
+                'description': 'Negative',
+                'category_id': 99999,
+                'date': str(date.today()),
+            },
+        ]
+
+        response = self.client.post(self.bulk_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn(0, response.data)
+        self.assertIn('amount', response.data[1])
+        self.assertIn('category_id', response.data[1])
+        self.assertEqual(Expense.objects.filter(user=self.user1).count(), 2)
+
+    def test_bulk_update(self):
+        """Test updating several expenses in one request."""
+        yesterday = date.today() - timedelta(days=1)
+        data = [
+            {'id': self.expense1.id, 'amount': '15.00'},
+            {
+                'id': self.expense2.id,
+                'category_id': self.category2.id,
+                'date': str(yesterday),
+            },
+        ]
+
+        response = self.client.patch(self.bulk_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.expense1.refresh_from_db()
+        self.expense2.refresh_from_db()
+        self.assertEqual(self.expense1.amount, Decimal('15.00'))
+        self.assertEqual(self.expense2.category, self.category2)
+        self.assertEqual(self.expense2.date, yesterday)
+        self.assertEqual(self._rollup_total(self.category1), (Decimal('15.00'), 1))
+        self.assertEqual(self._rollup_total(self.category2), (Decimal('20.00'), 1))
+
+    def test_bulk_update_rejects_other_users_expenses(self):
+        """Test updating another user's expense fails for that item."""
+        data = [
+            {'id': self.expense1.id, 'amount': '15.00'},
+            {'id': self.other_expense.id, 'amount': '1.00'},
+        ]
+
+        response = self.client.patch(self.bulk_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn(0, response.data)
+        self.assertIn('id', response.data[1])
+        self.expense1.refresh_from_db()
+        self.assertEqual(self.expense1.amount, Decimal('10.00'))
+
+    def test_bulk_update_requires_id(self):
+        """Test update items without an id are rejected."""
+        response = self.client.patch(
+            self.bulk_url, [{'amount': '15.00'}], format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('id', response.data[0])
+
+    def test_bulk_delete(self):
+        """Test deleting several expenses in one request."""
+        ids = [self.expense1.id, self.expense2.id]
+
+        response = self.client.delete(self.bulk_url, {'ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Expense.objects.filter(user=self.user1).exists())
+        self.assertIsNone(self._rollup_total(self.category1))
+        self.assertEqual(
+            sorted(ExpenseTombstone.objects.values_list('expense_id', flat=True)),
+            sorted(ids)
+        )
+
+    def test_bulk_delete_other_users_expense(self):
+        """Test deleting another user's expense fails the whole batch."""
+        response = self.client.delete(
+            self.bulk_url,
+            {'ids': [self.expense1.id, self.other_expense.id]},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(Expense.objects.filter(pk=self.expense1.pk).exists())
+        self.assertTrue(Expense.objects.filter(pk=self.other_expense.pk).exists())
@@ -0,0 +1,194 @@
+import time
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from datetime import date
+from rest_framework.test import APITestCase
+from rest_framework import status
+from expenses.cache import LocMemLRUBackend, ReportCache, get_report_cache
+from expenses.models import Expense, ExpenseCategory
+
+
+class LocMemLRUBackendTests(TestCase):
+    """Test cases for the in-process LRU report store."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the backend drops the oldest unused entry past its cap."""
+        backend = LocMemLRUBackend(max_entries=2)
+        backend.set('a', 1)
+        backend.set('b', 2)
+        backend.get('a')
+        backend.set('c', 3)
+
+        self.assertEqual(backend.get('a'), 1)
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.get('c'), 3)
+        self.assertEqual(len(backend), 2)
+
+    def test_entries_expire(self):
+        """Test entries are dropped once their timeout has passed."""
+        backend = LocMemLRUBackend(timeout=60)
+        backend.set('a', 1)
+        self.assertEqual(backend.get('a'), 1)
+        with mock.patch('expenses.cache.time.monotonic', return_value=time.monotonic() + 61):
+            self.assertIsNone(backend.get('a'))
+        self.assertEqual(len(backend), 0)
+
+    def test_bump_version(self):
+        """Test bumping a version changes it."""
+        backend = LocMemLRUBackend()
+        version = backend.get_version('v')
+        backend.bump_version('v')
+
+        self.assertEqual(backend.get_version('v'), version + 1)
+
+
+class ReportCacheTests(APITestCase):
+    """Test cases for cached report results."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.category = ExpenseCategory.objects.create(name='Food')
+        self.expense = Expense.objects.create(
+            user=self.user,
+            amount='100.00',
+            description='Lunch',
+            category=self.category,
+            date=date.today()
+        )
+        self.report_cache = get_report_cache()
+        self.report_cache.clear()
+        self.client.force_authenticate(user=self.user)
+        self.summary_url = reverse('report-summary')
+
+    def test_repeated_summary_is_served_from_cache(self):
+        """Test an unchanged summary is computed once."""
+        self.client.get(self.summary_url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.summary_url)
+
+        self.assertEqual(response.data['total_amount'], 100.00)
+        self.assertEqual(self.report_cache.hits, 1)
+        self.assertEqual(self.report_cache.misses, 1)
+
+    def test_category_order_is_normalized(self):
+        """Test reordered category IDs share a cache entry."""
+        other = ExpenseCategory.objects.create(name='Transport')
+        self.client.get(
+            self.summary_url, {'category': f'{self.category.id},{other.id}'}
+        )
+        response = self.client.get(
+            self.summary_url, {'category': f'{other.id},{self.category.id}'}
+        )
+
+        self.assertEqual(self.report_cache.hits, 1)
+        self.assertEqual(
+            response.data['filters']['category'],
+            f'{other.id},{self.category.id}'
+        )
+
+    def test_expense_change_invalidates(self):
+        """Test writing an expense invalidates its user's reports."""
+        self.client.get(self.summary_url)
+        self.expense.amount = '40.00'
+        self.expense.save()
+
+        response = self.client.get(self.summary_url)
+
+        self.assertEqual(response.data['total_amount'], 40.00)
+        self.assertEqual(self.report_cache.misses, 2)
+
+    def test_category_change_invalidates(self):
+        """Test renaming a category invalidates every user's reports."""
+        self.client.get(self.summary_url)
+        self.category.name = 'Groceries'
+        self.category.save()
+
+        response = self.client.get(self.summary_url)
+
+        self.assertEqual(
+            response.data['category_totals'][0]['category__name'], 'Groceries'
+        )
+
+    def test_other_users_writes_keep_cache(self):
+        """Test another user's writes don't invalidate this user's reports."""
+        other_user = User.objects.create_user(username='user2', password='x')
+        self.client.get(self.summary_url)
+        Expense.objects.create(
+            user=other_user,
+            amount='5.00',
+            description='Other',
+            category=self.category,
+            date=date.today()
+        )
+
+        self.client.get(self.summary_url)
+
+        self.assertEqual(self.report_cache.hits, 1)
+
+    @override_settings(REPORT_CACHE={'BACKEND': 'django'})
+    def test_django_cache_backend(self):
+        """Test the Django cache framework backend."""
+        cache.clear()
+        report_cache = get_report_cache()
+        self.assertIsNot(report_cache, self.report_cache)
+
+        self.client.get(self.summary_url)
+        self.client.get(self.summary_url)
+        self.expense.delete()
+        response = self.client.get(self.summary_url)
+
+        self.assertEqual(response.data['total_count'], 0)
+        self.assertEqual(report_cache.stats()['hits'], 1)
+        self.assertEqual(report_cache.stats()['misses'], 2)
+
+    @override_settings(REPORT_CACHE={'BACKEND': 'django'})
+    def test_django_cache_backend_clear(self):
+        """Test clearing drops the reports but not the rest of the cache."""
+        report_cache = get_report_cache()
+        cache.set('unrelated', 'kept')
+        self.client.get(self.summary_url)
+
+        report_cache.clear()
+        self.client.get(self.summary_url)
+
+        self.assertEqual(cache.get('unrelated'), 'kept')
+        self.assertEqual(report_cache.stats()['hits'], 0)
+        self.assertEqual(report_cache.stats()['misses'], 1)
+
+    def test_cache_stats_staff_only(self):
+        """Test cache stats are exposed to staff users only."""
+        url = reverse('report-cache-stats')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['backend'], 'LocMemLRUBackend')
+        self.assertIn('hit_rate', response.data)
+
+    def test_get_or_compute(self):
+        """Test compute is skipped on a hit."""
+        report_cache = ReportCache(LocMemLRUBackend())
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {'value': 1}
+
+        report_cache.get_or_compute(1, 'summary', (), compute)
+        report_cache.get_or_compute(1, 'summary', (), compute)
+        report_cache.invalidate_user(1)
+        report_cache.get_or_compute(1, 'summary', (), compute)
+
+        self.assertEqual(len(calls), 2)
@@ -0,0 +1,242 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.test import AsyncClient, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from expenses.categories import get_category_catalog
+from expenses.models import Expense, ExpenseCategory
+
+
+@override_settings(CATEGORY_CATALOG={'SHARED': True})
+class CategoryCatalogTests(TransactionTestCase):
+    """
+    Test cases for the process-wide category catalog.
+
+    Test cases run in a transaction don't use the catalog, hence
+    TransactionTestCase. The test cache isn't shared with other processes,
+    but nothing else writes categories here.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.food = ExpenseCategory.objects.create(name='Food')
+        self.transport = ExpenseCategory.objects.create(name='Transport')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.catalog = get_category_catalog()
+
+    def tearDown(self):
+        # Flushing the tables doesn't send delete signals
+        self.catalog.invalidate()
+
+    def category_queries(self, request):
+        with CaptureQueriesContext(connection) as context:
+            response = request()
+        queries = [
+            query['sql'] for query in context.captured_queries
+            if 'FROM "expenses_expensecategory"' in query['sql']
+        ]
+        return response, queries
+
+    def list_names(self, params=None):
+        response = self.client.get(reverse('category-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [category['name'] for category in response.json()['results']]
+
+    def test_list_served_from_catalog(self):
+        self.list_names()
+        response, queries = self.category_queries(
+            lambda: self.client.get(reverse('category-list'))
+        )
+        self.assertEqual(queries, [])
+        # Same as the list read from the database
+        from_database = self.client.get(
+            reverse('category-list'), {'ordering': 'name'}
+        )
+        self.assertEqual(
+            response.json()['results'], from_database.json()['results']
+        )
+        self.assertEqual(response.json()['count'], 2)
+
+    async def test_async_list(self):
+        response = await AsyncClient().get(reverse('category-list'), headers={
+            'authorization': f'Bearer {AccessToken.for_user(self.user)}',
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [category['name'] for category in response.json()['results']],
+            ['Food', 'Transport']
+        )
+
+    def test_list_validators(self):
+        response = self.client.get(reverse('category-list'))
+        not_modified = self.client.get(
+            reverse('category-list'), HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch(
+            reverse('category-detail', kwargs={'pk': self.food.pk}),
+            {'description': 'Groceries'},
+            format='json'
+        )
+        modified = self.client.get(
+            reverse('category-list'), HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+        self.assertEqual(modified.json()['results'][0]['description'], 'Groceries')
+
+    def test_search_and_ordering_use_the_database(self):
+        self.assertEqual(self.list_names({'search': 'trans'}), ['Transport'])
+        self.assertEqual(
+            self.list_names({'ordering': '-name'}), ['Transport', 'Food']
+        )
+
+    def test_writes_reload_the_catalog(self):
+        self.assertEqual(self.list_names(), ['Food', 'Transport'])
+        self.client.patch(
+            reverse('category-detail', kwargs={'pk': self.food.pk}),
+            {'name': 'Groceries'},
+            format='json'
+        )
+        self.assertEqual(self.list_names(), ['Groceries', 'Transport'])
+        self.client.delete(
+            reverse('category-detail', kwargs={'pk': self.transport.pk})
+        )
+        self.assertEqual(self.list_names(), ['Groceries'])
+        ExpenseCategory.objects.create(name='Rent')
+        self.assertEqual(self.list_names(), ['Groceries', 'Rent'])
+
+    def test_version_bumped_elsewhere_reloads(self):
+        self.list_names()
+        # Written without signals, as another process would look from here
+        ExpenseCategory.objects.filter(pk=self.food.pk).update(name='Groceries')
+        self.assertEqual(self.list_names(), ['Food', 'Transport'])
+        self.catalog.backend.bump_version(self.catalog.version_key)
+        self.assertEqual(self.list_names(), ['Groceries', 'Transport'])
+
+    def test_max_age_reloads(self):
+        catalog = type(self.catalog)(max_age=0, shared=True)
+        snapshot = catalog.snapshot()
+        self.assertIsNot(catalog.snapshot(), snapshot)
+
+    def test_category_ids_validated_from_catalog(self):
+        self.list_names()
+        payload = {
+            'amount': '12.50',
+            'description': 'Lunch',
+            'category_id': self.food.pk,
+            'date': str(date.today()),
+        }
+        response, queries = self.category_queries(
+            lambda: self.client.post(reverse('expense-list'), payload, format='json')
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(queries, [])
+        self.assertEqual(response.json()['category']['name'], 'Food')
+        self.assertEqual(
+            Expense.objects.get(pk=response.json()['id']).category, self.food
+        )
+
+        response = self.client.post(reverse('budget-list'), {
+            'category_id': self.transport.pk,
+            'amount': '100.00',
+            'period': 'month',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_bulk_create_validated_from_catalog(self):
+        self.list_names()
+        items = [
+            {
+                'amount': '1.00',
+                'description': f'Item {index}',
+                'category_id': (self.food if index % 2 else self.transport).pk,
+                'date': str(date.today()),
+            }
+            for index in range(4)
+        ]
+        response, queries = self.category_queries(
+            lambda: self.client.post(
+                reverse('expense-bulk'), items, format='json'
+            )
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(queries, [])
+
+    def test_unknown_categories(self):
+        self.list_names()
+        payload = {
+            'amount': '12.50',
+            'description': 'Lunch',
+            'category_id': 9999,
+            'date': str(date.today()),
+        }
+        response = self.client.post(reverse('expense-list'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('category_id', response.json())
+
+        # Created where the catalog can't see it: found in the database
+        ExpenseCategory.objects.bulk_create([ExpenseCategory(name='Rent')])
+        rent = ExpenseCategory.objects.get(name='Rent')
+        payload['category_id'] = rent.pk
+        response = self.client.post(reverse('expense-list'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_catalog_unused_in_transactions(self):
+        self.assertIsNotNone(self.catalog.snapshot())
+        with transaction.atomic():
+            ExpenseCategory.objects.create(name='Rent')
+            self.assertIsNone(self.catalog.snapshot())
+            self.assertEqual(
+                [category.name for category in self.catalog.all()],
+                ['Food', 'Rent', 'Transport']
+            )
+        self.assertEqual(self.catalog.snapshot().count, 3)
+
+    def test_copies_are_returned(self):
+        category = self.catalog.get(self.food.pk)
+        category.name = 'Changed'
+        self.assertEqual(self.catalog.get(self.food.pk).name, 'Food')
+
+
+class UnsharedCategoryCatalogTests(TransactionTestCase):
+    """Test cases for the catalog with a per-process version cache."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.food = ExpenseCategory.objects.create(name='Food')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_catalog_is_off(self):
+        catalog = get_category_catalog()
+        self.assertFalse(catalog.shared)
+        self.assertIsNone(catalog.snapshot())
+
+    def test_category_deleted_elsewhere(self):
+        self.client.get(reverse('category-list'))
+        # Deleted by a process this one's cache can't hear from
+        ExpenseCategory.objects.filter(pk=self.food.pk).delete()
+        response = self.client.get(reverse('category-list'))
+        self.assertEqual(response.json()['count'], 0)
+        response = self.client.post(reverse('expense-list'), {
+            'amount': '12.50',
+            'description': 'Lunch',
+            'category_id': self.food.pk,
+            'date': str(date.today()),
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('category_id', response.json())
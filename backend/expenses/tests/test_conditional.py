@@ -0,0 +1,116 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils.http import http_date
+from datetime import date
+from rest_framework.test import APITestCase
+from rest_framework import status
+from expenses.models import Expense, ExpenseCategory
+
+
+class ConditionalGetTests(APITestCase):
+    """Test cases for ETag / conditional GET support."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.category = ExpenseCategory.objects.create(name='Food')
+        self.expense = Expense.objects.create(
+            user=self.user,
+            amount='100.00',
+            description='Lunch',
+            category=self.category,
+            date=date.today()
+        )
+        self.client.force_authenticate(user=self.user)
+        self.list_url = reverse('expense-list')
+        self.category_url = reverse('category-list')
+        self.summary_url = reverse('report-summary')
+
+    def _assert_not_modified(self, url, etag, params=None):
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_expense_list_etag(self):
+        """Test an unchanged expense list is answered with 304."""
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Last-Modified', response)
+        self._assert_not_modified(self.list_url, response['ETag'])
+
+    def test_expense_list_etag_changes_on_write(self):
+        """Test creating, editing or deleting an expense changes the ETag."""
+        etag = self.client.get(self.list_url)['ETag']
+        self.expense.amount = '50.00'
+        self.expense.save()
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        self.expense.delete()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+
+    def test_expense_list_etag_changes_on_category_rename(self):
+        """Test renaming a category changes the expense list ETag."""
+        etag = self.client.get(self.list_url)['ETag']
+        self.category.name = 'Groceries'
+        self.category.save()
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['category_name'], 'Groceries')
+
+    def test_expense_list_etag_depends_on_query(self):
+        """Test different filters or pages don't share an ETag."""
+        etag = self.client.get(self.list_url)['ETag']
+
+        response = self.client.get(
+            self.list_url, {'search': 'Lunch'}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_expense_list_ignores_if_modified_since(self):
+        """Test a delete isn't hidden from If-Modified-Since requests."""
+        since = http_date(self.expense.updated_at.timestamp() + 1)
+        self.expense.delete()
+
+        response = self.client.get(
+            self.list_url, HTTP_IF_MODIFIED_SINCE=since
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+
+    def test_category_list_etag(self):
+        """Test an unchanged category list is answered with 304."""
+        etag = self.client.get(self.category_url)['ETag']
+        self._assert_not_modified(self.category_url, etag)
+
+        ExpenseCategory.objects.create(name='Transport')
+        response = self.client.get(self.category_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_summary_etag(self):
+        """Test an unchanged summary is answered with 304."""
+        params = {'date_from': str(date.today())}
+        etag = self.client.get(self.summary_url, params)['ETag']
+        with self.assertNumQueries(0):
+            self._assert_not_modified(self.summary_url, etag, params)
+
+        self.expense.delete()
+        response = self.client.get(
+            self.summary_url, params, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 0)
@@ -3,8 +3,10 @@ from django.urls import reverse
 from datetime import date, timedelta
 from rest_framework.test import APITestCase
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework_simplejwt.tokens import RefreshToken
 from expenses.models import Expense, ExpenseCategory
+from expenses.serializers import ExpenseListSerializer
 
 
 class ExpenseTests(APITestCase):
@@ -278,6 +280,31 @@ class ExpenseTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
 
+    def test_search_expenses_is_case_insensitive(self):
+        """Test search matches descriptions and category names in any case."""
+        response = self.client.get(self.list_url, {'search': 'bus'})
+        self.assertEqual(
+            [exp['id'] for exp in response.data['results']],
+            [self.expense2.id]
+        )
+
+        response = self.client.get(self.list_url, {'search': 'TRANSPORT'})
+        self.assertEqual(
+            [exp['id'] for exp in response.data['results']],
+            [self.expense2.id]
+        )
+
+    def test_search_expenses_requires_every_term(self):
+        """Test each search term must match the description or category."""
+        response = self.client.get(self.list_url, {'search': 'lunch food'})
+        self.assertEqual(
+            [exp['id'] for exp in response.data['results']],
+            [self.expense1.id]
+        )
+
+        response = self.client.get(self.list_url, {'search': 'lunch transport'})
+        self.assertEqual(response.data['results'], [])
+
     def test_ordering_expenses_by_date(self):
         """Test ordering expenses by date."""
         response = self.client.get(self.list_url, {'ordering': 'date'})
@@ -293,3 +320,48 @@ class ExpenseTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         amounts = [float(exp['amount']) for exp in response.data['results']]
         self.assertEqual(amounts, sorted(amounts))
+
+    def test_list_matches_serializer_output(self):
+        """Test list rows render byte for byte like ExpenseListSerializer."""
+        Expense.objects.create(
+            user=self.user1,
+            amount='7',
+            description='Caf\u00e9 \u2028 "quoted"',
+            category=self.category2,
+            date=date.today() - timedelta(days=3)
+        )
+        for params in ({}, {'ordering': 'amount'}, {'pagination': 'cursor'}):
+            response = self.client.get(self.list_url, params)
+
+            expected = ExpenseListSerializer(
+                Expense.objects.filter(user=self.user1).order_by(
+                    params.get('ordering', '-date'), '-created_at', '-id'
+                ),
+                many=True
+            ).data
+            self.assertEqual(
+                JSONRenderer().render(response.data['results']),
+                JSONRenderer().render(expected)
+            )
+
+    def test_list_query_count_is_constant(self):
+        """Test category names are joined in, not fetched per row."""
+        for index in range(5):
+            Expense.objects.create(
+                user=self.user1,
+                amount='1.00',
+                description='Extra',
+                category=ExpenseCategory.objects.create(name=f'Extra {index}'),
+                date=date.today()
+            )
+        # Token user, validators aggregate, page COUNT, page rows
+        with self.assertNumQueries(4):
+            response = self.client.get(self.list_url)
+        self.assertEqual(len(response.data['results']), 7)
+
+    def test_retrieve_includes_category(self):
+        """Test the detail view loads the category with the expense."""
+        # Token user, expense joined with its category
+        with self.assertNumQueries(2):
+            response = self.client.get(self.detail_url)
+        self.assertEqual(response.data['category']['name'], 'Food')
@@ -0,0 +1,187 @@
+import csv
+import io
+import json
+from unittest import mock
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import AsyncClient
+from django.urls import reverse
+from datetime import date, timedelta
+from rest_framework.test import APITestCase
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from expenses.models import Expense, ExpenseCategory
+
+
+class ExpenseExportTests(APITestCase):
+    """Test cases for the streaming expense export."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='user2',
+            password='testpass123'
+        )
+        self.category1 = ExpenseCategory.objects.create(name='Food')
+        self.category2 = ExpenseCategory.objects.create(name='Transport')
+        self.expense1 = Expense.objects.create(
+            user=self.user1,
+            amount='100.50',
+            description='Lunch, with "friends"',
+            category=self.category1,
+            date=date.today()
+        )
+        self.expense2 = Expense.objects.create(
+            user=self.user1,
+            amount='50.00',
+            description='Bus ticket',
+            category=self.category2,
+            date=date.today() - timedelta(days=1)
+        )
+        Expense.objects.create(
+            user=self.user2,
+            amount='200.00',
+            description='Other user',
+            category=self.category1,
+            date=date.today()
+        )
+        self.token = RefreshToken.for_user(self.user1)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {self.token.access_token}'
+        )
+        self.export_url = reverse('expense-export')
+
+    def _content(self, response):
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_export_csv(self):
+        """Test CSV export of the user's expenses, newest first."""
+        response = self.client.get(self.export_url, {'format': 'csv'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+        self.assertIn('expenses.csv', response['Content-Disposition'])
+        rows = list(csv.reader(io.StringIO(self._content(response))))
+        self.assertEqual(
+            rows[0],
+            ['id', 'date', 'amount', 'category', 'description', 'created_at']
+        )
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1][:5], [
+            str(self.expense1.id),
+            str(date.today()),
+            '100.50',
+            'Food',
+            'Lunch, with "friends"',
+        ])
+
+    def test_export_csv_escapes_formulas(self):
+        """Test text cells a spreadsheet would evaluate are prefixed."""
+        self.expense1.description = '=HYPERLINK("http://example.com")'
+        self.expense1.save()
+        self.expense2.description = '-2+3'
+        self.expense2.save()
+        self.category2.name = '@Transport'
+        self.category2.save()
+
+        response = self.client.get(self.export_url, {'format': 'csv'})
+        rows = list(csv.reader(io.StringIO(self._content(response))))
+        self.assertEqual(
+            rows[1][3:5], ['Food', '\'=HYPERLINK("http://example.com")']
+        )
+        self.assertEqual(rows[2][2:5], ['50.00', "'@Transport", "'-2+3"])
+
+        # NDJSON values are data, not cells: left as they are
+        response = self.client.get(self.export_url, {'format': 'ndjson'})
+        second = json.loads(self._content(response).splitlines()[1])
+        self.assertEqual(second['description'], '-2+3')
+        self.assertEqual(second['category'], '@Transport')
+
+    def test_export_csv_is_default(self):
+        """Test CSV is used when no format is requested."""
+        response = self.client.get(self.export_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+
+    def test_export_ndjson(self):
+        """Test NDJSON export matches the API's field representation."""
+        response = self.client.get(self.export_url, {'format': 'ndjson'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = self._content(response).splitlines()
+        self.assertEqual(len(lines), 2)
+        first = json.loads(lines[0])
+        detail = self.client.get(
+            reverse('expense-detail', kwargs={'pk': self.expense1.pk})
+        ).data
+        self.assertEqual(first['amount'], detail['amount'])
+        self.assertEqual(first['date'], detail['date'])
+        self.assertEqual(first['created_at'], detail['created_at'])
+        self.assertEqual(first['category'], 'Food')
+
+    def test_export_applies_list_filters(self):
+        """Test export reuses the list endpoint filters."""
+        response = self.client.get(
+            self.export_url,
+            {'format': 'ndjson', 'category': str(self.category2.id)}
+        )
+
+        lines = self._content(response).splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['id'], self.expense2.id)
+
+        response = self.client.get(
+            self.export_url, {'format': 'ndjson', 'search': 'lunch'}
+        )
+        lines = self._content(response).splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [self.expense1.id])
+
+    def test_export_unauthenticated(self):
+        """Test export fails when unauthenticated."""
+        self.client.credentials()
+        response = self.client.get(self.export_url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def _asgi_export(self, params=None):
+        """Export through the ASGI handler; return the response and chunks."""
+        response = await AsyncClient().get(self.export_url, params, headers={
+            'authorization': f'Bearer {self.token.access_token}',
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        return response, chunks
+
+    async def test_export_streams_async_over_asgi(self):
+        """Test ASGI exports stream an async iterator, chunk by chunk."""
+        with mock.patch('expenses.export.EXPORT_BUFFER_SIZE', 1):
+            response, chunks = await self._asgi_export()
+        # Header, then one chunk per row
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+
+        # Same content as the sync export
+        sync_content = await sync_to_async(
+            lambda: self._content(self.client.get(self.export_url))
+        )()
+        self.assertEqual(b''.join(chunks).decode('utf-8'), sync_content)
+
+    async def test_export_ndjson_over_asgi(self):
+        """Test ASGI NDJSON exports match the sync ones."""
+        _, chunks = await self._asgi_export({'format': 'ndjson'})
+        rows = [
+            json.loads(line)
+            for line in b''.join(chunks).decode('utf-8').splitlines()
+        ]
+        self.assertEqual(
+            [row['description'] for row in rows],
+            ['Lunch, with "friends"', 'Bus ticket']
+        )
+
@@ -0,0 +1,201 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from expenses.cache import get_report_cache
+from expenses.forecast import build_forecast, fit_forecast
+from expenses.models import Expense, ExpenseCategory
+from expenses.rollups import rebuild_rollups
+
+
+class ForecastModelTests(APITestCase):
+    """Test cases for fitting and projecting forecasts."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.food = ExpenseCategory.objects.create(name='Food')
+        self.rent = ExpenseCategory.objects.create(name='Rent')
+        # A Monday, so weekday positions are easy to read
+        self.start = date(2025, 1, 6)
+        self.end = self.start + timedelta(days=83)
+
+    def seed(self, category, amount_for_day):
+        Expense.objects.bulk_create(
+            Expense(
+                user=self.user,
+                amount=Decimal(str(amount_for_day(day))),
+                description='Seed',
+                category=category,
+                date=self.start + timedelta(days=day)
+            )
+            for day in range((self.end - self.start).days + 1)
+            if amount_for_day(day)
+        )
+        rebuild_rollups(user_ids=[self.user.pk])
+
+    def test_constant_spending(self):
+        self.seed(self.food, lambda day: 10)
+        forecast = build_forecast(
+            fit_forecast(self.user, self.start, self.end), 7
+        )
+
+        food = forecast['categories'][0]
+        self.assertEqual(food['category__name'], 'Food')
+        np.testing.assert_allclose(food['forecast'], [10] * 7, atol=0.01)
+        np.testing.assert_allclose(food['lower'], food['forecast'], atol=0.01)
+        self.assertEqual(
+            forecast['periods'][0],
+            (self.end + timedelta(days=1)).isoformat()
+        )
+
+    def test_linear_trend(self):
+        self.seed(self.food, lambda day: 5 + day)
+        forecast = build_forecast(
+            fit_forecast(self.user, self.start, self.end), 3, model='linear'
+        )
+        days = (self.end - self.start).days
+        np.testing.assert_allclose(
+            forecast['categories'][0]['forecast'],
+            [5 + days + 1, 5 + days + 2, 5 + days + 3],
+            atol=0.01
+        )
+
+    def test_weekday_profile(self):
+        # Rent is paid on Mondays only
+        self.seed(self.rent, lambda day: 70 if day % 7 == 0 else 0)
+        forecast = build_forecast(
+            fit_forecast(self.user, self.start, self.end), 7
+        )
+        rent = forecast['categories'][0]['forecast']
+        # The day after the history is a Monday
+        self.assertAlmostEqual(rent[0], 70, delta=1)
+        self.assertTrue(all(value < 1 for value in rent[1:]))
+
+    def test_weekly_buckets_and_total(self):
+        self.seed(self.food, lambda day: 10)
+        self.seed(self.rent, lambda day: 70 if day % 7 == 0 else 0)
+        forecast = build_forecast(
+            fit_forecast(self.user, self.start, self.end), 2, granularity='week'
+        )
+
+        self.assertEqual(len(forecast['periods']), 2)
+        by_name = {
+            row['category__name']: row for row in forecast['categories']
+        }
+        np.testing.assert_allclose(by_name['Food']['forecast'], [70, 70], atol=1)
+        np.testing.assert_allclose(forecast['total']['forecast'], [140, 140], atol=2)
+        for band in [forecast['total']] + forecast['categories']:
+            for lower, mean, upper in zip(
+                band['lower'], band['forecast'], band['upper']
+            ):
+                self.assertLessEqual(lower, mean)
+                self.assertLessEqual(mean, upper)
+
+    def test_total_adds_up_clipped_categories(self):
+        # Food falls below zero within the horizon
+        self.seed(self.food, lambda day: 90 - day)
+        self.seed(self.rent, lambda day: 10)
+        forecast = build_forecast(
+            fit_forecast(self.user, self.start, self.end), 4,
+            granularity='week', model='linear'
+        )
+
+        food, rent = forecast['categories']
+        self.assertEqual(food['forecast'][-1], 0)
+        np.testing.assert_allclose(
+            forecast['total']['forecast'],
+            np.add(food['forecast'], rent['forecast']),
+            atol=0.02
+        )
+
+    def test_no_history(self):
+        forecast = build_forecast(
+            fit_forecast(self.user, self.start, self.end), 3
+        )
+        self.assertEqual(forecast['categories'], [])
+        self.assertEqual(forecast['total']['forecast'], [0, 0, 0])
+
+
+class ForecastEndpointTests(APITestCase):
+    """Test cases for the forecast endpoint."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.category = ExpenseCategory.objects.create(name='Food')
+        yesterday = timezone.localdate() - timedelta(days=1)
+        for day in range(30):
+            Expense.objects.create(
+                user=self.user,
+                amount='12.00',
+                description='Lunch',
+                category=self.category,
+                date=yesterday - timedelta(days=day)
+            )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('report-forecast')
+        get_report_cache().clear()
+
+    def test_forecast(self):
+        response = self.client.get(self.url, {'horizon': 5, 'history': 30})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['horizon'], 5)
+        self.assertEqual(
+            response.data['periods'][0], timezone.localdate().isoformat()
+        )
+        np.testing.assert_allclose(
+            response.data['categories'][0]['forecast'], [12] * 5, atol=0.01
+        )
+
+    def test_fit_is_cached_until_data_changes(self):
+        self.client.get(self.url, {'horizon': 5})
+        # Another horizon reuses the cached fit
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {'horizon': 10})
+        self.assertEqual(len(response.data['periods']), 10)
+
+        Expense.objects.create(
+            user=self.user,
+            amount='500.00',
+            description='Party',
+            category=self.category,
+            date=timezone.localdate() - timedelta(days=1)
+        )
+        with self.assertNumQueries(1):
+            self.client.get(self.url, {'horizon': 10})
+
+    def test_not_modified(self):
+        response = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_invalid_params(self):
+        response = self.client.get(self.url, {
+            'horizon': 'abc',
+            'granularity': 'month',
+            'model': 'magic',
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            set(response.data), {'horizon', 'granularity', 'model'}
+        )
+
+    def test_weekly_horizon_limit(self):
+        response = self.client.get(
+            self.url, {'granularity': 'week', 'horizon': 60}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('horizon', response.data)
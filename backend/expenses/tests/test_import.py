@@ -0,0 +1,134 @@
+from decimal import Decimal
+from io import StringIO
+import os
+import tempfile
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from expenses.models import Expense, ExpenseCategory, ExpenseDailyRollup
+
+
+CSV_CONTENT = (
+    'Date,Amount,Description,Category\n'
+    '2024-01-05,12.50,Lunch,food\n'
+    '2024-01-05,7.50,Coffee,Food\n'
+    '2024-01-06,-3.00,Refund,Food\n'
+    'not-a-date,10.00,Taxi,Transport\n'
+    '2024-01-07,30.00,Train,Travel\n'
+    '2024-01-07,1.234,Gum,Food\n'
+)
+
+
+class ExpenseImportTests(APITestCase):
+    """Test cases for CSV expense imports."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.food = ExpenseCategory.objects.create(name='Food')
+        self.client.force_authenticate(user=self.user)
+        self.import_url = reverse('expense-import-csv')
+
+    def _upload(self, content):
+        return self.client.post(
+            self.import_url,
+            {'file': SimpleUploadedFile('expenses.csv', content.encode('utf-8'))},
+            format='multipart'
+        )
+
+    def test_import_csv(self):
+        """Test valid lines are imported and invalid ones reported by line."""
+        response = self._upload(CSV_CONTENT)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created'], 3)
+        self.assertEqual(response.data['error_count'], 3)
+        self.assertEqual(
+            [error['line'] for error in response.data['errors']], [4, 5, 7]
+        )
+        self.assertIn('amount', response.data['errors'][0]['errors'])
+        self.assertIn('date', response.data['errors'][1]['errors'])
+        self.assertEqual(
+            set(Expense.objects.filter(user=self.user).values_list(
+                'category__name', flat=True
+            )),
+            {'Food', 'Travel'}
+        )
+        # Lines 2 and 3 map "food" and "Food" onto the existing category
+        self.assertEqual(
+            ExpenseCategory.objects.filter(name__iexact='food').count(), 1
+        )
+
+    def test_import_long_category_name(self):
+        """Test a category name too long to store is reported by line."""
+        response = self._upload(
+            'date,amount,description,category\n'
+            f'2024-01-05,12.50,Lunch,{"x" * 101}\n'
+            '2024-01-05,7.50,Coffee,Food\n'
+            '2024-01-06,3.00,Bus,\n'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(
+            [error['line'] for error in response.data['errors']], [2, 4]
+        )
+        self.assertIn('category', response.data['errors'][0]['errors'])
+        self.assertIn('category', response.data['errors'][1]['errors'])
+        self.assertEqual(
+            list(Expense.objects.filter(user=self.user).values_list(
+                'description', flat=True
+            )),
+            ['Coffee']
+        )
+
+    def test_import_updates_rollups(self):
+        """Test imported expenses are reflected in daily rollups."""
+        self._upload(CSV_CONTENT)
+
+        rollup = ExpenseDailyRollup.objects.get(
+            user=self.user, category=self.food
+        )
+        self.assertEqual((rollup.total, rollup.count), (Decimal('20.00'), 2))
+
+    def test_import_missing_columns(self):
+        """Test a file without the required columns is rejected."""
+        response = self._upload('date,amount\n2024-01-01,5.00\n')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('description', str(response.data['file']))
+
+    def test_import_without_file(self):
+        """Test the endpoint requires a file."""
+        response = self.client.post(self.import_url, {}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_command(self):
+        """Test the management command imports in batches with progress."""
+        with tempfile.NamedTemporaryFile(
+            'w', suffix='.csv', delete=False
+        ) as csv_file:
+            csv_file.write(CSV_CONTENT)
+        self.addCleanup(os.remove, csv_file.name)
+
+        out, err = StringIO(), StringIO()
+        call_command(
+            'import_expenses',
+            csv_file.name,
+            user='user1',
+            batch_size=2,
+            stdout=out,
+            stderr=err
+        )
+
+        self.assertIn('Imported 3 expenses with 3 errors', out.getvalue())
+        self.assertIn('2 imported', out.getvalue())
+        self.assertIn('Line 4', err.getvalue())
+        self.assertEqual(Expense.objects.filter(user=self.user).count(), 3)
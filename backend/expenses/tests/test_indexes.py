@@ -0,0 +1,155 @@
+import re
+from datetime import date, timedelta
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+
+from expenses.cache import get_report_cache
+from expenses.models import Expense, ExpenseCategory, ExpenseDailyRollup
+from expenses.rollups import rebuild_rollups
+
+
+SCAN_PATTERN = re.compile(r'(\w[\w ]*Scan)(?: using \w+)? on (\w+)')
+# QuerySet.iterator() reads through a server-side cursor
+CURSOR_PATTERN = re.compile(r'^DECLARE .+? CURSOR (?:.+? )?FOR (SELECT .*)$', re.S)
+
+
+@skipUnless(
+    connection.vendor == 'postgresql',
+    'Index-only plans are specific to PostgreSQL'
+)
+class IndexOnlyPlanTests(APITransactionTestCase):
+    """
+    Regression tests for the covering indexes.
+
+    The tables are vacuumed (hence a transaction test case) so the
+    visibility map is set as on a live database, and sequential and bitmap
+    scans are disabled so the tiny tables don't hide the plan picked on
+    real data. Every scan of the aggregated table must then be answered
+    from an index alone.
+    """
+
+    def setUp(self):
+        users = [
+            User.objects.create_user(username=f'user{index}')
+            for index in range(4)
+        ]
+        self.user = users[0]
+        categories = [
+            ExpenseCategory.objects.create(name=name)
+            for name in ('Food', 'Transport', 'Rent', 'Health')
+        ]
+        self.food, self.transport = categories[:2]
+        Expense.objects.bulk_create(
+            Expense(
+                user=users[index % len(users)],
+                amount='10.00',
+                description='Item',
+                category=categories[index % len(categories)],
+                date=date.today() - timedelta(days=index % 60)
+            )
+            for index in range(400)
+        )
+        rebuild_rollups()
+        self.client.force_authenticate(user=self.user)
+        get_report_cache().clear()
+
+        with connection.cursor() as cursor:
+            for model in (Expense, ExpenseDailyRollup):
+                cursor.execute(f'VACUUM ANALYZE {model._meta.db_table}')
+            cursor.execute('SET enable_seqscan = off')
+            cursor.execute('SET enable_bitmapscan = off')
+
+    def tearDown(self):
+        with connection.cursor() as cursor:
+            cursor.execute('RESET enable_seqscan')
+            cursor.execute('RESET enable_bitmapscan')
+
+    def explain_queries(self, run):
+        """Run ``run`` and return (sql, plan) for each SELECT it executed."""
+        with CaptureQueriesContext(connection) as context:
+            run()
+        plans = []
+        with connection.cursor() as cursor:
+            for query in context.captured_queries:
+                sql = query['sql']
+                declared = CURSOR_PATTERN.match(sql)
+                if declared:
+                    sql = declared.group(1)
+                if not sql.startswith('SELECT'):
+                    continue
+                cursor.execute('EXPLAIN ' + sql)
+                plan = '\n'.join(row[0] for row in cursor.fetchall())
+                plans.append((sql, plan))
+        return plans
+
+    def get(self, url, params=None):
+        def run():
+            response = self.client.get(url, params or {})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return run
+
+    def assertIndexOnly(self, plans, model):
+        """Assert every scan of ``model``'s table is an index-only scan."""
+        table = model._meta.db_table
+        checked = 0
+        for sql, plan in plans:
+            scans = [
+                scan for scan, scanned in SCAN_PATTERN.findall(plan)
+                if scanned == table
+            ]
+            for scan in scans:
+                self.assertEqual(
+                    scan,
+                    'Index Only Scan',
+                    f'{table} is not read index-only by:\n{sql}\n\n{plan}'
+                )
+            checked += len(scans)
+        self.assertTrue(checked, f'No query scanned {table}')
+
+    def test_summary_with_category_and_date_filters(self):
+        plans = self.explain_queries(self.get(
+            reverse('report-summary'),
+            {
+                'category': f'{self.food.id},{self.transport.id}',
+                'date_from': str(date.today() - timedelta(days=3)),
+                'date_to': str(date.today()),
+            }
+        ))
+        self.assertIndexOnly(plans, ExpenseDailyRollup)
+
+    def test_summary_without_filters(self):
+        plans = self.explain_queries(self.get(reverse('report-summary')))
+        self.assertIndexOnly(plans, ExpenseDailyRollup)
+
+    def test_timeseries(self):
+        plans = self.explain_queries(self.get(
+            reverse('report-timeseries'),
+            {'granularity': 'week', 'category': str(self.food.id)}
+        ))
+        self.assertIndexOnly(plans, ExpenseDailyRollup)
+
+    def test_expense_list_validators(self):
+        plans = self.explain_queries(self.get(
+            reverse('expense-list'),
+            {
+                'category': str(self.food.id),
+                'date_from': str(date.today() - timedelta(days=3)),
+            }
+        ))
+        # The page itself reads whole rows; its ETag aggregate shouldn't
+        validator_plans = [
+            (sql, plan) for sql, plan in plans if 'MAX(' in sql
+        ]
+        self.assertIndexOnly(validator_plans, Expense)
+
+    def test_rebuild_rollups(self):
+        plans = self.explain_queries(
+            lambda: rebuild_rollups(user_ids=[self.user.pk])
+        )
+        self.assertIndexOnly(plans, Expense)
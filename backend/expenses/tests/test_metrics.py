@@ -0,0 +1,130 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from expenses.metrics import normalize_sql, registry
+from expenses.models import Expense, ExpenseCategory
+
+
+class NormalizeSQLTests(APITestCase):
+    """Test cases for slow-query normalization."""
+
+    def test_normalize_sql(self):
+        self.assertEqual(
+            normalize_sql(
+                'SELECT "expenses_p2026"."id" FROM t\n  WHERE "a" = %s '
+                "AND b IN (%s, %s, %s) AND c = 'it''s' AND d > 10.5 LIMIT 21"
+            ),
+            'SELECT "expenses_p2026"."id" FROM t WHERE "a" = ? '
+            'AND b IN (...) AND c = ? AND d > ? LIMIT ?'
+        )
+
+
+class RequestMetricsTests(APITestCase):
+    """Test cases for the request metrics middleware and endpoint."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.admin = User.objects.create_user(
+            username='admin',
+            password='testpass123',
+            is_staff=True
+        )
+        category = ExpenseCategory.objects.create(name='Food')
+        Expense.objects.create(
+            user=self.user,
+            amount='12.00',
+            description='Lunch',
+            category=category,
+            date=date(2026, 1, 5)
+        )
+        self.client.force_authenticate(user=self.user)
+        registry.clear()
+
+    def test_records_per_view_and_action(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('expense-list'))
+        # The query log is reset when the next request starts
+        queries = len(context.captured_queries)
+        self.client.get(reverse('report-summary'))
+        self.client.get(reverse('report-summary'))
+
+        snapshot = registry.snapshot()
+        self.assertEqual(
+            set(snapshot), {'ExpenseViewSet.list', 'ReportViewSet.summary'}
+        )
+        listing = snapshot['ExpenseViewSet.list']
+        self.assertEqual(listing['queries']['sum'], queries)
+        self.assertEqual(
+            listing['response_size_bytes']['sum'], len(response.content)
+        )
+        summary = snapshot['ReportViewSet.summary']
+        self.assertEqual(summary['request_duration_seconds']['count'], 2)
+        self.assertEqual(summary['queries']['buckets']['+Inf'], 2)
+
+    def test_server_timing_header(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('expense-list'))
+        self.assertRegex(
+            response['Server-Timing'],
+            r'^app;dur=[\d.]+, db;dur=[\d.]+;desc="%d queries"$'
+            % len(context.captured_queries)
+        )
+
+    @override_settings(REQUEST_METRICS={'SERVER_TIMING': False})
+    def test_server_timing_can_be_disabled(self):
+        response = self.client.get(reverse('expense-list'))
+        self.assertNotIn('Server-Timing', response)
+        self.assertIn('ExpenseViewSet.list', registry.snapshot())
+
+    @override_settings(REQUEST_METRICS={'ENABLED': False})
+    def test_disabled(self):
+        self.client.get(reverse('expense-list'))
+        self.assertEqual(registry.snapshot(), {})
+
+    @override_settings(REQUEST_METRICS={'SLOW_QUERY_MS': 0})
+    def test_slow_query_log(self):
+        with self.assertLogs('expenses.metrics', 'WARNING') as logs:
+            self.client.get(reverse('expense-list'), {'category': '1,2,3'})
+
+        self.assertTrue(any(
+            'IN (...)' in line and '"expenses_expense"' in line
+            for line in logs.output
+        ))
+
+    def test_metrics_endpoint(self):
+        self.client.get(reverse('expense-list'))
+        url = reverse('metrics')
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        text = response.content.decode()
+        self.assertIn('# TYPE expense_api_queries histogram', text)
+        self.assertIn(
+            'expense_api_request_duration_seconds_count'
+            '{view="ExpenseViewSet.list"} 1',
+            text
+        )
+        self.assertIn(
+            'expense_api_queries_bucket{view="ExpenseViewSet.list",le="+Inf"} 1',
+            text
+        )
+
+        response = self.client.get(url, {'format': 'json'})
+        self.assertEqual(
+            response.json()['ExpenseViewSet.list']['queries']['count'], 1
+        )
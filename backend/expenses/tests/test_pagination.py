@@ -0,0 +1,100 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import date, timedelta
+from rest_framework.test import APITestCase
+from rest_framework import status
+from expenses.models import Expense, ExpenseCategory
+
+
+class ExpenseCursorPaginationTests(APITestCase):
+    """Test cases for keyset (cursor) pagination of expenses."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.category = ExpenseCategory.objects.create(name='Food')
+        # Several expenses share a date so ties are broken by created_at/id
+        self.expenses = [
+            self._create_expense(date.today() - timedelta(days=index // 2))
+            for index in range(7)
+        ]
+        self.client.force_authenticate(user=self.user)
+        self.list_url = reverse('expense-list')
+
+    def _create_expense(self, expense_date):
+        return Expense.objects.create(
+            user=self.user,
+            amount='10.00',
+            description='Expense',
+            category=self.category,
+            date=expense_date
+        )
+
+    def _walk(self, params):
+        ids = []
+        url = self.list_url
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(expense['id'] for expense in response.data['results'])
+            url, params = response.data['next'], None
+        return ids
+
+    def test_walks_all_pages_in_order(self):
+        """Test following next links returns every expense once, in order."""
+        ids = self._walk({'pagination': 'cursor', 'page_size': 3})
+
+        expected = list(Expense.objects.filter(user=self.user).order_by(
+            '-date', '-created_at', '-id'
+        ).values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_no_count_query(self):
+        """Test a cursor page doesn't count the matching rows."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                self.list_url, {'pagination': 'cursor', 'page_size': 3}
+            )
+
+        self.assertNotIn('count', response.data)
+        for query in context.captured_queries:
+            self.assertNotIn('COUNT(', query['sql'])
+
+    def test_stable_under_concurrent_inserts(self):
+        """Test rows inserted before the cursor don't shift later pages."""
+        response = self.client.get(
+            self.list_url, {'pagination': 'cursor', 'page_size': 3}
+        )
+        first_page = [expense['id'] for expense in response.data['results']]
+        self._create_expense(date.today())
+
+        rest = self._walk_from(response.data['next'])
+
+        self.assertEqual(len(first_page + rest), 7)
+        self.assertEqual(set(first_page + rest), {e.id for e in self.expenses})
+
+    def _walk_from(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            ids.extend(expense['id'] for expense in response.data['results'])
+            url = response.data['next']
+        return ids
+
+    def test_invalid_cursor(self):
+        """Test a malformed cursor returns 404."""
+        response = self.client.get(self.list_url, {'cursor': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_pagination_is_default(self):
+        """Test the default list keeps page number pagination."""
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.data['count'], 7)
+        self.assertIn('previous', response.data)
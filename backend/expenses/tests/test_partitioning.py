@@ -0,0 +1,172 @@
+from datetime import date
+from io import StringIO
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from expenses.models import Expense, ExpenseCategory
+from expenses.partitioning import (
+    PartitioningError,
+    create_partitions,
+    is_partitioned,
+    next_start,
+    partition_expense_table,
+    partitions,
+    shift_interval,
+)
+
+
+class PartitionIntervalTests(TestCase):
+    """Test cases for partition interval arithmetic."""
+
+    def test_next_start(self):
+        self.assertEqual(next_start(date(2025, 1, 1), 'year'), date(2026, 1, 1))
+        self.assertEqual(
+            next_start(date(2025, 12, 1), 'month'), date(2026, 1, 1)
+        )
+        self.assertEqual(
+            next_start(date(2025, 3, 1), 'month'), date(2025, 4, 1)
+        )
+
+    def test_shift_interval(self):
+        self.assertEqual(
+            shift_interval(date(2025, 11, 17), 'month', 3), date(2026, 2, 1)
+        )
+        self.assertEqual(
+            shift_interval(date(2025, 11, 17), 'year', 0), date(2025, 1, 1)
+        )
+
+
+@skipUnless(
+    connection.vendor == 'postgresql',
+    'Table partitioning is specific to PostgreSQL'
+)
+@override_settings(
+    EXPENSE_PARTITION_INTERVAL='year',
+    EXPENSE_PARTITIONS_AHEAD=1
+)
+class PartitioningTests(TestCase):
+    """Test cases for converting the expense table to partitions."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.category = ExpenseCategory.objects.create(name='Food')
+        self.expenses = [
+            Expense.objects.create(
+                user=self.user,
+                amount='10.00',
+                description=f'Expense {year}',
+                category=self.category,
+                date=date(year, 6, 1)
+            )
+            for year in (2023, 2024)
+        ]
+
+    def explain(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN ' + sql, params)
+            return '\n'.join(row[0] for row in cursor.fetchall())
+
+    def test_partition_expense_table(self):
+        self.assertFalse(is_partitioned())
+        names = partition_expense_table()
+
+        self.assertTrue(is_partitioned())
+        this_year = timezone.localdate().year
+        self.assertEqual(
+            names,
+            [f'expenses_expense_p{year}' for year in range(2023, this_year + 2)]
+        )
+        self.assertEqual(
+            sorted(Expense.objects.values_list('pk', flat=True)),
+            sorted(expense.pk for expense in self.expenses)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename = 'expenses_expense'"
+            )
+            indexes = {row[0] for row in cursor.fetchall()}
+        self.assertIn('expenses_expense_pkey', indexes)
+        self.assertIn('expense_user_category_date_idx', indexes)
+
+    def test_orm_writes_after_partitioning(self):
+        partition_expense_table()
+
+        expense = Expense.objects.create(
+            user=self.user,
+            amount='5.00',
+            description='New',
+            category=self.category,
+            date=date(2024, 2, 1)
+        )
+        self.assertGreater(expense.pk, max(e.pk for e in self.expenses))
+
+        # Updates may move a row to another partition
+        expense.date = date(2023, 2, 1)
+        expense.save()
+        self.assertEqual(
+            Expense.objects.filter(date__year=2023).count(), 2
+        )
+
+        expense.delete()
+        self.assertEqual(Expense.objects.count(), 2)
+
+    def test_date_filters_prune_partitions(self):
+        partition_expense_table()
+
+        plan = self.explain(Expense.objects.filter(
+            user=self.user,
+            date__gte=date(2024, 1, 1),
+            date__lte=date(2024, 12, 31)
+        ))
+        self.assertIn('expenses_expense_p2024', plan)
+        self.assertNotIn('expenses_expense_p2023', plan)
+        self.assertNotIn('expenses_expense_default', plan)
+
+    def test_create_partitions_moves_rows_from_default(self):
+        partition_expense_table()
+        future = shift_interval(timezone.localdate(), 'year', 3)
+        # Beyond the partitions created up front, so it lands in default
+        Expense.objects.create(
+            user=self.user,
+            amount='5.00',
+            description='Far ahead',
+            category=self.category,
+            date=future
+        )
+
+        created = create_partitions(future)
+
+        self.assertEqual(len(created), 2)
+        self.assertEqual(partitions()[-1][0], f'expenses_expense_p{future.year}')
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM expenses_expense_default')
+            self.assertEqual(cursor.fetchone()[0], 0)
+        self.assertEqual(Expense.objects.filter(date=future).count(), 1)
+
+    def test_create_partitions_requires_partitioned_table(self):
+        with self.assertRaises(PartitioningError):
+            create_partitions(timezone.localdate())
+
+    def test_commands(self):
+        out = StringIO()
+        call_command('partition_expenses', stdout=out)
+        self.assertIn('Partitioned the expense table', out.getvalue())
+
+        out = StringIO()
+        call_command('create_expense_partitions', '--ahead', '2', stdout=out)
+        next_year = timezone.localdate().year + 2
+        self.assertIn(f'expenses_expense_p{next_year}', out.getvalue())
+
+        out = StringIO()
+        call_command('create_expense_partitions', '--ahead', '2', stdout=out)
+        self.assertIn('already exist', out.getvalue())
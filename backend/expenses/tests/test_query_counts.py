@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from expenses.cache import get_report_cache
+from expenses.models import Expense, ExpenseCategory
+from expenses.rollups import rebuild_rollups
+from expenses.tests.utils import QueryCountAssertionsMixin
+
+
+class QueryCountTests(QueryCountAssertionsMixin, APITestCase):
+    """Test cases asserting endpoints don't issue a query per row."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.categories = []
+        self.client.force_authenticate(user=self.user)
+
+    def grow(self, size):
+        """Top up to ``size`` expenses, over one category per five of them."""
+        while len(self.categories) < size // 5:
+            self.categories.append(ExpenseCategory.objects.create(
+                name=f'Category {len(self.categories)}'
+            ))
+        existing = Expense.objects.filter(user=self.user).count()
+        Expense.objects.bulk_create(
+            Expense(
+                user=self.user,
+                amount=Decimal(index % 500) + Decimal('0.25'),
+                description=f'Expense {index}',
+                category=self.categories[index % len(self.categories)],
+                date=date(2026, 1, 1) - timedelta(days=index % 90)
+            )
+            for index in range(existing, size)
+        )
+        # bulk_create skips the signals that keep rollups current
+        rebuild_rollups(user_ids=[self.user.pk])
+
+    def get(self, url, params=None):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_expense_list(self):
+        url = reverse('expense-list')
+        self.assertConstantQueries(self.grow, lambda: self.get(url))
+        self.assertConstantQueries(
+            self.grow, lambda: self.get(url, {'pagination': 'cursor'})
+        )
+
+    def test_expense_retrieve(self):
+        def retrieve():
+            expense = Expense.objects.filter(user=self.user).last()
+            self.get(reverse('expense-detail', kwargs={'pk': expense.pk}))
+
+        self.assertConstantQueries(self.grow, retrieve)
+
+    def test_expense_create(self):
+        def create():
+            response = self.client.post(reverse('expense-list'), {
+                'amount': '12.00',
+                'description': 'Lunch',
+                'category_id': self.categories[0].id,
+                'date': '2026-01-01',
+            }, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertConstantQueries(self.grow, create)
+
+    def test_category_list(self):
+        url = reverse('category-list')
+        self.assertConstantQueries(self.grow, lambda: self.get(url))
+
+    def test_summary(self):
+        url = reverse('report-summary')
+
+        def summary():
+            # Measure the computed report, not a cache hit
+            get_report_cache().clear()
+            self.get(url, {'date_from': '2025-10-01', 'date_to': '2026-01-01'})
+
+        self.assertConstantQueries(self.grow, summary)
+
+    def test_failure_lists_the_repeated_query(self):
+        def per_row():
+            for expense in Expense.objects.filter(user=self.user):
+                expense.category.name
+
+        with self.assertRaises(AssertionError) as context:
+            self.assertConstantQueries(self.grow, per_row, sizes=(10, 20))
+
+        message = str(context.exception)
+        self.assertIn('11 queries with 10 rows but 21 with 20 rows', message)
+        self.assertIn('10 more x SELECT', message)
+        self.assertIn('"expenses_expensecategory"', message)
@@ -0,0 +1,123 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock, skipIf
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from expenses.models import Expense, ExpenseCategory
+from expenses.parsers import FastJSONParser
+from expenses.renderers import FastJSONRenderer, orjson
+
+
+PAYLOAD = ReturnDict([
+    ('amount', Decimal('12.50')),
+    ('total', Decimal('1234567.89')),
+    ('zero', Decimal('0.00')),
+    ('negative', Decimal('-0.10')),
+    ('float', 0.1),
+    ('created_at', datetime(2026, 3, 1, 8, 30, 15, 123456, tzinfo=timezone.utc)),
+    ('local', datetime(2026, 3, 1, 8, 30, tzinfo=timezone(timedelta(hours=2)))),
+    ('naive', datetime(2026, 3, 1, 8, 30)),
+    ('date', date(2026, 3, 1)),
+    ('time', time(8, 30, 15, 500000)),
+    ('lazy', gettext_lazy('This field is required.')),
+    ('text', 'Café \u2028 line \u2029 break "quoted" \\ </script>'),
+    ('nested', [{1: 'int key', 'none': None, 'flag': True}]),
+], serializer=None)
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class FastJSONRendererTests(APITestCase):
+    """Test cases for the orjson renderer and parser."""
+
+    def test_matches_stock_renderer(self):
+        self.assertEqual(
+            FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD)
+        )
+
+    def test_falls_back_without_orjson(self):
+        with mock.patch('expenses.renderers.orjson', None):
+            self.assertEqual(
+                FastJSONRenderer().render(PAYLOAD),
+                JSONRenderer().render(PAYLOAD)
+            )
+
+    def test_indented_output_uses_stock_renderer(self):
+        renderer = FastJSONRenderer()
+        self.assertEqual(
+            renderer.render(PAYLOAD, 'application/json; indent=2'),
+            JSONRenderer().render(PAYLOAD, 'application/json; indent=2')
+        )
+
+    def test_rejects_non_finite_decimals(self):
+        with self.assertRaises((TypeError, ValueError)):
+            FastJSONRenderer().render({'amount': Decimal('NaN')})
+
+    def test_parser_matches_stock_parser(self):
+        body = JSONRenderer().render(PAYLOAD)
+        self.assertEqual(
+            FastJSONParser().parse(BytesIO(body)),
+            JSONParser().parse(BytesIO(body))
+        )
+
+    def test_parser_errors(self):
+        for body in (b'{"amount": ', b'{"amount": NaN}'):
+            with self.assertRaises(ParseError):
+                FastJSONParser().parse(BytesIO(body))
+
+
+class FastJSONEndpointTests(APITestCase):
+    """Test cases for JSON responses rendered through the default renderer."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.food = ExpenseCategory.objects.create(name='Food')
+        self.transport = ExpenseCategory.objects.create(name='Transport')
+        for index in range(5):
+            Expense.objects.create(
+                user=self.user,
+                amount=Decimal('10.05') * (index + 1),
+                description=f'Expense {index} \u2028 café',
+                category=self.food if index % 2 else self.transport,
+                date=date(2026, 1, index + 1)
+            )
+        self.client.force_authenticate(user=self.user)
+
+    def assertSameAsStockRenderer(self, url, params=None):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.accepted_renderer, FastJSONRenderer)
+        self.assertEqual(
+            response.content,
+            JSONRenderer().render(response.data, 'application/json')
+        )
+
+    def test_list(self):
+        self.assertSameAsStockRenderer(reverse('expense-list'))
+
+    def test_summary(self):
+        self.assertSameAsStockRenderer(reverse('report-summary'), {
+            'date_from': '2026-01-01',
+            'date_to': '2026-01-31',
+        })
+
+    def test_create_parses_json_body(self):
+        response = self.client.post(reverse('expense-list'), {
+            'amount': '20.00',
+            'description': 'Taxi',
+            'category_id': self.transport.id,
+            'date': '2026-01-10',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['amount'], '20.00')
@@ -0,0 +1,164 @@
+import threading
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from expenses.cache import get_report_cache
+from expenses.metrics import registry
+from expenses.models import Expense, ExpenseCategory
+from expenses.parallel import QueryExecutor, get_query_executor
+
+
+class ReportBatchMixin:
+    """Expenses of two users, plus report specs covering every type."""
+
+    def create_data(self):
+        self.user = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        other = User.objects.create_user(
+            username='user2',
+            password='testpass123'
+        )
+        self.food = ExpenseCategory.objects.create(name='Food')
+        self.transport = ExpenseCategory.objects.create(name='Transport')
+        today = date.today()
+        for offset in range(20):
+            Expense.objects.create(
+                user=self.user,
+                amount='10.00',
+                description=f'Lunch {offset}',
+                category=self.food if offset % 3 else self.transport,
+                date=today - timedelta(days=offset)
+            )
+        Expense.objects.create(
+            user=other,
+            amount='999.00',
+            description='Not mine',
+            category=self.food,
+            date=today
+        )
+        self.specs = [
+            {
+                'type': 'summary',
+                'date_from': str(today - timedelta(days=6)),
+                'date_to': str(today),
+            },
+            {'type': 'summary', 'category': str(self.food.id)},
+            {'type': 'timeseries', 'granularity': 'week'},
+            {'type': 'forecast', 'horizon': 7, 'history': 30},
+        ]
+
+    def batch(self, reports):
+        return self.client.post(
+            reverse('report-batch'), {'reports': reports}, format='json'
+        )
+
+    def assertMatchesSingleReports(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()['results']
+        self.assertEqual(len(results), len(self.specs))
+        for spec, result in zip(self.specs, results):
+            params = dict(spec)
+            single = self.client.get(
+                reverse(f'report-{params.pop("type")}'), params
+            )
+            self.assertEqual(result, single.json())
+
+
+class ReportBatchTests(ReportBatchMixin, APITestCase):
+    """Test cases for the report batch endpoint."""
+
+    def setUp(self):
+        self.create_data()
+        self.client.force_authenticate(user=self.user)
+        get_report_cache().clear()
+
+    def test_results_match_single_reports(self):
+        response = self.batch(self.specs)
+        self.assertMatchesSingleReports(response)
+        self.assertEqual(response.json()['results'][1]['total_amount'], 130.0)
+
+    def test_invalid_reports(self):
+        response = self.batch([
+            {'type': 'summary'},
+            {'type': 'budget'},
+            {'type': 'timeseries', 'granularity': 'hour'},
+            {'type': 'summary', 'date_from': 'yesterday'},
+            {'type': 'forecast', 'horizon': 'soon'},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # Errors by item index, for the invalid items only
+        errors = response.json()['reports']
+        self.assertEqual(sorted(errors), ['1', '2', '3', '4'])
+        self.assertIn('type', errors['1'])
+        self.assertIn('granularity', errors['2'])
+        self.assertIn('date_from', errors['3'])
+        self.assertIn('horizon', errors['4'])
+
+    def test_batch_size(self):
+        response = self.batch([])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.batch([{'type': 'summary'}] * 11)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_authentication(self):
+        self.client = APIClient()
+        response = self.batch(self.specs)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@override_settings(REPORT_BATCH={'WORKERS': 3})
+class ConcurrentReportBatchTests(ReportBatchMixin, TransactionTestCase):
+    """Test cases for reports computed on the executor's own connections."""
+
+    def setUp(self):
+        self.create_data()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        get_report_cache().clear()
+
+    def tearDown(self):
+        get_query_executor().shutdown()
+
+    def test_results_match_single_reports(self):
+        self.assertMatchesSingleReports(self.batch(self.specs))
+
+    def test_queries_count_towards_the_request(self):
+        registry.clear()
+        response = self.batch(self.specs)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Every report queries on an executor thread, the cache being empty
+        queries = registry.snapshot()['ReportViewSet.batch']['queries']
+        self.assertGreaterEqual(queries['sum'], len(self.specs))
+        self.assertIn(
+            f'desc="{queries["sum"]:.0f} queries"', response['Server-Timing']
+        )
+
+    def test_functions_run_concurrently(self):
+        # Only returns if all three calls wait on the barrier at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def task():
+            barrier.wait()
+            return threading.current_thread().name
+
+        names = get_query_executor().map([task, task, task])
+        self.assertEqual(len(set(names)), 3)
+        self.assertNotIn(threading.current_thread().name, names)
+
+    def test_exceptions_propagate(self):
+        def fail():
+            raise ValueError('no report')
+
+        executor = QueryExecutor(2)
+        try:
+            with self.assertRaisesMessage(ValueError, 'no report'):
+                executor.map([fail, lambda: 1])
+        finally:
+            executor.shutdown()
@@ -62,6 +62,13 @@ class ReportTests(APITestCase):
             HTTP_AUTHORIZATION=f'Bearer {self.token.access_token}'
         )
         self.summary_url = reverse('report-summary')
+        self.timeseries_url = reverse('report-timeseries')
+
+    def _move_expenses_to(self, new_date):
+        """Move all of user1's expenses to a single date."""
+        for expense in Expense.objects.filter(user=self.user1):
+            expense.date = new_date
+            expense.save()
 
     def test_summary_report_unauthenticated(self):
         """Test summary report fails when unauthenticated."""
@@ -210,6 +217,20 @@ class ReportTests(APITestCase):
         self.assertEqual(response.data['total_amount'], 100.00)
         self.assertEqual(response.data['total_count'], 1)
 
+    def test_summary_report_single_query(self):
+        """Test summary report is computed in one database round trip."""
+        self.client.force_authenticate(user=self.user1)
+        
+        with self.assertNumQueries(1):
+            response = self.client.get(self.summary_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_amount'], 180.00)
+        
+        with self.assertNumQueries(1):
+            response = self.client.get(self.summary_url, {'description': 'Bus'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 1)
+
     def test_summary_report_user_isolation(self):
         """Test summary report only includes current user's expenses."""
         response = self.client.get(self.summary_url)
@@ -249,3 +270,67 @@ class ReportTests(APITestCase):
         self.assertEqual(filters['date_from'], str(date.today() - timedelta(days=1)))
         self.assertEqual(filters['date_to'], str(date.today()))
         self.assertEqual(filters['description'], 'Lunch')
+
+    def test_timeseries_report_by_day(self):
+        """Test timeseries report returns one column entry per (day, category)."""
+        response = self.client.get(self.timeseries_url, {'granularity': 'day'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['granularity'], 'day')
+        columns = response.data['columns']
+        self.assertEqual(columns['bucket'], [
+            str(date.today() - timedelta(days=2)),
+            str(date.today() - timedelta(days=1)),
+            str(date.today()),
+        ])
+        self.assertEqual(columns['category_id'], [
+            self.category2.id, self.category1.id, self.category1.id
+        ])
+        self.assertEqual(columns['total'], [30.00, 50.00, 100.00])
+        self.assertEqual(columns['count'], [1, 1, 1])
+        self.assertEqual(response.data['categories'], {
+            str(self.category1.id): 'Food',
+            str(self.category2.id): 'Transport',
+        })
+
+    def test_timeseries_report_by_month(self):
+        """Test timeseries report groups expenses of the same month."""
+        self._move_expenses_to(date(2024, 3, 15))
+        response = self.client.get(self.timeseries_url, {'granularity': 'month'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        columns = response.data['columns']
+        self.assertEqual(columns['bucket'], ['2024-03-01', '2024-03-01'])
+        self.assertEqual(columns['total'], [150.00, 30.00])
+        self.assertEqual(columns['count'], [2, 1])
+
+    def test_timeseries_report_by_week(self):
+        """Test timeseries report buckets by the Monday of each week."""
+        self._move_expenses_to(date(2024, 3, 14))
+        response = self.client.get(self.timeseries_url, {'granularity': 'week'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['columns']['bucket'], ['2024-03-11', '2024-03-11']
+        )
+
+    def test_timeseries_report_filters(self):
+        """Test timeseries report applies the same filters as summary."""
+        response = self.client.get(
+            self.timeseries_url,
+            {
+                'category': str(self.category1.id),
+                'description': 'Lunch',
+            }
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['columns']['total'], [100.00])
+        self.assertEqual(response.data['filters']['description'], 'Lunch')
+
+    def test_timeseries_report_invalid_granularity(self):
+        """Test timeseries report rejects unknown granularities."""
+        response = self.client.get(self.timeseries_url, {'granularity': 'year'})
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('granularity', response.data)
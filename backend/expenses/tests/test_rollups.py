@@ -0,0 +1,125 @@
+from decimal import Decimal
+from datetime import date, timedelta
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from expenses.models import Expense, ExpenseCategory, ExpenseDailyRollup
+
+
+class ExpenseDailyRollupTests(TestCase):
+    """Test cases for incremental daily rollup maintenance."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.food = ExpenseCategory.objects.create(name='Food')
+        self.transport = ExpenseCategory.objects.create(name='Transport')
+        self.today = date.today()
+
+    def _create_expense(self, amount, category=None, expense_date=None):
+        return Expense.objects.create(
+            user=self.user,
+            amount=amount,
+            description='Expense',
+            category=category or self.food,
+            date=expense_date or self.today
+        )
+
+    def _rollups(self):
+        return {
+            (rollup.category_id, rollup.date): (rollup.total, rollup.count)
+            for rollup in ExpenseDailyRollup.objects.filter(user=self.user)
+        }
+
+    def test_create_adds_to_rollup(self):
+        """Test creating expenses accumulates into the same daily row."""
+        self._create_expense('10.50')
+        self._create_expense('4.50')
+
+        self.assertEqual(self._rollups(), {
+            (self.food.id, self.today): (Decimal('15.00'), 2),
+        })
+
+    def test_update_amount(self):
+        """Test editing an amount adjusts the rollup total."""
+        expense = self._create_expense('10.00')
+        expense = Expense.objects.get(pk=expense.pk)
+        expense.amount = Decimal('25.00')
+        expense.save()
+
+        self.assertEqual(self._rollups(), {
+            (self.food.id, self.today): (Decimal('25.00'), 1),
+        })
+
+    def test_update_moves_between_rows(self):
+        """Test changing category and date moves the expense between rows."""
+        self._create_expense('5.00')
+        expense = self._create_expense('10.00')
+        yesterday = self.today - timedelta(days=1)
+
+        expense.category = self.transport
+        expense.date = yesterday
+        expense.save()
+
+        self.assertEqual(self._rollups(), {
+            (self.food.id, self.today): (Decimal('5.00'), 1),
+            (self.transport.id, yesterday): (Decimal('10.00'), 1),
+        })
+
+    def test_update_unloaded_instance(self):
+        """Test saving an instance built by hand still adjusts the old row."""
+        expense = self._create_expense('10.00')
+        Expense(
+            pk=expense.pk,
+            user=self.user,
+            amount='7.00',
+            description='Edited',
+            category=self.transport,
+            date=str(self.today),
+            created_at=expense.created_at
+        ).save()
+
+        self.assertEqual(self._rollups(), {
+            (self.transport.id, self.today): (Decimal('7.00'), 1),
+        })
+
+    def test_delete_removes_empty_row(self):
+        """Test deleting the last expense of a day removes the rollup row."""
+        keep = self._create_expense('3.00')
+        expense = self._create_expense('10.00', category=self.transport)
+
+        expense.delete()
+
+        self.assertEqual(self._rollups(), {
+            (self.food.id, self.today): (Decimal('3.00'), 1),
+        })
+        keep.delete()
+        self.assertEqual(self._rollups(), {})
+
+    def test_delete_user(self):
+        """Test deleting a user with expenses cascades cleanly."""
+        self._create_expense('10.00')
+
+        self.user.delete()
+
+        self.assertFalse(ExpenseDailyRollup.objects.exists())
+
+    def test_rebuild_command(self):
+        """Test the rebuild command recomputes rollups from expenses."""
+        self._create_expense('10.00')
+        self._create_expense('5.00', category=self.transport)
+        ExpenseDailyRollup.objects.all().delete()
+        Expense.objects.filter(category=self.food).update(amount='12.00')
+
+        out = StringIO()
+        call_command('rebuild_expense_rollups', stdout=out)
+
+        self.assertIn('Rebuilt 2 daily rollup rows', out.getvalue())
+        self.assertEqual(self._rollups(), {
+            (self.food.id, self.today): (Decimal('12.00'), 1),
+            (self.transport.id, self.today): (Decimal('5.00'), 1),
+        })
@@ -0,0 +1,209 @@
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from expenses.models import Expense, ExpenseCategory, ExpenseTombstone
+from expenses.sync import SYNC_OVERLAP, encode_token
+
+
+class ExpenseSyncTests(APITestCase):
+    """Test cases for the delta sync endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username='user1',
+            password='testpass123'
+        )
+        self.user2 = User.objects.create_user(
+            username='user2',
+            password='testpass123'
+        )
+        self.category = ExpenseCategory.objects.create(name='Food')
+        self.expense = self._create_expense(self.user1, 'Lunch')
+        self.other_expense = self._create_expense(self.user2, 'Other')
+        self.client.force_authenticate(user=self.user1)
+        self.changes_url = reverse('expense-changes')
+
+    def _create_expense(self, user, description):
+        return Expense.objects.create(
+            user=user,
+            amount='10.00',
+            description=description,
+            category=self.category,
+            date=date.today()
+        )
+
+    def _age(self, expense, delta):
+        Expense.objects.filter(pk=expense.pk).update(
+            updated_at=timezone.now() - delta
+        )
+
+    def test_initial_sync_returns_everything(self):
+        """Test a sync without a token returns all of the user's expenses."""
+        response = self.client.get(self.changes_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['full_sync'])
+        self.assertEqual(
+            [expense['id'] for expense in response.data['changed']],
+            [self.expense.id]
+        )
+        self.assertEqual(response.data['changed'][0]['category']['name'], 'Food')
+        self.assertEqual(response.data['deleted'], [])
+        self.assertTrue(response.data['token'])
+
+    def test_delta_sync(self):
+        """Test a token only returns what changed after it."""
+        unchanged = self._create_expense(self.user1, 'Unchanged')
+        deleted = self._create_expense(self.user1, 'Deleted')
+        for expense in (self.expense, unchanged, deleted):
+            self._age(expense, timedelta(hours=1))
+        since = encode_token(timezone.now() - timedelta(minutes=30))
+
+        self.expense.amount = '12.00'
+        self.expense.save()
+        created = self._create_expense(self.user1, 'New')
+        deleted_id = deleted.id
+        deleted.delete()
+        self.other_expense.delete()
+
+        response = self.client.get(self.changes_url, {'since': since})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['full_sync'])
+        self.assertEqual(
+            [expense['id'] for expense in response.data['changed']],
+            [self.expense.id, created.id]
+        )
+        self.assertEqual(response.data['deleted'], [deleted_id])
+
+    def test_next_token_overlaps(self):
+        """Test the returned token reaches back by the overlap window."""
+        now = timezone.now()
+        with mock.patch('expenses.sync.timezone.now', return_value=now):
+            response = self.client.get(self.changes_url)
+
+        self.assertEqual(response.data['token'], encode_token(now - SYNC_OVERLAP))
+
+    def test_invalid_token(self):
+        """Test a malformed token is rejected."""
+        response = self.client.get(self.changes_url, {'since': 'garbage'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('since', response.data)
+
+    def test_expired_token(self):
+        """Test a token older than tombstone retention requires a full sync."""
+        since = encode_token(timezone.now() - timedelta(days=365))
+
+        response = self.client.get(self.changes_url, {'since': since})
+
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def _sync_pages(self, params):
+        """Follow continuation tokens; return every page of one sync."""
+        pages = []
+        while True:
+            response = self.client.get(self.changes_url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data)
+            if not response.data['has_more']:
+                return pages
+            params = dict(params, since=response.data['token'])
+
+    def test_full_sync_is_paged(self):
+        """Test a full sync comes in pages, each expense exactly once."""
+        created = [
+            self._create_expense(self.user1, f'Item {index}')
+            for index in range(4)
+        ]
+        now = timezone.now()
+        with mock.patch('expenses.sync.timezone.now', return_value=now):
+            pages = self._sync_pages({'limit': 2})
+
+        self.assertEqual([len(page['changed']) for page in pages], [2, 2, 1])
+        self.assertEqual(
+            [expense['id'] for page in pages for expense in page['changed']],
+            [self.expense.id, *(expense.id for expense in created)]
+        )
+        self.assertTrue(all(page['full_sync'] for page in pages))
+        # The final token starts the next sync from when this one began
+        self.assertEqual(pages[-1]['token'], encode_token(now - SYNC_OVERLAP))
+
+    def test_delta_sync_deletions_are_paged(self):
+        """Test deletions are paged alongside changes."""
+        since = encode_token(timezone.now() - timedelta(minutes=1))
+        deleted_ids = []
+        for index in range(3):
+            expense = self._create_expense(self.user1, f'Deleted {index}')
+            deleted_ids.append(expense.id)
+            expense.delete()
+
+        pages = self._sync_pages({'since': since, 'limit': 2})
+
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(
+            [expense_id for page in pages for expense_id in page['deleted']],
+            deleted_ids
+        )
+        self.assertEqual(
+            [expense['id'] for page in pages for expense in page['changed']],
+            [self.expense.id]
+        )
+
+    def test_categories_in_first_page(self):
+        """Test the first page lists every category, renames included."""
+        for index in range(2):
+            self._create_expense(self.user1, f'Item {index}')
+        self.category.name = 'Groceries'
+        self.category.save()
+        ExpenseCategory.objects.create(name='Transport')
+
+        pages = self._sync_pages({'limit': 2})
+
+        self.assertEqual(
+            [category['name'] for category in pages[0]['categories']],
+            ['Groceries', 'Transport']
+        )
+        self.assertIsNone(pages[1]['categories'])
+
+        # Deleted categories drop out of the next sync's list
+        ExpenseCategory.objects.filter(name='Transport').delete()
+        response = self.client.get(
+            self.changes_url, {'since': pages[-1]['token']}
+        )
+        self.assertEqual(
+            [category['name'] for category in response.data['categories']],
+            ['Groceries']
+        )
+
+    def test_invalid_limit(self):
+        """Test page sizes outside the allowed range are rejected."""
+        for limit in ('0', '1001', 'many'):
+            response = self.client.get(self.changes_url, {'limit': limit})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('limit', response.data)
+
+    def test_purge_tombstones_command(self):
+        """Test the purge command drops tombstones past retention."""
+        expense_id = self.expense.id
+        self.expense.delete()
+        old = ExpenseTombstone.objects.create(user=self.user1, expense_id=999)
+        ExpenseTombstone.objects.filter(pk=old.pk).update(
+            deleted_at=timezone.now() - timedelta(days=365)
+        )
+
+        out = StringIO()
+        call_command('purge_expense_tombstones', stdout=out)
+
+        self.assertIn('Purged 1 tombstones', out.getvalue())
+        self.assertEqual(
+            list(ExpenseTombstone.objects.values_list('expense_id', flat=True)),
+            [expense_id]
+        )
@@ -0,0 +1,47 @@
+from collections import Counter
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from expenses.metrics import normalize_sql
+
+
+class QueryCountAssertionsMixin:
+    """Assertions guarding test cases against N+1 query regressions."""
+
+    def capture_queries(self, request):
+        """Run ``request()`` and return the SQL of the queries it made."""
+        with CaptureQueriesContext(connection) as context:
+            request()
+        # Copy now: the query log is reset when the next request starts
+        return [query['sql'] for query in context.captured_queries]
+
+    def assertConstantQueries(self, grow, request, sizes=(10, 100, 1000)):
+        """
+        Assert ``request()`` makes as many queries at every dataset size.
+
+        ``grow(size)`` enlarges the data to ``size`` rows before each
+        measurement. ``request`` is called once beforehand, so one-off
+        lookups don't count. On failure the message lists the statements
+        that ran more often at the larger size.
+        """
+        grow(sizes[0])
+        request()
+        runs = []
+        for size in sizes:
+            grow(size)
+            runs.append((size, self.capture_queries(request)))
+
+        baseline_size, baseline = runs[0]
+        for size, queries in runs[1:]:
+            if len(queries) == len(baseline):
+                continue
+            expected = Counter(normalize_sql(sql) for sql in baseline)
+            extra = Counter(normalize_sql(sql) for sql in queries) - expected
+            offending = '\n'.join(
+                f'  {count} more x {sql}' for sql, count in extra.most_common()
+            )
+            self.fail(
+                f'{len(baseline)} queries with {baseline_size} rows but '
+                f'{len(queries)} with {size} rows:\n{offending}'
+            )
@@ -4,15 +4,23 @@ from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
 )
-from .views import ExpenseViewSet, ExpenseCategoryViewSet, ReportViewSet
+from .views import (
+    BudgetViewSet,
+    ExpenseViewSet,
+    ExpenseCategoryViewSet,
+    MetricsView,
+    ReportViewSet,
+)
 
 router = DefaultRouter()
 router.register(r'expenses', ExpenseViewSet, basename='expense')
 router.register(r'categories', ExpenseCategoryViewSet, basename='category')
 router.register(r'reports', ReportViewSet, basename='report')
+router.register(r'budgets', BudgetViewSet, basename='budget')
 
 urlpatterns = [
     path('auth/login/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
     path('', include(router.urls)),
 ]
@@ -1,20 +1,84 @@
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Sum, Count
-from datetime import datetime
-from .models import Expense, ExpenseCategory
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+import io
+from datetime import datetime, timedelta
+from functools import partial
+from .asyncviews import AsyncViewSetMixin
+from .budgets import refresh_periods
+from .cache import get_report_cache
+from .categories import get_category_catalog
+from .conditional import (
+    ConditionalListMixin,
+    conditional_response,
+    make_etag,
+    set_validators,
+)
+from .metrics import registry as metrics_registry
+from .models import Budget, Expense, ExpenseCategory
+from .export import astream_csv, astream_ndjson, stream_csv, stream_ndjson
+from .filters import ExpenseSearchFilter
+from .forecast import build_forecast, fit_forecast, parse_forecast_params
+from .importers import ExpenseImporter, ImportFormatError
+from .pagination import ExpenseKeysetPagination
+from .parallel import get_query_executor
+from .renderers import (
+    CSVRenderer,
+    FastJSONRenderer,
+    NDJSONRenderer,
+    PrometheusRenderer,
+)
+from .sync import (
+    SYNC_MAX_PAGE_SIZE,
+    SYNC_PAGE_SIZE,
+    InvalidSyncToken,
+    changes_since,
+    decode_token,
+    token_expired,
+)
+from .reports import (
+    abuild_summary,
+    build_summary,
+    build_timeseries,
+    normalize_filters,
+    parse_category_ids,
+    parse_granularity,
+)
+from .bulk import (
+    BULK_MAX_ITEMS,
+    bulk_create_expenses,
+    bulk_delete_expenses,
+    bulk_update_expenses,
+)
 from .serializers import (
     ExpenseSerializer,
     ExpenseListSerializer,
     ExpenseCategorySerializer,
+    ExpenseBulkSerializer,
+    ExpenseBulkDeleteSerializer,
+    BudgetSerializer,
+    BudgetStatusSerializer,
+    ReportBatchSerializer,
+    expense_list_values,
+    represent_expense_rows,
 )
 
 
-class ExpenseCategoryViewSet(viewsets.ModelViewSet):
+class ExpenseCategoryViewSet(
+    ConditionalListMixin, AsyncViewSetMixin, viewsets.ModelViewSet
+):
     """ViewSet for managing expense categories."""
+    async_actions = ('list',)
     queryset = ExpenseCategory.objects.all()
     serializer_class = ExpenseCategorySerializer
     permission_classes = [IsAuthenticated]
@@ -23,19 +87,115 @@ class ExpenseCategoryViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
 
+    def get_catalog_snapshot(self):
+        """
+        Return the category catalog's snapshot, if it can serve this list.
+
+        The catalog holds every category serialized in the default order,
+        so searched or reordered lists still go to the database.
+        """
+        params = self.request.query_params
+        if params.get(filters.SearchFilter.search_param) or params.get(
+            filters.OrderingFilter.ordering_param
+        ):
+            return None
+        return get_category_catalog().snapshot()
+
+    def catalog_list(self, request, snapshot):
+        """Serve the list from a catalog snapshot, without any query."""
+        etag = self.list_etag(request, snapshot.last_modified, snapshot.count)
+        not_modified = conditional_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        page = self.paginate_queryset(snapshot.serialized)
+        if page is not None:
+            response = self.get_paginated_response(page)
+        else:
+            response = Response(snapshot.serialized)
+        return set_validators(response, etag)
+
+    def list(self, request, *args, **kwargs):
+        snapshot = self.get_catalog_snapshot()
+        if snapshot is None:
+            return super().list(request, *args, **kwargs)
+        return self.catalog_list(request, snapshot)
+
+    async def alist(self, request, *args, **kwargs):
+        snapshot = await sync_to_async(self.get_catalog_snapshot)()
+        if snapshot is None:
+            return await super().alist(request, *args, **kwargs)
+        return self.catalog_list(request, snapshot)
+
 
-class ExpenseViewSet(viewsets.ModelViewSet):
+class ExpenseRowsListMixin(AsyncViewSetMixin):
+    """
+    List expenses from ``values()`` rows instead of model instances.
+
+    Output is the same as ``ExpenseListSerializer``'s, but pages are read
+    as plain dicts with the category name joined in and formatted
+    directly. Both paginators accept value rows. The list is served
+    async.
+    """
+    async_actions = ('list',)
+
+    def list(self, request, *args, **kwargs):
+        queryset = expense_list_values(
+            self.filter_queryset(self.get_queryset())
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(represent_expense_rows(page))
+        return Response(represent_expense_rows(queryset))
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = expense_list_values(await self.afilter_queryset())
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(represent_expense_rows(page))
+        return Response(
+            represent_expense_rows([row async for row in queryset])
+        )
+
+
+class ExpenseViewSet(
+    ConditionalListMixin, ExpenseRowsListMixin, viewsets.ModelViewSet
+):
     """ViewSet for managing expenses."""
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    # List rows embed the category name, so renames must change the ETag too
+    last_modified_fields = ['updated_at', 'category__updated_at']
+    filter_backends = [DjangoFilterBackend, ExpenseSearchFilter, filters.OrderingFilter]
     filterset_fields = ['date']  # Removed 'category' - handled manually for multi-select
-    search_fields = ['description', 'category__name']
+    search_fields = ['description', 'category__name']  # see ExpenseSearchFilter
     ordering_fields = ['date', 'amount', 'created_at']
     ordering = ['-date', '-created_at']
 
+    def use_cursor_pagination(self):
+        """Whether the client opted into keyset pagination."""
+        params = self.request.query_params
+        return params.get('pagination') == 'cursor' or 'cursor' in params
+
+    @property
+    def paginator(self):
+        """Use keyset pagination when requested, page numbers otherwise."""
+        if not hasattr(self, '_paginator'):
+            if self.use_cursor_pagination():
+                self._paginator = ExpenseKeysetPagination()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
+
+    def use_conditional_get(self):
+        # The list ETag needs a COUNT over all matching rows, which is exactly
+        # what cursor pagination is meant to avoid.
+        return not self.use_cursor_pagination()
+
     def get_queryset(self):
         """Return expenses for the authenticated user."""
-        queryset = Expense.objects.filter(user=self.request.user)
+        queryset = Expense.objects.filter(
+            user=self.request.user
+        ).select_related('category')
         
         # Filter by date range
         date_from = self.request.query_params.get('date_from', None)
@@ -47,80 +207,284 @@ class ExpenseViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(date__lte=date_to)
         
         # Support multiple categories (comma-separated IDs)
-        category = self.request.query_params.get('category', None)
-        if category:
-            category_ids = []
-            for cid in category.split(','):
-                cid = cid.strip()
-                if cid:
-                    try:
-                        category_ids.append(int(cid))
-                    except ValueError:
-                        # Skip invalid category IDs
-                        continue
-            if category_ids:
-                queryset = queryset.filter(category_id__in=category_ids)
+        category_ids = parse_category_ids(
+            self.request.query_params.get('category', None)
+        )
+        if category_ids:
+            queryset = queryset.filter(category_id__in=category_ids)
         
         return queryset
 
     def get_serializer_class(self):
         """Use lightweight serializer for list view."""
+        # Still describes list output, which ExpenseRowsListMixin renders
         if self.action == 'list':
             return ExpenseListSerializer
+        if self.action == 'bulk':
+            if self.request.method == 'DELETE':
+                return ExpenseBulkDeleteSerializer
+            return ExpenseBulkSerializer
         return ExpenseSerializer
 
+    def get_object(self):
+        expense = super().get_object()
+        # Scoped to the request's user, who is then its owner: saves
+        # loading the user again to serialize it
+        expense.user = self.request.user
+        return expense
+
     def perform_create(self, serializer):
         """Set the user when creating an expense."""
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=['post', 'patch', 'delete'])
+    def bulk(self, request):
+        """
+        Create (POST), update (PATCH) or delete (DELETE) expenses in batch.
+
+        POST and PATCH take a list of expenses (PATCH items need an ``id``),
+        DELETE takes ``{"ids": [...]}``. Each batch runs in one transaction;
+        on failure the errors are returned per item and nothing is written.
+        """
+        if request.method == 'DELETE':
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            bulk_delete_expenses(request.user, serializer.validated_data['ids'])
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        
+        partial = request.method == 'PATCH'
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            partial=partial,
+            max_length=BULK_MAX_ITEMS
+        )
+        serializer.is_valid(raise_exception=True)
+        if partial:
+            expenses = bulk_update_expenses(
+                request.user, serializer.validated_data
+            )
+        else:
+            expenses = bulk_create_expenses(
+                request.user, serializer.validated_data
+            )
+        return Response(
+            ExpenseSerializer(expenses, many=True).data,
+            status=status.HTTP_200_OK if partial else status.HTTP_201_CREATED
+        )
+
+    @action(
+        detail=False,
+        methods=['get'],
+        renderer_classes=[CSVRenderer, NDJSONRenderer]
+    )
+    def export(self, request):
+        """
+        Stream the filtered expenses as CSV (default) or NDJSON.
+
+        Served over ASGI, the rows come from an async generator: Django
+        would read a sync one to the end before sending the first byte.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        asgi = isinstance(request._request, ASGIRequest)
+        if request.accepted_renderer.format == 'ndjson':
+            stream, extension = (
+                astream_ndjson if asgi else stream_ndjson
+            ), 'ndjson'
+        else:
+            stream, extension = (astream_csv if asgi else stream_csv), 'csv'
+        content = stream(queryset)
+
+        response = StreamingHttpResponse(
+            content,
+            content_type=(
+                f'{request.accepted_renderer.media_type}; charset=utf-8'
+            )
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="expenses.{extension}"'
+        )
+        return response
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='import',
+        parser_classes=[MultiPartParser, FormParser]
+    )
+    def import_csv(self, request):
+        """
+        Import expenses from an uploaded CSV file (``file`` field).
+
+        Needs ``date``, ``amount``, ``description`` and ``category``
+        columns; unknown categories are created. Invalid lines are skipped
+        and reported with their line number.
+        """
+        upload = request.FILES.get('file', None)
+        if upload is None:
+            raise ValidationError({'file': ['No file was submitted.']})
+        
+        importer = ExpenseImporter(request.user)
+        try:
+            importer.run(
+                io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+            )
+        except ImportFormatError as exc:
+            raise ValidationError({'file': [str(exc)]})
+        except UnicodeDecodeError:
+            raise ValidationError({'file': ['The file must be UTF-8 encoded.']})
+        
+        return Response({
+            'created': importer.created,
+            'error_count': importer.error_count,
+            'errors': importer.errors,
+        })
+
+    @action(detail=False, methods=['get'])
+    def changes(self, request):
+        """
+        Get expenses created, updated or deleted since a sync token.
+
+        Changes come in pages of ``limit`` expenses (and deletions); while
+        ``has_more`` is true, the returned token fetches the next page of
+        the same sync. The first page also carries the full category list,
+        so category renames and deletions reach clients.
+        """
+        cursor = None
+        token = request.query_params.get('since', None)
+        if token:
+            try:
+                cursor = decode_token(token)
+            except InvalidSyncToken as exc:
+                raise ValidationError({'since': str(exc)})
+            if cursor.since is not None and token_expired(cursor.since):
+                return Response(
+                    {'detail': 'Sync token expired; perform a full sync.'},
+                    status=status.HTTP_410_GONE
+                )
+
+        try:
+            limit = int(request.query_params.get('limit', SYNC_PAGE_SIZE))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= SYNC_MAX_PAGE_SIZE:
+            raise ValidationError({
+                'limit': f'Must be between 1 and {SYNC_MAX_PAGE_SIZE}.'
+            })
+
+        page = changes_since(
+            Expense.objects.filter(user=request.user).select_related('category'),
+            request.user,
+            cursor,
+            limit
+        )
+        for expense in page.changed:
+            expense.user = request.user
+        categories = None
+        if page.first:
+            snapshot = get_category_catalog().snapshot()
+            if snapshot is not None:
+                categories = snapshot.serialized
+            else:
+                categories = ExpenseCategorySerializer(
+                    ExpenseCategory.objects.order_by('name'), many=True
+                ).data
+        return Response({
+            'changed': self.get_serializer(page.changed, many=True).data,
+            'deleted': page.deleted,
+            'categories': categories,
+            'token': page.token,
+            'has_more': page.has_more,
+            'full_sync': cursor is None or cursor.since is None,
+        })
+
+
+class BudgetViewSet(viewsets.ModelViewSet):
+    """ViewSet for managing per-category budgets."""
+    serializer_class = BudgetSerializer
+    permission_classes = [IsAuthenticated]
+    # A user has a handful of budgets; status polls want them all at once
+    pagination_class = None
+
+    def get_queryset(self):
+        """Return budgets for the authenticated user."""
+        return Budget.objects.filter(
+            user=self.request.user
+        ).select_related('category')
+
+    def perform_create(self, serializer):
+        """Set the user when creating a budget."""
+        serializer.save(user=self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        budgets = refresh_periods(list(self.get_queryset()))
+        return Response(self.get_serializer(budgets, many=True).data)
+
+    @action(detail=False, methods=['get'], url_path='status', url_name='status')
+    def budget_status(self, request):
+        """
+        Get spent and remaining amounts of every budget this period.
+
+        Reads the maintained counters, one row per budget, without
+        summing any expenses.
+        """
+        budgets = refresh_periods(list(self.get_queryset()))
+        return Response(BudgetStatusSerializer(budgets, many=True).data)
+
 
-class ReportViewSet(viewsets.ViewSet):
+class ReportViewSet(AsyncViewSetMixin, viewsets.ViewSet):
     """ViewSet for expense reports."""
     permission_classes = [IsAuthenticated]
+    async_actions = ('summary',)
+
+    def report_etag(self, request):
+        """ETag derived from the user's report cache data versions."""
+        return make_etag(request, *get_report_cache().versions(request.user.pk))
 
     @action(detail=False, methods=['get'])
     def summary(self, request):
         """Get summary report with filters."""
-        queryset = Expense.objects.filter(user=request.user)
-        
-        # Apply filters
-        category = request.query_params.get('category', None)
-        date_from = request.query_params.get('date_from', None)
-        date_to = request.query_params.get('date_to', None)
-        description = request.query_params.get('description', None)
+        etag = self.report_etag(request)
+        not_modified = conditional_response(request, etag)
+        if not_modified is not None:
+            return not_modified
         
-        # Support multiple categories (comma-separated IDs)
-        if category:
-            category_ids = []
-            for cid in category.split(','):
-                cid = cid.strip()
-                if cid:
-                    try:
-                        category_ids.append(int(cid))
-                    except ValueError:
-                        # Skip invalid category IDs
-                        continue
-            if category_ids:
-                queryset = queryset.filter(category_id__in=category_ids)
-        if date_from:
-            queryset = queryset.filter(date__gte=date_from)
-        if date_to:
-            queryset = queryset.filter(date__lte=date_to)
-        if description:
-            queryset = queryset.filter(
-                description__icontains=description
-            )
-        
-        # Calculate totals
-        total_amount = queryset.aggregate(
-            total=Sum('amount')
-        )['total'] or 0
+        data = self.summary_data(request.user, request.query_params)
+        return set_validators(Response(data), etag)
+
+    async def asummary(self, request):
+        etag = make_etag(
+            request, *await get_report_cache().aversions(request.user.pk)
+        )
+        not_modified = conditional_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        summary = await get_report_cache().aget_or_compute(
+            request.user.pk,
+            'summary',
+            normalize_filters(request.query_params),
+            lambda: abuild_summary(request.user, request.query_params)
+        )
+        data = self.summary_payload(summary, request.query_params)
+        return set_validators(Response(data), etag)
+
+    def summary_data(self, user, params):
+        summary = get_report_cache().get_or_compute(
+            user.pk,
+            'summary',
+            normalize_filters(params),
+            lambda: build_summary(user, params)
+        )
+        return self.summary_payload(summary, params)
+
+    def summary_payload(self, summary, params):
+        total_amount = summary['total_amount']
         
-        # Group by category
-        category_totals = queryset.values('category__name', 'category__id').annotate(
-            total=Sum('amount'),
-            count=Count('id')
-        ).order_by('-total')
+        category = params.get('category', None)
+        date_from = params.get('date_from', None)
+        date_to = params.get('date_to', None)
+        description = params.get('description', None)
         
         # Date range stats
         if date_from and date_to:
@@ -134,10 +498,10 @@ class ReportViewSet(viewsets.ViewSet):
         else:
             avg_daily = None
         
-        return Response({
+        return {
             'total_amount': float(total_amount),
-            'total_count': queryset.count(),
-            'category_totals': list(category_totals),
+            'total_count': summary['total_count'],
+            'category_totals': summary['category_totals'],
             'average_daily': float(avg_daily) if avg_daily else None,
             'filters': {
                 'category': category,
@@ -145,4 +509,123 @@ class ReportViewSet(viewsets.ViewSet):
                 'date_to': date_to,
                 'description': description,
             },
-        })
+        }
+
+    @action(detail=False, methods=['get'])
+    def timeseries(self, request):
+        """Get expense totals bucketed by day, week or month and category."""
+        parse_granularity(request.query_params)
+        
+        etag = self.report_etag(request)
+        not_modified = conditional_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        
+        data = self.timeseries_data(request.user, request.query_params)
+        return set_validators(Response(data), etag)
+
+    def timeseries_data(self, user, params):
+        granularity = parse_granularity(params)
+        timeseries = get_report_cache().get_or_compute(
+            user.pk,
+            f'timeseries:{granularity}',
+            normalize_filters(params),
+            lambda: build_timeseries(user, params, granularity)
+        )
+        data = dict(timeseries)
+        data['filters'] = {
+            'category': params.get('category', None),
+            'date_from': params.get('date_from', None),
+            'date_to': params.get('date_to', None),
+            'description': params.get('description', None),
+        }
+        return data
+
+    @action(detail=False, methods=['get'])
+    def forecast(self, request):
+        """
+        Forecast spending per category for the next days or weeks.
+
+        Fitted on the daily totals of the last ``history`` days (through
+        yesterday); the fit is cached until the user's data changes.
+        """
+        parse_forecast_params(request.query_params)
+        end = timezone.localdate() - timedelta(days=1)
+
+        etag = make_etag(
+            request, *get_report_cache().versions(request.user.pk), end
+        )
+        not_modified = conditional_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        data = self.forecast_data(request.user, request.query_params, end)
+        return set_validators(Response(data), etag)
+
+    def forecast_data(self, user, params, end):
+        options = parse_forecast_params(params)
+        start = end - timedelta(days=options['history'] - 1)
+        fit = get_report_cache().get_or_compute(
+            user.pk,
+            'forecast',
+            (options['category_ids'], start, end),
+            lambda: fit_forecast(user, start, end, options['category_ids'])
+        )
+        data = build_forecast(
+            fit, options['horizon'], options['granularity'], options['model']
+        )
+        data['filters'] = {
+            'category': params.get('category', None),
+            'model': options['model'],
+        }
+        return data
+
+    @action(detail=False, methods=['post'])
+    def batch(self, request):
+        """
+        Compute several reports in one request, concurrently.
+
+        Takes ``{"reports": [{"type": "summary", ...}, ...]}``: each item
+        has a ``type`` (``summary``, ``timeseries`` or ``forecast``) plus
+        that endpoint's query parameters. Returns the reports in the same
+        order under ``results``, so the slowest one sets the response time.
+        """
+        serializer = ReportBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user = request.user
+        end = timezone.localdate() - timedelta(days=1)
+        builders = {
+            'summary': lambda params: self.summary_data(user, params),
+            'timeseries': lambda params: self.timeseries_data(user, params),
+            'forecast': lambda params: self.forecast_data(user, params, end),
+        }
+        results = get_query_executor().map([
+            partial(builders[report['type']], report['params'])
+            for report in serializer.validated_data['reports']
+        ])
+        return Response({'results': results})
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='cache-stats',
+        permission_classes=[IsAdminUser]
+    )
+    def cache_stats(self, request):
+        """Get this worker's report cache hit/miss counters (staff only)."""
+        return Response(get_report_cache().stats())
+
+
+class MetricsView(APIView):
+    """
+    Per-view request metrics of this worker (staff only).
+
+    Prometheus text by default, ``?format=json`` for the same histograms
+    as JSON.
+    """
+    permission_classes = [IsAdminUser]
+    renderer_classes = [PrometheusRenderer, FastJSONRenderer]
+
+    def get(self, request):
+        return Response(metrics_registry.snapshot())
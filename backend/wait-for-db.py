@@ -2,8 +2,8 @@
 import os
 import sys
 import time
-import psycopg2
-from psycopg2 import OperationalError
+import psycopg
+from psycopg import OperationalError
 
 def wait_for_db(max_attempts=30):
     db_config = {
@@ -11,14 +11,14 @@ def wait_for_db(max_attempts=30):
         'port': os.getenv('DB_PORT', '5432'),
         'user': os.getenv('POSTGRES_USER', 'postgres'),
         'password': os.getenv('POSTGRES_PASSWORD', 'postgres'),
-        'database': os.getenv('POSTGRES_DATABASE', 'expense_checker'),
+        'dbname': os.getenv('POSTGRES_DATABASE', 'expense_checker'),
     }
     
     print(f"Waiting for PostgreSQL at {db_config['host']}...", file=sys.stderr)
     
     for attempt in range(1, max_attempts + 1):
         try:
-            conn = psycopg2.connect(**db_config)
+            conn = psycopg.connect(**db_config)
             conn.close()
             print("PostgreSQL is up!", file=sys.stderr)
             return True
@@ -86,6 +86,34 @@ interface ExpenseCategory {
   updated_at: string;
 }
 
+type BudgetPeriod = 'week' | 'month' | 'year';
+
+interface Budget {
+  id: number;
+  category_id: number;
+  category_name: string;
+  period: BudgetPeriod;
+  amount: string;
+  spent: string;
+  remaining: string;
+  // Current period, end exclusive
+  period_start: string;
+  period_end: string;
+  created_at: string;
+  updated_at: string;
+}
+
+interface BudgetStatus extends Budget {
+  percent_used: number;
+  days_left: number;
+}
+
+interface BudgetInput {
+  category_id: number;
+  amount: string;
+  period?: BudgetPeriod;
+}
+
 interface ExpenseFilters {
   category?: number | string; // Can be single ID or comma-separated IDs
   date_from?: string;
@@ -111,6 +139,59 @@ interface ReportSummary {
   };
 }
 
+interface ExpenseChanges {
+  changed: Expense[];
+  deleted: number[];
+  // Pass back as `since` on the next sync
+  token: string;
+  full_sync: boolean;
+}
+
+type ReportGranularity = 'day' | 'week' | 'month';
+
+interface ReportTimeseries {
+  granularity: ReportGranularity;
+  // Column arrays aligned by index: one entry per (bucket, category)
+  columns: {
+    bucket: string[];
+    category_id: number[];
+    total: number[];
+    count: number[];
+  };
+  categories: Record<string, string>;
+  filters: ReportSummary['filters'];
+}
+
+interface ForecastBand {
+  forecast: number[];
+  lower: number[];
+  upper: number[];
+}
+
+interface ReportForecastParams {
+  horizon?: number;
+  granularity?: 'day' | 'week';
+  history?: number;
+  model?: 'auto' | 'linear' | 'smoothing';
+  category?: string;
+}
+
+interface ReportForecast {
+  granularity: 'day' | 'week';
+  horizon: number;
+  confidence: number;
+  history: { date_from: string; date_to: string };
+  // Start date of each forecast period; band arrays are aligned with it
+  periods: string[];
+  categories: (ForecastBand & {
+    category__id: number;
+    category__name: string;
+    model: 'linear' | 'smoothing';
+  })[];
+  total: ForecastBand;
+  filters: { category: string | null; model: string };
+}
+
 class ApiService {
   private client: AxiosInstance;
   private isRefreshing = false;
@@ -118,6 +199,8 @@ class ApiService {
     resolve: (value?: unknown) => void;
     reject: (reason?: unknown) => void;
   }> = [];
+  // Last response per URL + params, revalidated with If-None-Match
+  private etagCache = new Map<string, { etag: string; data: unknown }>();
 
   constructor() {
     this.client = axios.create({
@@ -226,18 +309,47 @@ class ApiService {
   async logout(): Promise<void> {
     await storage.removeItem('access_token');
     await storage.removeItem('refresh_token');
+    this.etagCache.clear();
   }
 
-  async getExpenses(filters?: ExpenseFilters): Promise<Expense[]> {
-    const response = await this.client.get<Expense[] | { results: Expense[] }>('/expenses/', {
-      params: filters,
+  private async getWithEtag<T>(url: string, params?: object): Promise<T> {
+    const key = `${url}?${JSON.stringify(params ?? {})}`;
+    const cached = this.etagCache.get(key);
+    const response = await this.client.get<T>(url, {
+      params,
+      headers: cached ? { 'If-None-Match': cached.etag } : undefined,
+      validateStatus: (status) =>
+        (status >= 200 && status < 300) || (status === 304 && !!cached),
     });
+    if (response.status === 304 && cached) {
+      return cached.data as T;
+    }
+    const etag = response.headers['etag'];
+    if (etag) {
+      this.etagCache.set(key, { etag, data: response.data });
+    }
+    return response.data;
+  }
+
+  async getExpenses(filters?: ExpenseFilters): Promise<Expense[]> {
+    const data = await this.getWithEtag<Expense[] | { results: Expense[] }>(
+      '/expenses/',
+      filters
+    );
     // Handle paginated response
-    if (Array.isArray(response.data)) {
-      return response.data;
+    if (Array.isArray(data)) {
+      return data;
     }
     // If paginated, return results array
-    return (response.data as any).results || [];
+    return (data as any).results || [];
+  }
+
+  // Throws with status 410 when the token is too old; sync again without it
+  async getExpenseChanges(since?: string): Promise<ExpenseChanges> {
+    const response = await this.client.get<ExpenseChanges>('/expenses/changes/', {
+      params: since ? { since } : undefined,
+    });
+    return response.data;
   }
 
   async getExpense(id: number): Promise<Expense> {
@@ -260,13 +372,15 @@ class ApiService {
   }
 
   async getCategories(): Promise<ExpenseCategory[]> {
-    const response = await this.client.get<ExpenseCategory[] | { results: ExpenseCategory[] }>('/categories/');
+    const data = await this.getWithEtag<
+      ExpenseCategory[] | { results: ExpenseCategory[] }
+    >('/categories/');
     // Handle paginated response
-    if (Array.isArray(response.data)) {
-      return response.data;
+    if (Array.isArray(data)) {
+      return data;
     }
     // If paginated, return results array
-    return (response.data as any).results || [];
+    return (data as any).results || [];
   }
 
   async getCategory(id: number): Promise<ExpenseCategory> {
@@ -294,13 +408,65 @@ class ApiService {
     await this.client.delete(`/categories/${id}/`);
   }
 
+  async getBudgets(): Promise<Budget[]> {
+    const response = await this.client.get<Budget[]>('/budgets/');
+    return response.data;
+  }
+
+  async getBudgetStatus(): Promise<BudgetStatus[]> {
+    const response = await this.client.get<BudgetStatus[]>('/budgets/status/');
+    return response.data;
+  }
+
+  async createBudget(data: BudgetInput): Promise<Budget> {
+    const response = await this.client.post<Budget>('/budgets/', data);
+    return response.data;
+  }
+
+  async updateBudget(id: number, data: Partial<BudgetInput>): Promise<Budget> {
+    const response = await this.client.patch<Budget>(`/budgets/${id}/`, data);
+    return response.data;
+  }
+
+  async deleteBudget(id: number): Promise<void> {
+    await this.client.delete(`/budgets/${id}/`);
+  }
+
   async getReports(filters?: ExpenseFilters): Promise<ReportSummary> {
-    const response = await this.client.get<ReportSummary>('/reports/summary/', {
-      params: filters,
+    return this.getWithEtag<ReportSummary>('/reports/summary/', filters);
+  }
+
+  async getReportTimeseries(
+    granularity: ReportGranularity,
+    filters?: ExpenseFilters
+  ): Promise<ReportTimeseries> {
+    const response = await this.client.get<ReportTimeseries>('/reports/timeseries/', {
+      params: { ...filters, granularity },
+    });
+    return response.data;
+  }
+
+  async getReportForecast(params?: ReportForecastParams): Promise<ReportForecast> {
+    const response = await this.client.get<ReportForecast>('/reports/forecast/', {
+      params,
     });
     return response.data;
   }
 }
 
 export const apiService = new ApiService();
-export type { Expense, ExpenseCategory, ExpenseFilters, ReportSummary };
+export type {
+  Budget,
+  BudgetInput,
+  BudgetPeriod,
+  BudgetStatus,
+  Expense,
+  ExpenseCategory,
+  ExpenseChanges,
+  ExpenseFilters,
+  ReportSummary,
+  ReportForecast,
+  ReportForecastParams,
+  ReportGranularity,
+  ReportTimeseries,
+};